@@ -0,0 +1,87 @@
+"""
+docx_reader_benchmark.py
+
+Compares the streaming DOCX reader (`markup_readers.docx_to_text`) with the
+previous python-docx based reader on synthetic, template-heavy documents
+(headers, footers, layout tables and bulleted sections).
+
+Reports wall-clock time and peak traced memory for each reader.
+
+Usage:
+    python -m benchmarks.docx_reader_benchmark --files 20 --sections 30
+
+Requires python-docx (see requirements-dev.txt) to build the documents.
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from docx import Document
+
+from resume_parser.utils.markup_readers import docx_to_text
+
+
+def build_template_docx(path: Path, sections: int) -> None:
+    """Write a resume-like DOCX that relies on tables, headers and footers."""
+    document = Document()
+    section = document.sections[0]
+    section.header.paragraphs[0].text = "Hermione Granger | hermione@hogwarts.com"
+    section.footer.paragraphs[0].text = "linkedin.com/in/hgranger | github.com/hgranger"
+
+    for i in range(sections):
+        document.add_heading(f"Role {i}", level=2)
+        table = document.add_table(rows=3, cols=4)
+        for row in table.rows:
+            for j, cell in enumerate(row.cells):
+                cell.text = f"Company {i} | Skill {j} | Python, SQL, AWS"
+        for j in range(5):
+            document.add_paragraph(
+                f"Delivered project {i}.{j} with Machine Learning and Kubernetes",
+                style="List Bullet",
+            )
+    document.save(str(path))
+
+
+def python_docx_reader(path: str) -> str:
+    """The previous reader: paragraphs of the python-docx object model only."""
+    doc = Document(path)
+    return "\n".join(para.text for para in doc.paragraphs if para.text.strip())
+
+
+def measure(reader: Callable[[str], str], paths: List[str]) -> Tuple[float, int, int]:
+    """Return (seconds, peak traced bytes, characters extracted) for `reader`."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    chars = sum(len(reader(p)) for p in paths)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, chars
+
+
+def main() -> None:
+    """Build the corpus, run both readers and print a comparison."""
+    parser = argparse.ArgumentParser(description="DOCX reader benchmark")
+    parser.add_argument("--files", type=int, default=20, help="Number of documents")
+    parser.add_argument("--sections", type=int, default=30, help="Roles per document")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(args.files):
+            path = Path(tmp) / f"resume_{i}.docx"
+            build_template_docx(path, args.sections)
+            paths.append(str(path))
+
+        print(f"{'reader':<12}{'seconds':>10}{'peak MiB':>12}{'chars':>12}")
+        for name, reader in [("python-docx", python_docx_reader), ("streaming", docx_to_text)]:
+            elapsed, peak, chars = measure(reader, paths)
+            print(f"{name:<12}{elapsed:>10.3f}{peak / 2**20:>12.2f}{chars:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+fuzzy_matcher_benchmark.py
+
+Measures what fuzzy skill matching costs and what it finds, against the
+exact `SkillMatcher`, on a synthetic corpus.
+
+Each synthetic resume is filler prose with skill names from the dataset
+mixed in; a share of those names is damaged the way real resumes damage
+them (a dropped, doubled or swapped letter, or a word split in two). For
+each vocabulary size (the dataset is padded with random made-up skills) the
+benchmark reports per-resume time for both matchers, the overhead factor,
+how many damaged names each one recovered and how many skills the fuzzy
+matcher reported that were never planted.
+
+Usage:
+    python -m benchmarks.fuzzy_matcher_benchmark --resumes 200 --sizes 444 4000 20000
+"""
+
+import argparse
+import copy
+import random
+import string
+import time
+from typing import Any, Dict, List, Set, Tuple
+
+from resume_parser.utils.fuzzy_matcher import FuzzySkillMatcher
+from resume_parser.utils.skill_matcher import SkillMatcher
+from resume_parser.utils.skills_list_loader import load_skills
+
+FILLER = (
+    "led team delivered projects across multiple regions improved reliability "
+    "reduced costs mentored engineers designed services owned roadmap worked "
+    "closely with product and design to ship features for customers objective "
+    "summary experience education reach panda locker results growth strategy"
+).split()
+
+
+def padded_dataset(size: int, rng: random.Random) -> Dict[str, Any]:
+    """Return the skills dataset padded with random made-up skills to `size` aliases."""
+    data = copy.deepcopy(load_skills())
+    skills = data["ALL_TECHNICAL_SKILLS"]
+    count = sum(1 + len(s.get("aliases", [])) for v in skills.values() for s in v)
+    skills["Synthetic"] = [
+        {"name": "".join(rng.choices(string.ascii_lowercase, k=rng.randint(6, 12)))}
+        for _ in range(max(0, size - count))
+    ]
+    return data
+
+
+def damage(name: str, rng: random.Random) -> str:
+    """Introduce one realistic defect into a skill name."""
+    position = rng.randint(1, len(name) - 2)
+    kind = rng.choice(["drop", "double", "swap", "split"])
+    if kind == "drop":
+        return name[:position] + name[position + 1:]
+    if kind == "double":
+        return name[:position] + name[position] + name[position:]
+    if kind == "swap":
+        return name[:position] + name[position + 1] + name[position] + name[position + 2:]
+    return name[:position] + " " + name[position:]
+
+
+def build_corpus(
+    names: List[str], resumes: int, damaged_share: float, rng: random.Random
+) -> List[Tuple[str, Set[str], Set[str]]]:
+    """Return (text, planted names, damaged names) per synthetic resume."""
+    corpus = []
+    for _ in range(resumes):
+        planted = set(rng.sample(names, 15))
+        damaged = {name for name in planted if rng.random() < damaged_share}
+        words = rng.choices(FILLER, k=400)
+        for name in planted:
+            words.insert(rng.randrange(len(words)), damage(name, rng) if name in damaged else name)
+        corpus.append((" ".join(words), planted, damaged))
+    return corpus
+
+
+def main() -> None:  # pylint: disable=too-many-locals
+    """Time both matchers for each vocabulary size."""
+    parser = argparse.ArgumentParser(description="Fuzzy skill matcher benchmark")
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[444, 4000, 20000])
+    parser.add_argument("--damaged", type=float, default=0.3, help="Share of damaged names")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'aliases':>8}{'exact ms':>10}{'fuzzy ms':>10}{'overhead':>10}"
+          f"{'recovered exact':>17}{'recovered fuzzy':>17}{'unplanted':>11}{'build ms':>10}")
+    for size in args.sizes:
+        rng = random.Random(args.seed)
+        data = padded_dataset(size, rng)
+        exact = SkillMatcher(data)
+        start = time.perf_counter()
+        fuzzy = FuzzySkillMatcher(exact)
+        build = time.perf_counter() - start
+
+        # Plant names the fuzzy matcher is allowed to recover.
+        names = sorted({
+            skill["name"] for skills in data["ALL_TECHNICAL_SKILLS"].values() for skill in skills
+            if skill["name"].isalpha() and len(skill["name"]) >= fuzzy.min_length
+        })
+        corpus = build_corpus(names, args.resumes, args.damaged, rng)
+
+        start = time.perf_counter()
+        exact_found = [{name for _, name in exact.match(text)} for text, _, _ in corpus]
+        exact_time = (time.perf_counter() - start) / len(corpus)
+        start = time.perf_counter()
+        fuzzy_found = [{name for _, name in fuzzy.match(text)} for text, _, _ in corpus]
+        fuzzy_time = (time.perf_counter() - start) / len(corpus)
+
+        damaged_total = sum(len(damaged) for _, _, damaged in corpus) or 1
+        recovered_exact = sum(len(f & d) for f, (_, _, d) in zip(exact_found, corpus))
+        recovered_fuzzy = sum(len(f & d) for f, (_, _, d) in zip(fuzzy_found, corpus))
+        unplanted = sum(len(f - e - p) for f, e, (_, p, _) in zip(fuzzy_found, exact_found, corpus))
+        print(f"{len(exact.patterns):>8}{exact_time * 1000:>10.2f}{fuzzy_time * 1000:>10.2f}"
+              f"{fuzzy_time / exact_time:>9.1f}x"
+              f"{recovered_exact / damaged_total:>17.1%}{recovered_fuzzy / damaged_total:>17.1%}"
+              f"{unplanted:>11}{build * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
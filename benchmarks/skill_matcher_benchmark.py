@@ -0,0 +1,82 @@
+"""
+skill_matcher_benchmark.py
+
+Compares per-alias regular expressions (the previous `SkillsChecker`
+matching) with the single-pass `SkillMatcher` automaton as the vocabulary
+grows. The dataset is padded with synthetic skills to reach each size.
+
+Usage:
+    python -m benchmarks.skill_matcher_benchmark --sizes 444 2000 8000 --repeat 5
+"""
+
+import argparse
+import copy
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Set, Tuple
+
+from resume_parser.utils.parsed_document import ParsedDocument
+from resume_parser.utils.skill_matcher import SkillMatcher
+from resume_parser.utils.skills_list_loader import load_skills
+
+FAKE_PDF = Path(__file__).parent.parent / "tests" / "data" / "fake_resumes" / "fake_resume.pdf"
+
+
+def padded_dataset(size: int) -> Dict[str, Any]:
+    """Return the skills dataset padded with synthetic skills to `size` aliases."""
+    data = copy.deepcopy(load_skills())
+    skills = data["ALL_TECHNICAL_SKILLS"]
+    count = sum(1 + len(s.get("aliases", [])) for v in skills.values() for s in v)
+    skills["Synthetic"] = [
+        {"name": f"Framework{i}", "aliases": [f"fw{i}.js"]}
+        for i in range(max(0, size - count) // 2)
+    ]
+    return data
+
+
+def regex_match(data: Dict[str, Any], text: str) -> Set[Tuple[str, str]]:
+    """The previous approach: one regular expression per name and alias."""
+    lower = text.lower()
+    found = set()
+    for category, skills in data["ALL_TECHNICAL_SKILLS"].items():
+        for skill in skills:
+            names = [skill["name"], *skill.get("aliases", [])]
+            if any(re.search(rf"\b{re.escape(n.lower())}\b", lower) for n in names):
+                found.add((category, skill["name"]))
+    return found
+
+
+def main() -> None:
+    """Time both matchers for each vocabulary size."""
+    parser = argparse.ArgumentParser(description="Skill matcher benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[444, 2000, 8000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    text = ParsedDocument.from_file(str(FAKE_PDF)).raw_text * 4
+    print(f"{'aliases':>8}{'regex ms':>12}{'automaton ms':>15}{'build ms':>11}")
+    for size in args.sizes:
+        data = padded_dataset(size)
+
+        start = time.perf_counter()
+        matcher = SkillMatcher(data)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            expected = regex_match(data, text)
+        regex = (time.perf_counter() - start) / args.repeat
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            found = matcher.match(text)
+        automaton = (time.perf_counter() - start) / args.repeat
+
+        assert found == expected
+        print(f"{len(matcher.patterns):>8}{regex * 1000:>12.1f}"
+              f"{automaton * 1000:>15.2f}{build * 1000:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
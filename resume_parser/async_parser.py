@@ -0,0 +1,339 @@
+"""
+async_parser.py
+
+Asyncio API for services that parse resumes on an event loop.
+
+CPU-bound work (PDF text extraction, the built-in readers, page
+rasterization and the extractors) runs in an executor, while the external
+tools - Tesseract for scanned pages and pandoc when `use_pandoc` is set -
+run as asyncio subprocesses, so they never block the loop or an executor
+thread. Semaphores bound how many documents, and how many Tesseract
+processes, are in flight at once.
+
+Typical Usage:
+    from resume_parser.async_parser import parse_many, parse_resume
+
+    document = await parse_resume(upload_bytes, file_format="pdf")
+    results = await parse_many(paths, mode="skills", limit=8, ocr_limit=2)
+
+Functions:
+    parse_resume(source, ...) -> ParsedDocument | dict:
+        Reads one resume and optionally runs an analysis mode on it.
+    parse_many(sources, ...) -> list:
+        Parses many resumes concurrently with a bounded number in flight.
+"""
+
+import asyncio
+import dataclasses
+import io
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from resume_parser.batch import analyze_document
+from resume_parser.utils.file_reader import (
+    DEFAULT_OPTIONS,
+    PANDOC_BINARY_FORMATS,
+    PANDOC_FORMATS,
+    ReadReport,
+    ReaderInput,
+    ReaderOptions,
+    ResumeSource,
+    as_reader_input,
+    exceeds_byte_budget,
+    extract_pdf_text_pages,
+    get_reader,
+    has_usable_text,
+    merge_ocr_text,
+    read_pdf_pages,
+    read_resume_pages,
+    resolve_format,
+    select_ocr_pages,
+)
+from resume_parser.utils.parsed_document import ParsedDocument, truncation_metadata
+
+# pdf2image and pytesseract are only needed once a scanned page shows up.
+# pylint: disable=import-outside-toplevel
+
+PANDOC_CMD = "pandoc"
+
+
+def _rasterize_page(source: ReaderInput, page_number: int, dpi: int) -> bytes:
+    """Render one (1-based) PDF page to PNG bytes (runs in the executor)."""
+    from pdf2image import convert_from_bytes, convert_from_path
+
+    convert = convert_from_path if isinstance(source, str) else convert_from_bytes
+    images = convert(source, dpi=dpi, first_page=page_number, last_page=page_number)
+    buffer = io.BytesIO()
+    if images:
+        images[0].save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _read_in_worker(reader: Callable[..., List[str]], *args: Any, **kwargs: Any):
+    """
+    Run a page reader with its own ReadReport and return both results.
+
+    Returning the truncation reasons (rather than mutating the caller's
+    report) keeps them intact when the executor is a process pool.
+    """
+    report = ReadReport()
+    pages = reader(*args, report=report, **kwargs)
+    return pages, report.truncated_by
+
+
+async def _run_in_executor(
+    executor: Optional[Executor],
+    report: ReadReport,
+    reader: Callable[..., List[str]],
+    *args: Any,
+    **kwargs: Any,
+) -> List[str]:
+    """Run `reader` in the executor, merging its truncation reasons into `report`."""
+    loop = asyncio.get_running_loop()
+    pages, truncated_by = await loop.run_in_executor(
+        executor, partial(_read_in_worker, reader, *args, **kwargs)
+    )
+    for reason in truncated_by:
+        report.truncate(reason)
+    return pages
+
+
+async def _run_tool(args: List[str], stdin: Optional[bytes] = None) -> str:
+    """
+    Run an external tool as an asyncio subprocess and return its stdout.
+
+    Raises:
+        RuntimeError: If the tool exits with a non-zero status.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await process.communicate(stdin)
+    except asyncio.CancelledError:
+        process.kill()
+        await process.wait()
+        raise
+    if process.returncode != 0:
+        raise RuntimeError(f"{args[0]} failed: {stderr.decode(errors='ignore').strip()}")
+    return stdout.decode("utf-8", errors="ignore")
+
+
+async def _ocr_page(
+    source: ReaderInput,
+    page_number: int,
+    options: ReaderOptions,
+    executor: Optional[Executor],
+    ocr_limit: asyncio.Semaphore,
+) -> str:
+    """Rasterize a page in the executor and OCR it with a Tesseract subprocess."""
+    import pytesseract
+
+    loop = asyncio.get_running_loop()
+    async with ocr_limit:
+        image = await loop.run_in_executor(
+            executor, _rasterize_page, source, page_number, options.ocr_dpi
+        )
+        if not image:
+            return ""
+        return await _run_tool(
+            [pytesseract.pytesseract.tesseract_cmd, "stdin", "stdout"], stdin=image
+        )
+
+
+async def _read_pdf_pages(
+    source: ReaderInput,
+    options: ReaderOptions,
+    report: ReadReport,
+    executor: Optional[Executor],
+    ocr_limit: asyncio.Semaphore,
+) -> List[str]:
+    """Async counterpart of `read_pdf_pages`: text in the executor, OCR via subprocesses."""
+    pages = await _run_in_executor(executor, report, extract_pdf_text_pages, source, options)
+    to_ocr = select_ocr_pages(pages, options, report)
+    if not to_ocr:
+        return pages
+
+    tasks = [
+        asyncio.ensure_future(_ocr_page(source, i + 1, options, executor, ocr_limit))
+        for i in to_ocr
+    ]
+    _, pending = await asyncio.wait(tasks, timeout=options.stage_timeout)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+        report.truncate("timeout:ocr")
+
+    # Pages not OCR'd in time, or whose OCR failed, keep their embedded text;
+    # OCR failures only propagate when no page has usable text.
+    required = not has_usable_text(pages, options)
+    results = []
+    for page_index, task in zip(to_ocr, tasks):
+        if task.cancelled():
+            results.append("")
+        elif task.exception() is not None:
+            if required:
+                raise task.exception()
+            report.ocr_failed(page_index + 1, task.exception())
+            results.append("")
+        else:
+            results.append(task.result())
+    merge_ocr_text(pages, to_ocr, results)
+    return pages
+
+
+async def _read_with_pandoc(source: ReaderInput, ext: str) -> str:
+    """
+    Convert a markup document with a pandoc subprocess, falling back to its raw text.
+
+    Raises:
+        ValueError: If pandoc cannot convert a binary format (.odt), whose
+            bytes are never decoded as text.
+    """
+    if isinstance(source, str):
+        args, stdin = [PANDOC_CMD, source, "-t", "plain"], None
+    else:
+        args, stdin = [PANDOC_CMD, "-f", PANDOC_FORMATS[ext], "-t", "plain"], source
+    try:
+        return (await _run_tool(args, stdin)).strip()
+    except (OSError, RuntimeError) as exc:
+        if ext in PANDOC_BINARY_FORMATS:
+            raise ValueError(f"Pandoc could not convert the {ext} document: {exc}") from exc
+        if isinstance(source, str):
+            with open(source, "r", encoding="utf-8", errors="ignore") as f:
+                return f.read().strip()
+        return source.decode("utf-8", errors="ignore").strip()
+
+
+async def _read_pages(  # pylint: disable=too-many-arguments
+    source: ReaderInput,
+    ext: str,
+    options: ReaderOptions,
+    report: ReadReport,
+    executor: Optional[Executor],
+    ocr_limit: asyncio.Semaphore,
+) -> List[str]:
+    """Read a resolved source, routing external tools through asyncio subprocesses."""
+    reader = get_reader(ext)
+    if exceeds_byte_budget(source, options, report):
+        return []
+    if reader.read is read_pdf_pages:
+        return await _read_pdf_pages(source, options, report, executor, ocr_limit)
+    if reader.pandoc and options.use_pandoc:
+        # pandoc reads .odt from a path only; in-memory ODT, or ODT pandoc
+        # cannot convert, uses the built-in reader.
+        if isinstance(source, str) or ext not in PANDOC_BINARY_FORMATS:
+            try:
+                return [await _read_with_pandoc(source, ext)]
+            except ValueError:
+                pass
+        options = dataclasses.replace(options, use_pandoc=False)
+
+    return await _run_in_executor(
+        executor, report, read_resume_pages, source, options=options, file_format=ext
+    )
+
+
+async def parse_resume(  # pylint: disable=too-many-arguments
+    source: ResumeSource,
+    file_format: Optional[str] = None,
+    options: Optional[ReaderOptions] = None,
+    mode: Optional[str] = None,
+    sub_mode: Optional[str] = None,
+    role: Optional[str] = None,
+    executor: Optional[Executor] = None,
+    ocr_limit: Optional[asyncio.Semaphore] = None,
+) -> Union[ParsedDocument, Dict[str, Any]]:
+    """
+    Read a resume without blocking the event loop, optionally analyzing it.
+
+    Args:
+        source: Path, bytes, memoryview or binary file-like object (a
+            file-like object is read on the calling thread).
+        file_format (str, optional): Declared format of in-memory content.
+        options (ReaderOptions, optional): Reader options and budgets.
+            `pdf_workers` is ignored (treated as 1), so no nested process
+            pools are started: CPU-bound work is spread by `executor` instead.
+        mode (str, optional): "profile" or "skills" to run the extractors
+            (see `batch.analyze_document`); None returns the document only.
+        sub_mode (str, optional): Skills sub-mode ("general", "role", "rank" or "hits").
+        role (str, optional): Role name for role-specific skills.
+        executor (Executor, optional): Where CPU-bound work runs; defaults to
+            the loop's default executor.
+        ocr_limit (asyncio.Semaphore, optional): Bounds concurrent Tesseract
+            processes; defaults to `options.ocr_workers` for this document.
+
+    Returns:
+        ParsedDocument when `mode` is None, otherwise a dict with the
+        document's "metadata" and the analysis "result".
+
+    Raises:
+        ValueError: If the format, mode or role is unsupported.
+    """
+    # Executor threads must not start nested page pools: concurrency comes
+    # from running several documents at once.
+    options = dataclasses.replace(options or DEFAULT_OPTIONS, pdf_workers=1)
+    ocr_limit = ocr_limit or asyncio.Semaphore(max(1, options.ocr_workers))
+    loop = asyncio.get_running_loop()
+
+    source = as_reader_input(source)
+    ext = await loop.run_in_executor(executor, resolve_format, source, file_format)
+    report = ReadReport()
+    pages = await _read_pages(source, ext, options, report, executor, ocr_limit)
+    document = ParsedDocument.from_pages(
+        pages,
+        source=source if isinstance(source, str) else "<memory>",
+        extension=ext,
+        **truncation_metadata(report),
+    )
+    if mode is None:
+        return document
+
+    result = await loop.run_in_executor(
+        executor, partial(analyze_document, document, mode, sub_mode, role)
+    )
+    return {"metadata": document.metadata, "result": result}
+
+
+async def parse_many(  # pylint: disable=too-many-arguments
+    sources: Iterable[ResumeSource],
+    limit: int = 4,
+    ocr_limit: Optional[int] = None,
+    return_exceptions: bool = True,
+    executor: Optional[Executor] = None,
+    **kwargs: Any,
+) -> List[Any]:
+    """
+    Parse many resumes concurrently, at most `limit` at a time.
+
+    Args:
+        sources: Resume paths or in-memory contents.
+        limit (int): Maximum number of documents being parsed at once.
+        ocr_limit (int, optional): Maximum number of Tesseract processes
+            across all documents; defaults to `limit`.
+        return_exceptions (bool): Put a failing document's exception in its
+            result slot instead of raising it (the default, so one bad
+            upload does not fail the whole call).
+        executor (Executor, optional): Where CPU-bound work runs.
+        **kwargs: Passed to `parse_resume` (file_format, options, mode, ...).
+
+    Returns:
+        list: One result per source, in input order.
+    """
+    document_limit = asyncio.Semaphore(limit)
+    shared_ocr_limit = asyncio.Semaphore(ocr_limit or limit)
+
+    async def bounded(source: ResumeSource) -> Any:
+        async with document_limit:
+            return await parse_resume(
+                source, executor=executor, ocr_limit=shared_ocr_limit, **kwargs
+            )
+
+    return await asyncio.gather(
+        *(bounded(source) for source in sources), return_exceptions=return_exceptions
+    )
@@ -0,0 +1,719 @@
+"""
+batch.py
+
+Non-interactive batch mode: parses many resumes over a process pool and
+streams one JSON object per resume (JSON Lines), so large nightly runs pay
+interpreter start-up and skills-dataset loading once per worker rather than
+once per file.
+
+Typical Usage:
+    python -m resume_parser.cli --batch "resumes/**/*.pdf" --mode profile --workers 4 \\
+        --output results.jsonl
+
+Each output line has the form:
+    {"file": "...", "ok": true, "metadata": {...}, "result": {...},
+     "cost": {"estimated": 0.12, "actual": 0.09}}
+or, when a file could not be processed,
+    {"file": "...", "ok": false, "error": "ValueError: Unsupported file type: .xyz", ...}
+
+With a worker pool, documents are dispatched longest-expected first (see
+`estimate_cost`) from a single shared queue that idle workers pull from, so a
+large scanned PDF starts early instead of leaving the pool idle at the end.
+
+If a worker process dies (out of memory, or a crash in a native library),
+the files it left unfinished are retried one at a time in fresh workers, and
+only the file that kills its own worker is recorded as failed.
+
+Identical files (same content under different names) are parsed once; the
+copies get the same result with ``"duplicate_of"`` naming the parsed file.
+With a `BatchManifest`, finished files are checkpointed so an interrupted or
+repeated run only parses new or changed files.
+
+For multi-node runs, ``shard=(index, count)`` keeps a deterministic, disjoint
+slice of the corpus, so every node can be pointed at the same shared
+directory without coordination; `merge_outputs` then combines and validates
+the per-shard JSONL files.
+
+Functions:
+    collect_files(target) -> list[str]:
+        Expands a directory or glob pattern into resume paths.
+    estimate_cost(file_path, options) -> float:
+        Predicts the seconds needed to read a resume.
+    analyze_document(document, mode, sub_mode, role) -> dict:
+        Runs the selected analysis modes on a parsed resume.
+    warm_worker(cache_dir) -> None:
+        Prepares a long-lived worker process before its first task.
+    worker_ready() -> bool:
+        No-op task confirming that a pool worker has started and warmed up.
+    start_warm_pool(workers, cache_dir) -> ProcessPoolExecutor:
+        Starts a process pool whose workers are all warmed up.
+    worker_skills_checker() -> SkillsChecker:
+        The current worker's shared SkillsChecker.
+    process_file(file_path, ...) -> dict:
+        Parses and analyzes one resume, capturing any error in the record.
+    failure_record(file_path, exc, estimated_cost) -> dict:
+        The failure record of a file whose worker process died.
+    parse_shard(spec) -> tuple[int, int]:
+        Parses an "INDEX/COUNT" shard specification.
+    run_batch(target, output, ...) -> tuple[int, int]:
+        Processes every matching resume and writes the JSONL records.
+    merge_outputs(paths, output, expected) -> dict:
+        Combines per-shard JSONL outputs and reports gaps and conflicts.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+from itertools import repeat
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from resume_parser.extractors.contact_extractor import ContactExtractor
+from resume_parser.extractors.education_extractor import EducationExtractor
+from resume_parser.extractors.experience_extractor import ExperienceExtractor
+from resume_parser.extractors.summary_extractor import SummaryExtractor
+from resume_parser.utils.file_reader import (
+    DEFAULT_OPTIONS,
+    READERS,
+    ReaderOptions,
+    get_reader,
+    probe_pdf,
+    read_pdf_pages,
+    resolve_format,
+)
+from resume_parser.utils.batch_manifest import BatchManifest
+from resume_parser.utils.parsed_document import ParsedDocument
+from resume_parser.utils.skills_checker import SkillsChecker
+from resume_parser.utils.text_cache import TextCache, file_digest
+
+# Worker pools are only needed once a batch actually runs.
+# pylint: disable=import-outside-toplevel
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+# Per-process state, built once by `_init_worker` and reused for every file.
+_WORKER: Dict[str, Any] = {}
+
+# Cost model used by `estimate_cost`, in seconds on a typical worker.
+BASE_SECONDS = 0.01
+SECONDS_PER_MIB = 0.05  # scaled by the format's registered cost hint
+PDF_TEXT_PAGE_SECONDS = 0.05
+PDF_OCR_PAGE_SECONDS = 2.0
+
+SCHEDULES = ("cost", "fifo")
+SHARD_KEYS = ("content", "path")
+
+
+def collect_files(target: str) -> List[str]:
+    """
+    Expand a directory or glob pattern into a sorted list of resume files.
+
+    Directories are searched recursively; only files with an extension that
+    has a registered reader are kept.
+
+    Args:
+        target (str): Directory path or glob pattern (``**`` is recursive).
+
+    Returns:
+        list[str]: Matching file paths, sorted.
+    """
+    target = os.path.expanduser(target)
+    if os.path.isdir(target):
+        candidates = glob.glob(os.path.join(target, "**", "*"), recursive=True)
+    else:
+        candidates = glob.glob(target, recursive=True)
+    return sorted(
+        path for path in candidates
+        if os.path.isfile(path) and os.path.splitext(path)[1].lower() in READERS
+    )
+
+
+def estimate_cost(file_path: str, options: Optional[ReaderOptions] = None) -> float:
+    """
+    Predict how long reading a resume will take, without reading all of it.
+
+    For most formats this scales the file size by the format's cost hint. PDF
+    size mostly reflects fonts and images, so PDFs are instead estimated from
+    the page count and a text-vs-scan probe of the first page, capped by the
+    page and OCR budgets in `options`; their size is not used.
+
+    Args:
+        file_path (str): Path to the resume.
+        options (ReaderOptions, optional): Reader options and budgets.
+
+    Returns:
+        float: Estimated seconds; 0.0 for files that cannot be read at all.
+    """
+    options = options or DEFAULT_OPTIONS
+    try:
+        reader = get_reader(resolve_format(file_path))
+        size_mib = os.path.getsize(file_path) / (1024 * 1024)
+    except (OSError, ValueError):
+        return 0.0
+    if reader.read is not read_pdf_pages:
+        return BASE_SECONDS + size_mib * reader.cost * SECONDS_PER_MIB
+
+    try:
+        page_count, scanned = probe_pdf(file_path, options)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return BASE_SECONDS
+    if options.max_pages is not None:
+        page_count = min(page_count, options.max_pages)
+    ocr_pages = page_count if scanned and options.ocr_min_chars > 0 else 0
+    if options.max_ocr_pages is not None:
+        ocr_pages = min(ocr_pages, options.max_ocr_pages)
+    return (
+        BASE_SECONDS
+        + (page_count - ocr_pages) * PDF_TEXT_PAGE_SECONDS
+        + ocr_pages * PDF_OCR_PAGE_SECONDS
+    )
+
+
+def analyze_document(
+    document: ParsedDocument,
+    mode: str,
+    sub_mode: Optional[str] = None,
+    role: Optional[str] = None,
+    skills_checker: Optional[SkillsChecker] = None,
+) -> Dict[str, Any]:
+    """
+    Run the selected analysis modes on a parsed resume.
+
+    Args:
+        document (ParsedDocument): The parsed resume.
+        mode (str): "profile" or "skills".
+        sub_mode (str, optional): For skills mode, "general" (default), "role",
+            "rank" (every role, best fit first) or "hits" (where each skill
+            occurs).
+        role (str, optional): Role name, required when `sub_mode` is "role".
+        skills_checker (SkillsChecker, optional): Reused checker instance.
+
+    Returns:
+        dict: Extractor outputs keyed by section ("summary", "contact",
+        "education", "experience"), the skills table ("skills"), the role
+        ranking ("roles") or the per-skill occurrences ("hits").
+
+    Raises:
+        ValueError: If the mode is unknown or a role is missing/unknown.
+    """
+    if mode == "profile":
+        return {
+            "summary": SummaryExtractor().extract(document),
+            "contact": ContactExtractor().extract(document),
+            "education": EducationExtractor().extract(document),
+            "experience": ExperienceExtractor().extract(document),
+        }
+    if mode != "skills":
+        raise ValueError(f"Unknown mode: {mode}")
+
+    checker = skills_checker or SkillsChecker()
+    if sub_mode == "rank":
+        return {"roles": checker.rank_roles(document)}
+    if sub_mode == "hits":
+        return {"hits": checker.extract_skill_hits(document)}
+    if sub_mode == "role":
+        if role not in checker.load_roles():
+            raise ValueError(f"Unknown role: {role}")
+        return {"role": role, "skills": checker.extract_role_skills(document, role)}
+    return {"skills": checker.extract_general_skills(document)}
+
+
+def _init_worker(cache_dir: Optional[str]) -> None:
+    """Load the skills dataset and open the text cache once per worker."""
+    _WORKER["skills_checker"] = SkillsChecker()
+    _WORKER["cache"] = TextCache(cache_dir) if cache_dir else None
+
+
+def warm_worker(cache_dir: Optional[str] = None) -> None:
+    """
+    Prepare a long-lived worker process before its first task.
+
+    Imports the reader libraries, loads the skills dataset and opens the
+    text cache, so the first resume is as fast as the next ones. Used as
+    the pool initializer by the HTTP server and the folder watcher.
+
+    Args:
+        cache_dir (str, optional): Text cache directory; None disables caching.
+    """
+    import pdfplumber  # pylint: disable=unused-import
+    import mammoth  # pylint: disable=unused-import
+    import pytesseract  # pylint: disable=unused-import
+    import pdf2image  # pylint: disable=unused-import
+    from resume_parser.utils import markup_readers  # pylint: disable=unused-import
+
+    _init_worker(cache_dir)
+
+
+def worker_ready() -> bool:
+    """No-op task used to make sure every worker has started and warmed up."""
+    return bool(_WORKER)
+
+
+def start_warm_pool(workers: int, cache_dir: Optional[str] = None) -> "ProcessPoolExecutor":
+    """
+    Start a process pool and wait until every worker has run `warm_worker`.
+
+    Args:
+        workers (int): Number of worker processes.
+        cache_dir (str, optional): Text cache directory for the workers.
+
+    Returns:
+        ProcessPoolExecutor: The ready pool.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    pool = ProcessPoolExecutor(
+        max_workers=workers, initializer=warm_worker, initargs=(cache_dir,)
+    )
+    for future in [pool.submit(worker_ready) for _ in range(workers)]:
+        future.result()
+    return pool
+
+
+def worker_skills_checker() -> SkillsChecker:
+    """Return this process's SkillsChecker, warming the worker first if needed."""
+    if not _WORKER:
+        warm_worker()
+    return _WORKER["skills_checker"]
+
+
+def process_file(  # pylint: disable=too-many-arguments
+    file_path: str,
+    mode: str,
+    sub_mode: Optional[str] = None,
+    role: Optional[str] = None,
+    options: Optional[ReaderOptions] = None,
+    estimated_cost: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Parse and analyze one resume, never raising.
+
+    Args:
+        file_path (str): Path to the resume.
+        mode (str): "profile" or "skills".
+        sub_mode (str, optional): Skills sub-mode ("general", "role", "rank" or "hits").
+        role (str, optional): Role name for role-specific skills.
+        options (ReaderOptions, optional): Reader options and budgets.
+        estimated_cost (float, optional): Prediction from `estimate_cost`,
+            reported next to the measured time (None when nothing was
+            scheduled, i.e. with a single worker).
+
+    Returns:
+        dict: The JSONL record for this file; failures carry ``"ok": false``
+        and an ``"error"`` message instead of a result. Both include
+        ``"cost": {"estimated": ..., "actual": ...}`` in seconds.
+    """
+    if not _WORKER:
+        _init_worker(None)
+    start = time.perf_counter()
+    try:
+        document = ParsedDocument.from_file(
+            file_path, cache=_WORKER["cache"], options=options
+        )
+        result = analyze_document(
+            document, mode, sub_mode, role, skills_checker=_WORKER["skills_checker"]
+        )
+        record = {"file": file_path, "ok": True, "metadata": document.metadata, "result": result}
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        record = {"file": file_path, "ok": False, "error": f"{type(exc).__name__}: {exc}"}
+    record["cost"] = {
+        "estimated": None if estimated_cost is None else round(estimated_cost, 4),
+        "actual": round(time.perf_counter() - start, 4),
+    }
+    return record
+
+
+def _process_all(  # pylint: disable=too-many-arguments, too-many-locals
+    files: List[str],
+    mode: str,
+    sub_mode: Optional[str],
+    role: Optional[str],
+    options: Optional[ReaderOptions],
+    workers: int,
+    cache_dir: Optional[str],
+    schedule: str,
+) -> Iterator[Dict[str, Any]]:
+    """Yield one record per file, in completion order when using a pool."""
+    if workers <= 1:
+        # A single worker finishes at the same time in any order: keep input
+        # order, and skip the cost probes that only serve scheduling.
+        _init_worker(cache_dir)
+        try:
+            for file_path in files:
+                yield process_file(file_path, mode, sub_mode, role, options)
+        finally:
+            if _WORKER["cache"] is not None:
+                _WORKER["cache"].close()
+            _WORKER.clear()
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from concurrent.futures.process import BrokenProcessPool
+
+    crashed: List[Tuple[str, float]] = []
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(cache_dir,)
+    ) as pool:
+        # Probing is itself spread over the pool.
+        try:
+            costs = list(pool.map(
+                estimate_cost, files, repeat(options),
+                chunksize=max(1, len(files) // (workers * 4)),
+            ))
+        except BrokenProcessPool:
+            costs = []
+        if len(costs) == len(files):
+            jobs = list(zip(files, costs))
+            if schedule == "cost":
+                jobs.sort(key=lambda job: job[1], reverse=True)
+            futures = {
+                pool.submit(process_file, file_path, mode, sub_mode, role, options, cost):
+                (file_path, cost)
+                for file_path, cost in jobs
+            }
+            for future in as_completed(futures):
+                try:
+                    yield future.result()
+                except BrokenProcessPool:
+                    crashed.append(futures[future])
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    file_path, cost = futures[future]
+                    yield failure_record(file_path, exc, cost)
+        else:
+            # A probe killed its worker: parse everything in isolation instead.
+            crashed = [(file_path, 0.0) for file_path in files]
+
+    # A dead worker fails every unfinished file of its pool. Retry those one
+    # at a time, so only a file that kills its own worker is recorded as failed.
+    yield from _retry_isolated(crashed, mode, sub_mode, role, options, cache_dir)
+
+
+def failure_record(
+    file_path: str, exc: BaseException, estimated_cost: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Build the record of a file whose worker failed outside `process_file`
+    (e.g. the worker process died), shaped like its failure records.
+
+    Args:
+        file_path (str): Path to the resume.
+        exc (BaseException): What went wrong.
+        estimated_cost (float, optional): Prediction from `estimate_cost`.
+
+    Returns:
+        dict: A record with ``"ok": false`` and an ``"error"`` message.
+    """
+    return {
+        "file": file_path,
+        "ok": False,
+        "error": f"{type(exc).__name__}: {exc}",
+        "cost": {
+            "estimated": None if estimated_cost is None else round(estimated_cost, 4),
+            "actual": None,
+        },
+    }
+
+
+def _retry_isolated(  # pylint: disable=too-many-arguments
+    jobs: List[Tuple[str, float]],
+    mode: str,
+    sub_mode: Optional[str],
+    role: Optional[str],
+    options: Optional[ReaderOptions],
+    cache_dir: Optional[str],
+) -> Iterator[Dict[str, Any]]:
+    """Parse each file alone in a worker process, replacing the worker if it dies."""
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    pool = None
+    try:
+        for file_path, cost in jobs:
+            if pool is None:
+                pool = ProcessPoolExecutor(
+                    max_workers=1, initializer=_init_worker, initargs=(cache_dir,)
+                )
+            try:
+                yield pool.submit(
+                    process_file, file_path, mode, sub_mode, role, options, cost
+                ).result()
+            except BrokenProcessPool as exc:
+                pool.shutdown()
+                pool = None
+                yield failure_record(file_path, exc, cost)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def _run_config(
+    mode: str,
+    sub_mode: Optional[str],
+    role: Optional[str],
+    options: Optional[ReaderOptions],
+) -> str:
+    """Describe the settings that change a file's record, for the manifest."""
+    options = options or DEFAULT_OPTIONS
+    return json.dumps({
+        "mode": mode,
+        "sub_mode": sub_mode,
+        "role": role,
+        "reader": options.cache_variant,
+        "max_pages": options.max_pages,
+        "max_ocr_pages": options.max_ocr_pages,
+        "max_bytes": options.max_bytes,
+        "stage_timeout": options.stage_timeout,
+    }, sort_keys=True)
+
+
+def _output_location(output: IO[str]) -> str:
+    """Name the stream records are written to (absolute path for files)."""
+    name = getattr(output, "name", None)
+    if isinstance(name, str) and not name.startswith("<"):
+        return os.path.abspath(name)
+    return name or "<stream>"
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """
+    Parse a shard specification such as "2/8" (1-based index).
+
+    Args:
+        spec (str): "INDEX/COUNT".
+
+    Returns:
+        tuple[int, int]: (index, count).
+
+    Raises:
+        ValueError: If the specification is malformed or out of range.
+    """
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard {spec!r}: expected INDEX/COUNT, e.g. 1/4") from None
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard {spec!r}: INDEX must be between 1 and COUNT")
+    return index, count
+
+
+def _shard_root(target: str) -> str:
+    """The directory shard paths are made relative to: the target or the glob's fixed prefix."""
+    target = os.path.expanduser(target)
+    if os.path.isdir(target):
+        return target
+    parts = []
+    for part in target.split(os.sep):
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    return os.sep.join(parts) or os.curdir
+
+
+def _in_shard(key: str, shard: Tuple[int, int]) -> bool:
+    """Assign `key` to a shard with a stable hash (not `hash()`, which is salted per process)."""
+    index, count = shard
+    bucket = int(hashlib.sha256(key.encode("utf-8")).hexdigest()[:16], 16) % count
+    return bucket == index - 1
+
+
+def _fan_out(record: Dict[str, Any], file_path: str) -> Dict[str, Any]:
+    """Copy a record to an identical file, marking which file was actually parsed."""
+    copy = dict(record, file=file_path, cost={"estimated": 0.0, "actual": 0.0})
+    parsed = record.get("duplicate_of", record["file"])
+    if parsed != file_path:
+        copy["duplicate_of"] = parsed
+    if "metadata" in record:
+        copy["metadata"] = dict(record["metadata"], source=file_path)
+    return copy
+
+
+def _select_files(  # pylint: disable=too-many-arguments
+    target: str,
+    config: str,
+    location: str,
+    manifest: Optional[BatchManifest],
+    shard: Optional[Tuple[int, int]],
+    shard_by: str,
+) -> Dict[str, Optional[str]]:
+    """
+    Map each file this run has to write to its content hash (None if unreadable),
+    dropping other shards' files and those the manifest shows as done.
+    """
+    root = _shard_root(target)
+    digests: Dict[str, Optional[str]] = {}
+    for file_path in collect_files(target):
+        relative = os.path.relpath(file_path, root)
+        if shard and shard_by == "path" and not _in_shard(relative, shard):
+            continue
+        try:
+            digest = manifest.digest(file_path) if manifest else file_digest(file_path)
+        except OSError:
+            digest = None  # unreadable: processed on its own so the error is recorded
+        if shard and shard_by == "content" and not _in_shard(digest or relative, shard):
+            continue
+        if manifest and digest and manifest.is_done(file_path, digest, config, location):
+            manifest.skipped += 1
+            continue
+        digests[file_path] = digest
+    return digests
+
+
+def run_batch(  # pylint: disable=too-many-arguments, too-many-locals
+    target: str,
+    output: Optional[IO[str]] = None,
+    mode: str = "profile",
+    sub_mode: Optional[str] = None,
+    role: Optional[str] = None,
+    options: Optional[ReaderOptions] = None,
+    workers: int = 1,
+    cache_dir: Optional[str] = None,
+    schedule: str = "cost",
+    manifest: Optional[BatchManifest] = None,
+    shard: Optional[Tuple[int, int]] = None,
+    shard_by: str = "content",
+) -> Tuple[int, int]:
+    """
+    Process every resume matching `target` and write one JSON line per file.
+
+    Records are flushed as soon as each file finishes, so partial output is
+    usable even if the run is interrupted. Per-file failures are written as
+    error records and do not stop the run. Files with identical content are
+    parsed once and the result is written for each of them.
+
+    With a `manifest`, each record is checkpointed right after it is written
+    (so a crash in between repeats at most that line on resume). Files that
+    the manifest shows as already written to this output with the same
+    content, pipeline version and settings are skipped, and content it has
+    already parsed elsewhere is re-emitted without parsing. Open `output` in
+    append mode to keep the earlier records.
+
+    With `shard`, only the files whose content hash (or path relative to the
+    target directory) falls into that shard are processed. Sharding by
+    content keeps identical files on the same node, so each is still parsed
+    once; sharding by path avoids reading files owned by other shards.
+
+    Args:
+        target (str): Directory or glob pattern (see `collect_files`).
+        output (IO[str], optional): Destination for JSONL; defaults to stdout.
+        mode (str): "profile" or "skills".
+        sub_mode (str, optional): Skills sub-mode ("general", "role", "rank" or "hits").
+        role (str, optional): Role name for role-specific skills.
+        options (ReaderOptions, optional): Reader options and budgets.
+        workers (int): Number of worker processes; 1 runs in-process.
+        cache_dir (str, optional): Shared text cache directory.
+        schedule (str): "cost" dispatches the most expensive documents first;
+            "fifo" keeps path order.
+        manifest (BatchManifest, optional): Checkpoint manifest for resuming.
+        shard (tuple[int, int], optional): (index, count), 1-based; see
+            `parse_shard`.
+        shard_by (str): "content" (default) or "path".
+
+    Returns:
+        tuple[int, int]: Number of records written this run for files that
+        succeeded, and for files that failed (skipped files are not counted).
+
+    Raises:
+        ValueError: If `schedule`, `shard` or `shard_by` is invalid.
+    """
+    if schedule not in SCHEDULES:
+        raise ValueError(f"Unknown schedule: {schedule}")
+    if shard_by not in SHARD_KEYS:
+        raise ValueError(f"Unknown shard key: {shard_by}")
+    if shard is not None:
+        parse_shard(f"{shard[0]}/{shard[1]}")
+    output = output or sys.stdout
+    config = _run_config(mode, sub_mode, role, options)
+    location = _output_location(output)
+    counts = {True: 0, False: 0}
+
+    digests = _select_files(target, config, location, manifest, shard, shard_by)
+    groups: Dict[str, List[str]] = {}
+    for file_path, digest in digests.items():
+        groups.setdefault(digest or file_path, []).append(file_path)
+
+    def emit(record: Dict[str, Any]) -> None:
+        output.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        output.flush()
+        digest = digests[record["file"]]
+        if manifest and digest:
+            manifest.record(record["file"], digest, config, location, record)
+        counts[bool(record["ok"])] += 1
+
+    to_parse: Dict[str, List[str]] = {}
+    for key, paths in groups.items():
+        stored = manifest.find_result(key, config) if manifest else None
+        if stored is not None:
+            manifest.reused += len(paths)
+            for file_path in paths:
+                emit(_fan_out(stored, file_path))
+        else:
+            to_parse[paths[0]] = paths[1:]
+
+    records = _process_all(
+        list(to_parse), mode, sub_mode, role, options, workers, cache_dir, schedule
+    )
+    for record in records:
+        emit(record)
+        for duplicate in to_parse[record["file"]]:
+            emit(_fan_out(record, duplicate))
+    return counts[True], counts[False]
+
+
+def merge_outputs(
+    paths: Iterable[str],
+    output: IO[str],
+    expected: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Combine per-shard JSONL outputs into one file, validating them on the way.
+
+    Records are written sorted by file. A file recorded more than once in the
+    same shard output (e.g. a line repeated after resuming a run) keeps its
+    last record; a file recorded by two different shards is a conflict.
+
+    Args:
+        paths (Iterable[str]): Shard output files.
+        output (IO[str]): Destination for the merged JSONL.
+        expected (str, optional): Directory or glob the shards were run on;
+            files matching it without a record are reported as missing.
+
+    Returns:
+        dict: "records", "failed" (records with ``"ok": false``), "invalid"
+        (unparseable lines, as "path:line"), "conflicts" (files in more than
+        one shard) and "missing" (expected files without a record).
+    """
+    records: Dict[str, Dict[str, Any]] = {}
+    owner: Dict[str, str] = {}
+    invalid: List[str] = []
+    conflicts = set()
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                if not isinstance(record, dict) or "file" not in record or "ok" not in record:
+                    invalid.append(f"{path}:{line_number}")
+                    continue
+                file_path = record["file"]
+                if owner.setdefault(file_path, path) != path:
+                    conflicts.add(file_path)
+                records[file_path] = record
+
+    for file_path in sorted(records):
+        output.write(json.dumps(records[file_path], ensure_ascii=False, default=str) + "\n")
+    output.flush()
+    missing = sorted(set(collect_files(expected)) - set(records)) if expected else []
+    return {
+        "records": len(records),
+        "failed": sum(not record["ok"] for record in records.values()),
+        "invalid": invalid,
+        "conflicts": sorted(conflicts),
+        "missing": missing,
+    }
@@ -3,23 +3,22 @@ CLI for parsing resumes and analyzing skills.
 """
 
 import argparse
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from rich.console import Console
-from rich.text import Text
-from rich.panel import Panel
-from rich.align import Align
-from pyfiglet import Figlet
+from typing import List, Optional
 
 from resume_parser.extractors.summary_extractor import SummaryExtractor
 from resume_parser.extractors.contact_extractor import ContactExtractor
 from resume_parser.extractors.experience_extractor import ExperienceExtractor
 from resume_parser.extractors.education_extractor import EducationExtractor
 from resume_parser.utils.skills_checker import SkillsChecker
-from resume_parser.utils.display import Display
+from resume_parser.utils.file_reader import ReaderOptions
+from resume_parser.utils.parsed_document import ParsedDocument
+from resume_parser.utils.text_cache import TextCache
 
-console = Console()
-display = Display()
+# UI libraries (rich, pyfiglet) are imported on first use so that startup
+# stays cheap for callers that never render to the terminal.
+# pylint: disable=import-outside-toplevel
 
 SUPPORTED_EXTENSIONS = {
     ".pdf", ".docx", ".doc", ".txt", ".rtf", ".odt", ".md", ".html", ".htm"
@@ -29,12 +28,95 @@ def parse_args():
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(description="Resume Parser CLI")
     parser.add_argument("--mode", choices=["profile", "skills"], help="Mode to run")
-    parser.add_argument("--sub-mode", choices=["general", "role"], help="Skills sub-mode")
+    parser.add_argument(
+        "--sub-mode", choices=["general", "role", "rank", "hits"],
+        help="Skills sub-mode (rank: every role, best fit first; hits: where each skill appears)"
+    )
     parser.add_argument("--file", help="Path to resume file")
+    parser.add_argument(
+        "--batch", metavar="DIR_OR_GLOB",
+        help="Process every resume in a directory or glob and write JSON Lines"
+    )
+    parser.add_argument(
+        "--output", default="-",
+        help="JSONL destination for --batch (default: stdout)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Worker processes for --batch (default: 1)"
+    )
+    parser.add_argument("--role", help="Role name for --sub-mode role in --batch")
+    parser.add_argument(
+        "--schedule", choices=["cost", "fifo"], default="cost",
+        help="--batch dispatch order: most expensive first (default) or path order"
+    )
+    parser.add_argument(
+        "--shard", metavar="INDEX/COUNT",
+        help="Process only this deterministic slice of --batch, e.g. 2/4"
+    )
+    parser.add_argument(
+        "--shard-by", choices=["content", "path"], default="content",
+        help="Assign files to shards by content hash (default) or relative path"
+    )
+    parser.add_argument(
+        "--manifest", metavar="PATH",
+        help="Checkpoint file for --batch: skip files already done and append to --output"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for a persistent cache of extracted text (disabled by default)"
+    )
+    parser.add_argument(
+        "--pdf-workers", type=int, default=1,
+        help="Processes used to extract text from long PDFs (default: 1)"
+    )
+    parser.add_argument(
+        "--ocr-workers", type=int, default=1,
+        help="Concurrent Tesseract calls for scanned pages (default: 1)"
+    )
+    parser.add_argument(
+        "--ocr-dpi", type=int, default=200,
+        help="Resolution used to rasterize scanned pages for OCR (default: 200)"
+    )
+    parser.add_argument(
+        "--use-pandoc", action="store_true",
+        help="Convert .md/.html/.rtf/.odt with pandoc instead of the built-in readers"
+    )
+    parser.add_argument(
+        "--max-pages", type=int,
+        help="Read at most this many PDF pages (default: no limit)"
+    )
+    parser.add_argument(
+        "--max-ocr-pages", type=int,
+        help="OCR at most this many scanned pages (default: no limit)"
+    )
+    parser.add_argument(
+        "--max-bytes", type=int,
+        help="Skip files larger than this many bytes (default: no limit)"
+    )
+    parser.add_argument(
+        "--stage-timeout", type=float,
+        help="Seconds allowed for text extraction and for OCR, each (default: no limit)"
+    )
     return parser.parse_args()
 
+@lru_cache(maxsize=None)
+def get_console():
+    """Return the shared rich console, importing rich on first use."""
+    from rich.console import Console
+    return Console()
+
+@lru_cache(maxsize=None)
+def get_display():
+    """Return the shared Display renderer, importing it on first use."""
+    from resume_parser.utils.display import Display
+    return Display()
+
 def prompt(question: str, default: Optional[str] = None) -> Optional[str]:
     """Prompt user for input with optional default."""
+    from rich.text import Text
+
+    console = get_console()
     q_text = Text(question, style="bold cyan")
     if default:
         q_text.append(f" ({default})", style="dim")
@@ -43,16 +125,22 @@ def prompt(question: str, default: Optional[str] = None) -> Optional[str]:
 
 def print_section_title(title: str) -> None:
     """Print a section title in a styled panel."""
+    from rich.panel import Panel
+    from rich.align import Align
+
     panel = Panel(
         Align.center(f"[bold white]{title}[/bold white]", vertical="middle"),
         style="bold blue",
         padding=(0, 2),
         expand=True
     )
-    console.print(panel)
+    get_console().print(panel)
 
-def run_cli(mode_choice: str, sub_mode: Optional[str], file_path: str) -> None: # pylint: disable=too-many-locals
+def run_cli(mode_choice: str, sub_mode: Optional[str], file_path: str, # pylint: disable=too-many-locals, too-many-statements, too-many-branches
+            cache_dir: Optional[str] = None, options: Optional[ReaderOptions] = None) -> None:
     """Run the CLI logic based on mode and file path."""
+    console = get_console()
+    display = get_display()
     file_path_obj = Path(file_path)
     ext = file_path_obj.suffix.lower()
 
@@ -72,21 +160,35 @@ def run_cli(mode_choice: str, sub_mode: Optional[str], file_path: str) -> None:
     edu_ex = EducationExtractor()
     skills_checker = SkillsChecker()
 
+    # Read (and OCR, if needed) the file once and share it across extractors
+    cache = TextCache(cache_dir) if cache_dir else None
+    try:
+        document = ParsedDocument.from_file(file_path, cache=cache, options=options)
+    finally:
+        if cache is not None:
+            cache.close()
+    if document.metadata.get("truncated"):
+        console.print(
+            "[yellow]Warning:[/yellow] Resume was only partly read "
+            f"({', '.join(document.metadata['truncated_by'])} limit reached); "
+            "results may be incomplete."
+        )
+
     if mode_choice == "profile":
         console.clear()
         print_section_title("ATS Profile Check")
 
-        summary_res = summary_ex.extract(file_path)
+        summary_res = summary_ex.extract(document)
         display.display_section_text("Professional Summary", summary_res.get("section", ""))
 
-        contact_res = contact_ex.extract(file_path)
+        contact_res = contact_ex.extract(document)
         display.display_contact(contact_res)
 
         console.print("\n")
         print_section_title("Education & Work Experience Check")
 
-        edu_res = edu_ex.extract(file_path)
-        exp_res = exp_ex.extract(file_path)
+        edu_res = edu_ex.extract(document)
+        exp_res = exp_ex.extract(document)
 
         display.display_education(edu_res, show_gpa=True)
         display.display_experience(exp_res)
@@ -95,7 +197,7 @@ def run_cli(mode_choice: str, sub_mode: Optional[str], file_path: str) -> None:
         if sub_mode == "general":
             console.clear()
             print_section_title("General Skills Review")
-            extracted = skills_checker.extract_general_skills(file_path)
+            extracted = skills_checker.extract_general_skills(document)
             display.display_skills_table(extracted, title="")
 
         elif sub_mode == "role":
@@ -122,11 +224,25 @@ def run_cli(mode_choice: str, sub_mode: Optional[str], file_path: str) -> None:
 
             console.print("\n")
             print_section_title(f"Role-Specific Skills Review: {role_name}")
-            extracted = skills_checker.extract_role_skills(file_path, role_name)
+            extracted = skills_checker.extract_role_skills(document, role_name)
             display.display_skills_table(extracted)
 
+        elif sub_mode == "rank":
+            console.clear()
+            print_section_title("Role Fit Ranking")
+            display.display_role_ranking(skills_checker.rank_roles(document))
+
+        elif sub_mode == "hits":
+            console.clear()
+            print_section_title("Skill Occurrences")
+            display.display_skill_hits(skills_checker.extract_skill_hits(document))
+
 def interactive_cli():
     """Run the interactive CLI mode."""
+    from rich.align import Align
+    from pyfiglet import Figlet
+
+    console = get_console()
     console.clear()
     fig = Figlet(font="standard")
     console.print(Align.center(fig.renderText("Resume Parser")), style="bold green")
@@ -144,10 +260,14 @@ def interactive_cli():
     if mode_choice == "skills":
         console.print("\n[bold cyan]Select skills analysis mode:[/bold cyan]")
         console.print(" [green]g[/green]. General")
-        console.print(" [green]r[/green]. Role-specific\n")
+        console.print(" [green]r[/green]. Role-specific")
+        console.print(" [green]a[/green]. All roles, ranked by fit\n")
         sub_mode_choice = prompt("Enter choice", "g")
         sub_mode_choice = (sub_mode_choice or "g").lower()
-        sub_mode = "general" if sub_mode_choice in {"g", "general"} else "role"
+        if sub_mode_choice in {"a", "all", "rank"}:
+            sub_mode = "rank"
+        else:
+            sub_mode = "general" if sub_mode_choice in {"g", "general"} else "role"
 
     example_resume_path = str(
         Path(__file__).parent.parent
@@ -156,11 +276,111 @@ def interactive_cli():
     file_path = prompt("Enter path to resume file", example_resume_path) or example_resume_path
     run_cli(mode_choice, sub_mode, file_path)
 
+def run_batch_cli(args: argparse.Namespace, options: ReaderOptions) -> int:
+    """Run `--batch` mode and return the process exit code."""
+    import sys
+    import time
+    from resume_parser.batch import parse_shard, run_batch
+    from resume_parser.utils.batch_manifest import BatchManifest
+
+    if args.sub_mode == "role" and not args.role:
+        print("Error: --sub-mode role requires --role in batch mode", file=sys.stderr)
+        return 2
+    try:
+        shard = parse_shard(args.shard) if args.shard else None
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 2
+    # A resumed run keeps the records written before the interruption.
+    output = sys.stdout if args.output == "-" else open(  # pylint: disable=consider-using-with
+        args.output, "a" if args.manifest else "w", encoding="utf-8"
+    )
+    manifest = BatchManifest(args.manifest) if args.manifest else None
+    start = time.perf_counter()
+    try:
+        succeeded, failed = run_batch(
+            args.batch, output, mode=args.mode or "profile", sub_mode=args.sub_mode,
+            role=args.role, options=options, workers=args.workers, cache_dir=args.cache_dir,
+            schedule=args.schedule, manifest=manifest, shard=shard, shard_by=args.shard_by,
+        )
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        if manifest is not None:
+            manifest.close()
+    skipped = f", {manifest.skipped} already done" if manifest else ""
+    print(f"Processed {succeeded + failed} resumes ({failed} failed{skipped}) "
+          f"in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    # An empty shard, or a run where everything was already done, is not an error.
+    return 0 if succeeded + failed or shard or (manifest and manifest.skipped) else 1
+
+def merge_cli(argv: List[str]) -> int:
+    """Run `resume_parser merge` and return the process exit code."""
+    import sys
+    from resume_parser.batch import merge_outputs
+
+    parser = argparse.ArgumentParser(
+        prog="resume_parser merge", description="Merge and validate --shard outputs"
+    )
+    parser.add_argument("inputs", nargs="+", help="Shard JSONL files")
+    parser.add_argument("--output", default="-", help="Merged JSONL (default: stdout)")
+    parser.add_argument(
+        "--expect", metavar="DIR_OR_GLOB",
+        help="The --batch target; report files that have no record"
+    )
+    args = parser.parse_args(argv)
+
+    output = sys.stdout if args.output == "-" else open(  # pylint: disable=consider-using-with
+        args.output, "w", encoding="utf-8"
+    )
+    try:
+        summary = merge_outputs(args.inputs, output, expected=args.expect)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    print(f"Merged {summary['records']} records ({summary['failed']} failed) "
+          f"from {len(args.inputs)} shards", file=sys.stderr)
+    for problem in ("invalid", "conflicts", "missing"):
+        for item in summary[problem]:
+            print(f"{problem}: {item}", file=sys.stderr)
+    return 1 if summary["invalid"] or summary["conflicts"] or summary["missing"] else 0
+
 def main():
     """Main entry point for CLI."""
+    import sys
+    if sys.argv[1:2] == ["serve"]:
+        from resume_parser.server import main as serve
+        serve(sys.argv[2:])
+        return
+    if sys.argv[1:2] == ["merge"]:
+        raise SystemExit(merge_cli(sys.argv[2:]))
+    if sys.argv[1:2] == ["score"]:
+        from resume_parser.scoring import main as score
+        score(sys.argv[2:])
+        return
+    if sys.argv[1:2] == ["index"]:
+        from resume_parser.search_index import main as index
+        index(sys.argv[2:])
+        return
+    if sys.argv[1:2] == ["watch"]:
+        from resume_parser.watcher import main as watch
+        watch(sys.argv[2:])
+        return
     args = parse_args()
+    options = ReaderOptions(
+        pdf_workers=args.pdf_workers,
+        ocr_workers=args.ocr_workers,
+        ocr_dpi=args.ocr_dpi,
+        use_pandoc=args.use_pandoc,
+        max_pages=args.max_pages,
+        max_ocr_pages=args.max_ocr_pages,
+        max_bytes=args.max_bytes,
+        stage_timeout=args.stage_timeout,
+    )
+    if args.batch:
+        raise SystemExit(run_batch_cli(args, options))
     if args.mode and args.file:
-        run_cli(args.mode, args.sub_mode, args.file)
+        run_cli(args.mode, args.sub_mode, args.file, cache_dir=args.cache_dir, options=options)
     else:
         interactive_cli()
 
@@ -210,3 +210,34 @@ SUMMARY_END = [
     r"skills",
     r"education",
 ]
+
+# --------------------------
+# Skills patterns
+# --------------------------
+SKILLS_START = [
+    r"(?:technical\s+|core\s+|key\s+)?skills(?:\s+summary)?",
+    r"core\s+competencies",
+    r"technologies",
+    r"tech(?:nical)?\s+stack",
+]
+
+# --------------------------
+# Section headers (own-line), in lookup order: section -> keywords.
+# "other" headers only close the preceding section.
+# --------------------------
+SECTION_HEADERS = {
+    "summary": SUMMARY_START,
+    "experience": EXP_START,
+    "education": EDU_START,
+    "skills": SKILLS_START,
+    "other": [
+        r"certifications?",
+        r"projects?",
+        r"publications",
+        r"awards",
+        r"languages",
+        r"interests",
+        r"references",
+        r"additional\s+information",
+    ],
+}
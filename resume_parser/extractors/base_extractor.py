@@ -5,6 +5,20 @@ that all resume data extractors should implement.
 """
 
 from abc import ABC, abstractmethod
+from typing import Optional, Union
+from resume_parser.utils.file_reader import (
+    ReadReport,
+    ReaderOptions,
+    ResumeSource,
+    as_reader_input,
+    iter_resume_pages,
+    resolve_format,
+)
+from resume_parser.utils.parsed_document import (
+    ParsedDocument,
+    load_document,
+    truncation_metadata,
+)
 from resume_parser.utils.text_normalizer import normalize_whitespace
 
 class BaseExtractor(ABC):
@@ -12,8 +26,17 @@ class BaseExtractor(ABC):
     Abstract base class for all resume data extractors.
     Each extractor handles parsing a specific type of resume section
     (e.g., experience, education, contact info).
+
+    Attributes:
+        max_pages (int | None): How many leading pages the extractor usually
+            needs. When set and `extract` is given a file, only that many
+            pages are read first; the rest are read only if `is_complete`
+            reports that the result is still missing something.
+            None (the default) always reads the whole document.
     """
 
+    max_pages: Optional[int] = None
+
     def normalize(self, text: str) -> str:
         """
         Normalize whitespace in the given text.
@@ -26,13 +49,77 @@ class BaseExtractor(ABC):
         """
         return normalize_whitespace(text or "")
 
+    def extract(
+        self,
+        source: Union[ResumeSource, ParsedDocument],
+        file_format: Optional[str] = None,
+        options: Optional[ReaderOptions] = None,
+    ) -> dict:
+        """
+        Extract structured data from a resume file or an already parsed document.
+
+        Passing a ParsedDocument lets several extractors share a single read
+        of the file; passing a path (or in-memory content) reads it for this
+        call only, stopping after `max_pages` pages when the result is
+        already complete.
+
+        Args:
+            source (str | bytes | IO | ParsedDocument): Path to the resume
+                file, its content in memory, or a document produced by
+                `ParsedDocument.from_source`.
+            file_format (str, optional): Format of in-memory content, e.g.
+                "pdf"; sniffed from the content when omitted.
+            options (ReaderOptions, optional): Reader options, including the
+                budgets that bound how much of the file is read.
+
+        Returns:
+            dict: Extracted structured data (format depends on subclass).
+        """
+        if self.max_pages is None or isinstance(source, ParsedDocument):
+            return self.extract_document(
+                load_document(source, options=options, file_format=file_format)
+            )
+
+        source = as_reader_input(source)
+        file_format = resolve_format(source, file_format)
+        label = source if isinstance(source, str) else "<memory>"
+        report = ReadReport()
+        pages_iter = iter_resume_pages(
+            source, options=options, file_format=file_format, report=report
+        )
+        try:
+            pages = [page for _, page in zip(range(self.max_pages), pages_iter)]
+            result = self.extract_document(ParsedDocument.from_pages(
+                pages, source=label, partial=True, **truncation_metadata(report)
+            ))
+            if self.is_complete(result):
+                return result
+            pages.extend(pages_iter)
+        finally:
+            pages_iter.close()
+        return self.extract_document(
+            ParsedDocument.from_pages(pages, source=label, **truncation_metadata(report))
+        )
+
+    def is_complete(self, result: dict) -> bool:  # pylint: disable=unused-argument
+        """
+        Decide whether a result taken from the first `max_pages` pages is final.
+
+        Args:
+            result (dict): Output of `extract_document` on the leading pages.
+
+        Returns:
+            bool: True to stop reading; False to read the remaining pages.
+        """
+        return True
+
     @abstractmethod
-    def extract(self, file_path: str) -> dict:
+    def extract_document(self, document: ParsedDocument) -> dict:
         """
-        Abstract method to extract structured data from a resume file.
+        Abstract method to extract structured data from a parsed resume.
 
         Args:
-            file_path (str): Path to the resume file.
+            document (ParsedDocument): The parsed resume.
 
         Returns:
             dict: Extracted structured data (format depends on subclass).
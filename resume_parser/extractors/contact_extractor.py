@@ -7,7 +7,7 @@ and online profiles (LinkedIn, GitHub, etc.).
 
 import re
 from resume_parser.extractors.base_extractor import BaseExtractor
-from resume_parser.utils.file_reader import read_resume
+from resume_parser.utils.parsed_document import ParsedDocument
 from resume_parser.utils.regex_helpers import find_first, find_additional_urls
 from resume_parser.config.patterns import (
     NAME_PATTERN, EMAIL_PATTERN, PHONE_PATTERN,
@@ -29,21 +29,37 @@ class ContactExtractor(BaseExtractor):
     Data is extracted by matching text against predefined regex patterns
     from `config.patterns`.
 
+    Contact details almost always sit on the first page, so when given a file
+    path page one is read first; later pages are read only if any field -
+    including the LinkedIn, GitHub and other URLs - is still missing there.
+    A path and a ParsedDocument of the same resume give the same result
+    unless page one already has every field and later pages add more URLs.
+
     Methods
     -------
-    extract(file_path: str) -> dict
-        Reads the resume file, normalizes its text, and extracts
+    extract(source: str | ParsedDocument) -> dict
+        Reads the resume (or reuses a parsed document), and extracts
         contact details as a dictionary.
     """
 
-    def extract(self, file_path: str) -> dict:
+    max_pages = 1
+
+    def is_complete(self, result: dict) -> bool:
+        """
+        Treat the first page as sufficient once every field, URLs included, is found.
+        """
+        return all(result.get(key) for key in (
+            "name", "email", "phone", "linkedin", "github", "additional_urls"
+        ))
+
+    def extract_document(self, document: ParsedDocument) -> dict:
         """
-        Extract contact information from the provided resume file.
+        Extract contact information from the provided parsed resume.
 
         Parameters
         ----------
-        file_path : str
-            Path to the resume file.
+        document : ParsedDocument
+            The parsed resume.
 
         Returns
         -------
@@ -57,7 +73,7 @@ class ContactExtractor(BaseExtractor):
             - additional_urls (list[str]): Any other URLs found in the resume,
               excluding LinkedIn and GitHub.
         """
-        text = self.normalize(read_resume(file_path))
+        text = document.normalized_text
 
         # Name (first match that fits NAME_PATTERN)
         name_match = re.search(NAME_PATTERN, text, re.MULTILINE)
@@ -7,7 +7,7 @@ and additional details.
 import re
 from typing import Optional
 from resume_parser.extractors.base_extractor import BaseExtractor
-from resume_parser.utils.file_reader import read_resume
+from resume_parser.utils.parsed_document import ParsedDocument
 from resume_parser.utils.section_finder import find_section
 from resume_parser.config.patterns import (
     EDU_START, EDU_END, DATE_RANGE, GPA_PATTERN,
@@ -37,11 +37,11 @@ class EducationExtractor(BaseExtractor):
     }
     """
 
-    def extract(self, file_path: str) -> dict:
+    def extract_document(self, document: ParsedDocument) -> dict:
         """
-        Reads the resume file, finds the Education section, and parses it into structured fields.
+        Finds the Education section of a parsed resume and parses it into structured fields.
         """
-        text = self.normalize(read_resume(file_path))
+        text = document.normalized_text
         section = find_section(text, EDU_START, EDU_END) or ""
         items = self.parse_education(section)
         return {"section": section, "items": items}
@@ -9,7 +9,7 @@ the 'Experience' section of resumes in various formats, including:
 
 import re
 from resume_parser.extractors.base_extractor import BaseExtractor
-from resume_parser.utils.file_reader import read_resume
+from resume_parser.utils.parsed_document import ParsedDocument
 from resume_parser.utils.section_finder import find_section
 from resume_parser.config.patterns import (
     EXP_START,
@@ -32,8 +32,8 @@ class ExperienceExtractor(BaseExtractor):
       - Mixed formats
     """
 
-    def extract(self, file_path: str) -> dict: # pylint: disable=too-many-locals
-        text = self.normalize(read_resume(file_path))
+    def extract_document(self, document: ParsedDocument) -> dict: # pylint: disable=too-many-locals
+        text = document.normalized_text
         section_text = find_section(text, EXP_START, EXP_END)
 
         if not section_text:
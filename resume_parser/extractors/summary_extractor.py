@@ -9,7 +9,7 @@ regex patterns.
 from resume_parser.extractors.base_extractor import BaseExtractor
 from resume_parser.utils.section_finder import find_section
 from resume_parser.config.patterns import SUMMARY_START, SUMMARY_END
-from resume_parser.utils.file_reader import read_resume
+from resume_parser.utils.parsed_document import ParsedDocument
 
 
 class SummaryExtractor(BaseExtractor):  # pylint: disable=too-few-public-methods
@@ -20,23 +20,23 @@ class SummaryExtractor(BaseExtractor):  # pylint: disable=too-few-public-methods
         BaseExtractor: Provides normalization and shared extraction utilities.
 
     Methods:
-        extract(file_path: str) -> dict:
-            Reads a resume, normalizes its text, and extracts the summary section
-            using pre-defined start and end patterns.
+        extract_document(document: ParsedDocument) -> dict:
+            Extracts the summary section from a parsed resume using
+            pre-defined start and end patterns.
     """
 
-    def extract(self, file_path: str) -> dict:
+    def extract_document(self, document: ParsedDocument) -> dict:
         """
-        Extract the Summary section from the given resume file.
+        Extract the Summary section from the given parsed resume.
 
         Args:
-            file_path (str): Path to the resume file.
+            document (ParsedDocument): The parsed resume.
 
         Returns:
             dict: A dictionary containing:
                 - "section" (str): The extracted summary text. If no section
                   is found, returns an empty string.
         """
-        text = self.normalize(read_resume(file_path))
+        text = document.normalized_text
         section = find_section(text, SUMMARY_START, SUMMARY_END)
         return {"section": section}
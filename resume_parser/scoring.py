@@ -0,0 +1,368 @@
+"""
+scoring.py
+
+Vectorized ranking of many resumes against a role or a weighted skill set.
+
+A corpus is matched once into a compact resumes x skills ``uint8`` matrix
+(one column per skill in `skills_master.json`, grouped by category). Ranking
+the corpus for a new requisition is then a single matrix-vector product plus
+a partial sort, so it takes milliseconds even for tens of thousands of
+resumes. The matrix can be saved and loaded (``.npz``) together with the
+digest of the skills dataset it was built against.
+
+Requires NumPy (``pip install "resume_parser[scoring]"``).
+
+Typical Usage:
+    from resume_parser.scoring import SkillMatrix
+
+    matrix = SkillMatrix.from_batch_output("nightly.jsonl")   # --mode skills output
+    matrix.save("corpus.npz")
+
+    matrix = SkillMatrix.load("corpus.npz")
+    matrix.top_k(role="Backend Developer", k=20)
+    matrix.top_k(weights={"Python": 3, "Kubernetes": 2, "AWS": 1}, k=20)
+
+    resume_parser score corpus.npz --role "Backend Developer" --top 20
+
+Classes:
+    SkillMatrix:
+        Resumes x skills matrix with role and weighted-skill ranking.
+"""
+
+import argparse
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        'resume_parser.scoring needs NumPy: pip install "resume_parser[scoring]"'
+    ) from exc
+
+from resume_parser.utils.file_reader import ReaderOptions, read_resume
+from resume_parser.utils.skills_index import SkillsIndex, get_skills_index
+from resume_parser.utils.text_cache import TextCache
+
+
+class SkillMatrix:
+    """
+    Which skills each resume in a corpus mentions, as a ``uint8`` matrix.
+
+    Attributes:
+        ids (list[str]): Row labels (file paths or caller-chosen ids).
+        skills (list[str]): Column labels: skill names in dataset order,
+            each listed once even if several categories contain it.
+        matrix (numpy.ndarray): ``uint8`` array of shape (len(ids),
+            len(skills)); 1 where the resume mentions the skill.
+        digest (str): Digest of the skills dataset the columns come from.
+    """
+
+    def __init__(
+        self,
+        ids: List[str],
+        matrix: "np.ndarray",
+        index: Optional[SkillsIndex] = None,
+    ) -> None:
+        """
+        Wrap an existing matrix; use the ``from_*`` constructors to build one.
+
+        Args:
+            ids (list[str]): Row labels.
+            matrix (numpy.ndarray): 0/1 array with one column per skill.
+            index (SkillsIndex, optional): Dataset the columns follow;
+                defaults to the bundled dataset.
+
+        Raises:
+            ValueError: If the matrix shape does not match `ids` and the
+                dataset's skills.
+        """
+        self._index = index or get_skills_index()
+        self.skills = list(self._index.skill_categories)
+        self._column = {name: i for i, name in enumerate(self.skills)}
+        if matrix.shape != (len(ids), len(self.skills)):
+            raise ValueError(
+                f"Matrix shape {matrix.shape} does not match "
+                f"{len(ids)} resumes x {len(self.skills)} skills"
+            )
+        self.ids = list(ids)
+        self.matrix = matrix.astype(np.uint8, copy=False)
+        self.digest = self._index.digest
+
+    @property
+    def column_groups(self) -> Dict[str, "np.ndarray"]:
+        """Category -> column indices of its skills."""
+        return {
+            category: np.array([self._column[name] for name in dict.fromkeys(names)], dtype=int)
+            for category, names in self._index.categories.items()
+        }
+
+    @classmethod
+    def from_texts(
+        cls, items: Iterable[Tuple[str, str]], index: Optional[SkillsIndex] = None
+    ) -> "SkillMatrix":
+        """
+        Build the matrix from resume texts, scanning each once.
+
+        Args:
+            items (Iterable[tuple[str, str]]): (id, text) pairs.
+            index (SkillsIndex, optional): Skills dataset; defaults to the
+                bundled one.
+
+        Returns:
+            SkillMatrix: One row per item.
+        """
+        index = index or get_skills_index()
+        hits = [(resume_id, {name for _, name in index.matcher.match(text)})
+                for resume_id, text in items]
+        return cls._from_hits(hits, index)
+
+    @classmethod
+    def from_files(
+        cls,
+        paths: Iterable[str],
+        cache: Optional[TextCache] = None,
+        options: Optional[ReaderOptions] = None,
+        index: Optional[SkillsIndex] = None,
+    ) -> "SkillMatrix":
+        """
+        Build the matrix by reading resume files (through `cache` if given).
+
+        Args:
+            paths (Iterable[str]): Resume files; each path is its row id.
+            cache (TextCache, optional): Text cache, so stored resumes are
+                not read again.
+            options (ReaderOptions, optional): Reader options and budgets.
+            index (SkillsIndex, optional): Skills dataset.
+
+        Returns:
+            SkillMatrix: One row per file.
+        """
+        return cls.from_texts(
+            ((path, read_resume(path, cache=cache, options=options)) for path in paths), index
+        )
+
+    @classmethod
+    def from_batch_output(
+        cls, jsonl_path: str, index: Optional[SkillsIndex] = None
+    ) -> "SkillMatrix":
+        """
+        Build the matrix from a ``--batch --mode skills`` JSONL file without
+        reading any resume again.
+
+        Records that failed are skipped. Every other record must hold the
+        general skills table: other modes (profile, a single role's subset of
+        categories, rankings, hits) would silently leave skills out.
+
+        Args:
+            jsonl_path (str): Batch output file.
+            index (SkillsIndex, optional): Skills dataset the batch used.
+
+        Returns:
+            SkillMatrix: One row per usable record, labelled by its file.
+
+        Raises:
+            ValueError: If a record comes from another mode than ``--mode skills``.
+        """
+        index = index or get_skills_index()
+        hits = []
+        with open(jsonl_path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if not record.get("ok"):
+                    continue
+                result = record.get("result")
+                table = result.get("skills") if isinstance(result, dict) else None
+                if set(result or ()) != {"skills"} or not isinstance(table, dict):
+                    raise ValueError(
+                        f"{jsonl_path}:{line_number}: not a general '--mode skills' record "
+                        f"(result keys: {sorted(result or ())})"
+                    )
+                found = {name for result in table.values() for name in result.get("found", [])}
+                hits.append((record["file"], found))
+        return cls._from_hits(hits, index)
+
+    @classmethod
+    def _from_hits(cls, hits: List[Tuple[str, Any]], index: SkillsIndex) -> "SkillMatrix":
+        """Fill the matrix from (id, set of found skill names) pairs."""
+        columns = {name: i for i, name in enumerate(index.skill_categories)}
+        matrix = np.zeros((len(hits), len(columns)), dtype=np.uint8)
+        for row, (_, names) in enumerate(hits):
+            cols = [columns[name] for name in names if name in columns]
+            matrix[row, cols] = 1
+        return cls([resume_id for resume_id, _ in hits], matrix, index)
+
+    def save(self, path: str) -> None:
+        """
+        Save the matrix, row ids and dataset digest as a compressed ``.npz``.
+
+        Args:
+            path (str): Destination file.
+        """
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f,
+                matrix=np.packbits(self.matrix, axis=1),
+                width=np.array(len(self.skills)),
+                ids=np.array(json.dumps(self.ids)),
+                skills=np.array(json.dumps(self.skills)),
+                digest=np.array(self.digest),
+            )
+
+    @classmethod
+    def load(cls, path: str, index: Optional[SkillsIndex] = None) -> "SkillMatrix":
+        """
+        Load a matrix saved with `save`.
+
+        Args:
+            path (str): The ``.npz`` file.
+            index (SkillsIndex, optional): Skills dataset; defaults to the
+                bundled one.
+
+        Returns:
+            SkillMatrix: The stored corpus.
+
+        Raises:
+            ValueError: If it was built against a different skills dataset
+                (rebuild it, e.g. with `from_batch_output`).
+        """
+        index = index or get_skills_index()
+        with np.load(path) as data:
+            if str(data["digest"]) != index.digest:
+                raise ValueError(f"{path} was built for a different skills dataset")
+            matrix = np.unpackbits(data["matrix"], axis=1, count=int(data["width"]))
+            ids = json.loads(str(data["ids"]))
+        return cls(ids, matrix, index)
+
+    def role_weights(self, role: str) -> "np.ndarray":
+        """
+        Weight vector selecting every skill of a role's categories once.
+
+        Raises:
+            ValueError: If the role is unknown.
+        """
+        if role not in self._index.role_categories:
+            raise ValueError(f"Unknown role: {role}")
+        weights = np.zeros(len(self.skills), dtype=np.float32)
+        groups = self.column_groups
+        for category in self._index.role_categories[role]:
+            if category in groups:
+                weights[groups[category]] = 1.0
+        return weights
+
+    def skill_weights(self, weights: Dict[str, float]) -> "np.ndarray":
+        """
+        Weight vector for a custom skill set.
+
+        Args:
+            weights (dict[str, float]): Skill name -> weight.
+
+        Raises:
+            ValueError: If a skill is not in the dataset.
+        """
+        vector = np.zeros(len(self.skills), dtype=np.float32)
+        for name, weight in weights.items():
+            if name not in self._column:
+                raise ValueError(f"Unknown skill: {name}")
+            vector[self._column[name]] = weight
+        return vector
+
+    def scores(
+        self, role: Optional[str] = None, weights: Optional[Dict[str, float]] = None
+    ) -> "np.ndarray":
+        """
+        Score every resume: the weighted share of the query's skills it has.
+
+        Args:
+            role (str, optional): Rank for this role (every skill weighs 1,
+                as in `SkillsChecker.rank_roles`).
+            weights (dict[str, float], optional): Custom skill weights;
+                exactly one of `role` and `weights` is required.
+
+        Returns:
+            numpy.ndarray: One score in [0, 1] per resume (row order).
+
+        Raises:
+            ValueError: If the query is missing, ambiguous or unknown.
+        """
+        if (role is None) == (weights is None):
+            raise ValueError("Give either a role or skill weights")
+        vector = self.role_weights(role) if role is not None else self.skill_weights(weights)
+        total = float(vector.sum())
+        if total <= 0:
+            return np.zeros(len(self.ids), dtype=np.float32)
+        return (self.matrix @ vector) / total
+
+    def top_k(
+        self,
+        role: Optional[str] = None,
+        weights: Optional[Dict[str, float]] = None,
+        k: int = 10,
+    ) -> List[Tuple[str, float]]:
+        """
+        Return the `k` best-scoring resumes, best first.
+
+        Args:
+            role (str, optional): Role to rank for.
+            weights (dict[str, float], optional): Custom skill weights.
+            k (int): Number of results.
+
+        Returns:
+            list[tuple[str, float]]: (id, score) pairs; equal scores are
+            listed in row order.
+        """
+        scores = self.scores(role, weights)
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+        # Partial selection first, then order just the k winners.
+        candidates = np.argpartition(-scores, k - 1)[:k] if k < len(scores) else np.arange(k)
+        order = candidates[np.lexsort((candidates, -scores[candidates]))]
+        return [(self.ids[i], round(float(scores[i]), 4)) for i in order]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Entry point for `resume_parser score`."""
+    parser = argparse.ArgumentParser(
+        prog="resume_parser score", description="Rank a stored corpus for a role or skill set"
+    )
+    parser.add_argument("matrix", help="Corpus matrix (.npz)")
+    parser.add_argument(
+        "--from-batch", metavar="JSONL",
+        help="(Re)build the matrix from a --batch --mode skills output first"
+    )
+    query = parser.add_mutually_exclusive_group()
+    query.add_argument("--role", help="Rank for this role")
+    query.add_argument(
+        "--skill", action="append", metavar="NAME[=WEIGHT]",
+        help="Rank for these skills (repeatable; weight defaults to 1)"
+    )
+    parser.add_argument("--top", type=int, default=10, help="Number of results (default: 10)")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.from_batch:
+            matrix = SkillMatrix.from_batch_output(args.from_batch)
+            matrix.save(args.matrix)
+            print(f"Saved {len(matrix.ids)} resumes to {args.matrix}")
+        else:
+            matrix = SkillMatrix.load(args.matrix)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if not args.role and not args.skill:
+        return
+
+    weights = None
+    if args.skill:
+        weights = {}
+        for spec in args.skill:
+            name, _, weight = spec.partition("=")
+            weights[name] = float(weight) if weight else 1.0
+    try:
+        ranking = matrix.top_k(role=args.role, weights=weights, k=args.top)
+    except ValueError as exc:
+        parser.error(str(exc))
+    for rank, (resume_id, score) in enumerate(ranking, 1):
+        print(f"{rank:>4}. {score:6.1%}  {resume_id}")
@@ -0,0 +1,558 @@
+"""
+search_index.py
+
+Persistent inverted index over a resume corpus, for boolean skill queries.
+
+Every indexed resume gets an integer id. The index maps each term to the
+sorted list of ids containing it (a posting list):
+
+* ``skill:<name>`` for every skill found, under its canonical name from
+  `skills_master.json` (aliases are resolved by the shared `SkillMatcher`);
+* ``company:<word>``, ``title:<word>``, ``degree:<word>`` and
+  ``institution:<word>`` for the words of the extracted experience and
+  education fields.
+
+Posting lists are stored delta-encoded as variable-length integers (most
+gaps fit in one byte) and kept compressed in memory; only the lists a query
+touches are decoded. Ids only ever grow, so adding a resume appends to its
+lists without rewriting them, and a changed file is simply removed and added
+again. The index lives in a local SQLite file and each resume's content hash
+is stored, so `sync` re-reads only new or changed files.
+
+Query syntax: ``AND``, ``OR`` and ``NOT`` (upper case) with parentheses.
+Adjacent words form one phrase, so ``Machine Learning`` needs no quotes. A
+bare phrase is looked up as a skill name or alias first, otherwise as words
+of any extracted field; ``skill:``, ``company:``, ``title:``, ``degree:`` or
+``institution:`` restricts it (quote multi-word values: ``company:"acme corp"``).
+
+Typical Usage:
+    from resume_parser.search_index import ResumeIndex
+
+    with ResumeIndex("corpus.index") as index:
+        index.sync(collect_files("resumes/"))
+        index.search("Kubernetes AND (Go OR Rust) AND NOT Intern")
+
+    resume_parser index corpus.index --add resumes/ --query "Python AND NOT title:intern"
+
+Classes:
+    ResumeIndex:
+        SQLite-backed inverted index with incremental updates and boolean search.
+
+Functions:
+    encode_postings(ids) -> bytes:
+        Delta/varint-encodes a sorted list of ids.
+    decode_postings(data) -> list[int]:
+        Inverse of `encode_postings`.
+    document_terms(document, index) -> set[str]:
+        Returns the index terms of a parsed resume.
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from resume_parser.extractors.education_extractor import EducationExtractor
+from resume_parser.extractors.experience_extractor import ExperienceExtractor
+from resume_parser.utils.file_reader import ReaderOptions
+from resume_parser.utils.parsed_document import ParsedDocument
+from resume_parser.utils.skills_index import SkillsIndex, get_skills_index
+from resume_parser.utils.text_cache import TextCache, file_digest
+
+# Extracted fields indexed word by word: field -> (extractor, item keys).
+FIELDS = {
+    "company": ("experience", ("Company",)),
+    "title": ("experience", ("Job Title",)),
+    "degree": ("education", ("Degree & Emphasis", "Minors")),
+    "institution": ("education", ("Institution",)),
+}
+OPERATORS = {"AND", "OR", "NOT"}
+
+_WORD_RE = re.compile(r"\w+")
+_TOKEN_RE = re.compile(r'\s*(\(|\)|\w+:"[^"]*"|"[^"]*"|[^\s()]+)')
+
+
+def encode_postings(ids: Iterable[int]) -> bytes:
+    """
+    Delta-encode a sorted list of ids as unsigned LEB128 varints.
+
+    Args:
+        ids (Iterable[int]): Strictly increasing non-negative ids.
+
+    Returns:
+        bytes: The encoded posting list.
+    """
+    out = bytearray()
+    previous = 0
+    for doc_id in ids:
+        _append_varint(out, doc_id - previous)
+        previous = doc_id
+    return bytes(out)
+
+
+def _append_varint(out: bytearray, value: int) -> None:
+    """Append one unsigned LEB128 integer."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_postings(data: bytes) -> List[int]:
+    """
+    Decode a posting list written by `encode_postings`.
+
+    Args:
+        data (bytes): The encoded list.
+
+    Returns:
+        list[int]: The ids, ascending.
+    """
+    ids = []
+    current = value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        current += value
+        ids.append(current)
+        value = shift = 0
+    return ids
+
+
+def _words(text: str) -> List[str]:
+    """Lowercased word tokens of a field value."""
+    return _WORD_RE.findall(text.lower())
+
+
+def document_terms(document: ParsedDocument, index: Optional[SkillsIndex] = None) -> Set[str]:
+    """
+    Return the index terms of a parsed resume.
+
+    Args:
+        document (ParsedDocument): The resume.
+        index (SkillsIndex, optional): Skills dataset; defaults to the
+            bundled one.
+
+    Returns:
+        set[str]: ``skill:<name>`` terms plus ``<field>:<word>`` terms for
+        the extracted experience and education fields.
+    """
+    index = index or get_skills_index()
+    terms = {f"skill:{name}" for _, name in index.matcher.match(document.raw_text)}
+    sections = {
+        "experience": ExperienceExtractor().extract(document).get("items", []),
+        "education": EducationExtractor().extract(document).get("items", []),
+    }
+    for field, (section, keys) in FIELDS.items():
+        for item in sections[section]:
+            for key in keys:
+                terms.update(f"{field}:{word}" for word in _words(item.get(key) or ""))
+    return terms
+
+
+class ResumeIndex:  # pylint: disable=too-many-instance-attributes
+    """
+    On-disk inverted index from skills and extracted fields to resumes.
+
+    Attributes:
+        path (str): Location of the SQLite database file.
+        skills (SkillsIndex): Skills dataset used for terms and queries.
+    """
+
+    def __init__(self, path: str, skills: Optional[SkillsIndex] = None) -> None:
+        """
+        Open (or create) the index and load its posting lists.
+
+        Args:
+            path (str): Index file; parent directories are created.
+            skills (SkillsIndex, optional): Skills dataset; defaults to the
+                bundled one. Resumes indexed against another dataset version
+                are re-read by `sync`.
+        """
+        self.path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.skills = skills or get_skills_index()
+
+        self._conn = sqlite3.connect(self.path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS docs ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " path TEXT UNIQUE NOT NULL,"
+            " digest TEXT NOT NULL,"
+            " skills TEXT NOT NULL,"
+            " terms TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS postings ("
+            " term TEXT PRIMARY KEY,"
+            " ids BLOB NOT NULL,"
+            " last INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+
+        self._docs: Dict[int, str] = dict(self._conn.execute("SELECT id, path FROM docs"))
+        self._ids = {path: doc_id for doc_id, path in self._docs.items()}
+        # term -> encoded ids, plus each list's last id so appends need no decoding.
+        self._postings: Dict[str, bytearray] = {}
+        self._last: Dict[str, int] = {}
+        for term, data, last in self._conn.execute("SELECT term, ids, last FROM postings"):
+            self._postings[term] = bytearray(data)
+            self._last[term] = last
+        self._dirty: Set[str] = set()
+
+    def __enter__(self) -> "ResumeIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def close(self) -> None:
+        """Commit pending changes and close the database."""
+        self.commit()
+        self._conn.close()
+
+    def commit(self) -> None:
+        """Write the posting lists changed since the last commit."""
+        for term in self._dirty:
+            if term in self._postings:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO postings (term, ids, last) VALUES (?, ?, ?)",
+                    (term, bytes(self._postings[term]), self._last[term]),
+                )
+            else:
+                self._conn.execute("DELETE FROM postings WHERE term = ?", (term,))
+        self._dirty.clear()
+        self._conn.commit()
+
+    def postings(self, term: str) -> List[int]:
+        """
+        Return the ids of the resumes containing a term.
+
+        Args:
+            term (str): A ``skill:<name>`` or ``<field>:<word>`` term.
+
+        Returns:
+            list[int]: Resume ids, ascending.
+        """
+        return decode_postings(self._postings.get(term, b""))
+
+    def add(self, file_path: str, terms: Iterable[str], digest: str = "") -> int:
+        """
+        Index (or re-index) a resume under the given terms.
+
+        Args:
+            file_path (str): Resume path, used as its identity.
+            terms (Iterable[str]): Its terms, e.g. from `document_terms`.
+            digest (str): Content hash, so `sync` can skip it later.
+
+        Returns:
+            int: The resume's new id.
+        """
+        self.remove(file_path)
+        terms = sorted(set(terms))
+        cursor = self._conn.execute(
+            "INSERT INTO docs (path, digest, skills, terms) VALUES (?, ?, ?, ?)",
+            (file_path, digest, self.skills.digest, "\n".join(terms)),
+        )
+        doc_id = cursor.lastrowid
+        self._docs[doc_id] = file_path
+        self._ids[file_path] = doc_id
+        for term in terms:
+            _append_varint(self._postings.setdefault(term, bytearray()),
+                           doc_id - self._last.get(term, 0))
+            self._last[term] = doc_id
+            self._dirty.add(term)
+        return doc_id
+
+    def remove(self, file_path: str) -> bool:
+        """
+        Drop a resume from the index.
+
+        Args:
+            file_path (str): Resume path.
+
+        Returns:
+            bool: True if it was indexed.
+        """
+        doc_id = self._ids.pop(file_path, None)
+        if doc_id is None:
+            return False
+        del self._docs[doc_id]
+        (terms,) = self._conn.execute(
+            "SELECT terms FROM docs WHERE id = ?", (doc_id,)
+        ).fetchone()
+        self._conn.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+        for term in filter(None, terms.split("\n")):
+            ids = [i for i in self.postings(term) if i != doc_id]
+            if ids:
+                self._postings[term] = bytearray(encode_postings(ids))
+                self._last[term] = ids[-1]
+            else:
+                self._postings.pop(term, None)
+                self._last.pop(term, None)
+            self._dirty.add(term)
+        return True
+
+    def sync(
+        self,
+        paths: Iterable[str],
+        prune: bool = False,
+        cache: Optional[TextCache] = None,
+        options: Optional[ReaderOptions] = None,
+    ) -> Dict[str, int]:
+        """
+        Bring the index up to date with a set of resume files.
+
+        Unchanged files (same content hash and skills dataset) are skipped;
+        new or changed ones are read and re-indexed. Files that cannot be read
+        are left out of the index.
+
+        Args:
+            paths (Iterable[str]): Resume files, e.g. from `batch.collect_files`.
+            prune (bool): Also remove indexed resumes not among `paths`.
+            cache (TextCache, optional): Text cache consulted before reading.
+            options (ReaderOptions, optional): Reader options and budgets.
+
+        Returns:
+            dict: Counts of "indexed", "unchanged", "failed" and "removed" files.
+        """
+        counts = {"indexed": 0, "unchanged": 0, "failed": 0, "removed": 0}
+        seen = set()
+        for file_path in paths:
+            seen.add(file_path)
+            digest = file_digest(file_path)
+            row = self._conn.execute(
+                "SELECT 1 FROM docs WHERE path = ? AND digest = ? AND skills = ?",
+                (file_path, digest, self.skills.digest),
+            ).fetchone()
+            if row is not None:
+                counts["unchanged"] += 1
+                continue
+            try:
+                document = ParsedDocument.from_file(file_path, cache=cache, options=options)
+                terms = document_terms(document, self.skills)
+            except Exception:  # pylint: disable=broad-exception-caught
+                self.remove(file_path)
+                counts["failed"] += 1
+                continue
+            self.add(file_path, terms, digest)
+            counts["indexed"] += 1
+        if prune:
+            for file_path in set(self._ids) - seen:
+                counts["removed"] += self.remove(file_path)
+        self.commit()
+        return counts
+
+    def search(self, query: str) -> List[str]:
+        """
+        Return the resumes matching a boolean query.
+
+        Args:
+            query (str): E.g. ``Kubernetes AND (Go OR Rust) AND NOT Intern``.
+
+        Returns:
+            list[str]: Matching resume paths, in indexing order.
+
+        Raises:
+            ValueError: If the query is malformed or names an unknown field
+                or skill.
+        """
+        ids = _QueryParser(_tokenize(query), self, self._docs.keys()).parse()
+        return [self._docs[doc_id] for doc_id in sorted(ids)]
+
+    def resolve(self, field: Optional[str], phrase: str) -> Set[int]:
+        """
+        Return the ids matching one query phrase.
+
+        Args:
+            field (str, optional): "skill", one of `FIELDS`, or None to try a
+                skill first and then any field.
+            phrase (str): The phrase text.
+
+        Returns:
+            set[int]: Matching resume ids.
+
+        Raises:
+            ValueError: If the field, or the skill for ``skill:``, is unknown.
+        """
+        if field is not None and field != "skill" and field not in FIELDS:
+            raise ValueError(f"Unknown field: {field}")
+        owners = self.skills.aliases.get(phrase.lower())
+        if field == "skill" or (field is None and owners):
+            if not owners:
+                raise ValueError(f"Unknown skill: {phrase}")
+            return {i for name in dict.fromkeys(n for _, n in owners)
+                    for i in self.postings(f"skill:{name}")}
+
+        fields = [field] if field else list(FIELDS)
+        result: Optional[Set[int]] = None
+        for word in _words(phrase):
+            ids = {i for name in fields for i in self.postings(f"{name}:{word}")}
+            result = ids if result is None else result & ids
+        return result or set()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report index size for monitoring.
+
+        Returns:
+            dict: "documents", "terms" and "posting_bytes" (encoded size).
+        """
+        return {
+            "documents": len(self._docs),
+            "terms": len(self._postings),
+            "posting_bytes": sum(len(data) for data in self._postings.values()),
+        }
+
+
+def _tokenize(query: str) -> List[Tuple[str, Optional[str], str]]:
+    """
+    Split a query into (kind, field, text) tokens, joining adjacent words.
+
+    Kinds are "(", ")", "op" and "term".
+    """
+    tokens: List[Tuple[str, Optional[str], str]] = []
+    joinable = False
+    for text in _TOKEN_RE.findall(query):
+        if text in ("(", ")"):
+            tokens.append((text, None, text))
+            joinable = False
+            continue
+        if text in OPERATORS:
+            tokens.append(("op", None, text))
+            joinable = False
+            continue
+        field, value = None, text
+        head, sep, rest = text.partition(":")
+        if sep and rest and head.isidentifier():
+            field, value = head.lower(), rest
+        quoted = len(value) >= 2 and value[0] == value[-1] == '"'
+        if quoted:
+            value = value[1:-1]
+        if joinable and field is None and not quoted:
+            _, previous_field, previous = tokens[-1]
+            tokens[-1] = ("term", previous_field, f"{previous} {value}")
+        else:
+            tokens.append(("term", field, value))
+        joinable = not quoted
+    return tokens
+
+
+class _QueryParser:  # pylint: disable=too-few-public-methods
+    """Recursive-descent evaluator: or := and (OR and)*, and := not (AND not)*."""
+
+    def __init__(
+        self,
+        tokens: List[Tuple[str, Optional[str], str]],
+        index: ResumeIndex,
+        universe: Iterable[int],
+    ) -> None:
+        self._tokens = tokens
+        self._position = 0
+        self._index = index
+        self._universe = universe
+
+    def parse(self) -> Set[int]:
+        """Evaluate the whole query."""
+        if not self._tokens:
+            raise ValueError("Empty query")
+        result = self._or()
+        if self._position < len(self._tokens):
+            raise ValueError(f"Unexpected {self._tokens[self._position][2]!r} in query")
+        return result
+
+    def _peek(self, kind: str, text: Optional[str] = None) -> bool:
+        if self._position >= len(self._tokens):
+            return False
+        token = self._tokens[self._position]
+        return token[0] == kind and (text is None or token[2] == text)
+
+    def _or(self) -> Set[int]:
+        result = self._and()
+        while self._peek("op", "OR"):
+            self._position += 1
+            result = result | self._and()
+        return result
+
+    def _and(self) -> Set[int]:
+        # Positives are intersected and negatives subtracted, so that
+        # "A AND NOT B" never materializes the complement of B.
+        include: List[Set[int]] = []
+        exclude: List[Set[int]] = []
+        while True:
+            negated = False
+            while self._peek("op", "NOT"):
+                self._position += 1
+                negated = not negated
+            (exclude if negated else include).append(self._primary())
+            if not self._peek("op", "AND"):
+                break
+            self._position += 1
+        result = set(self._universe) if not include else set.intersection(
+            *sorted(include, key=len)
+        )
+        for ids in exclude:
+            result -= ids
+        return result
+
+    def _primary(self) -> Set[int]:
+        if self._peek("("):
+            self._position += 1
+            result = self._or()
+            if not self._peek(")"):
+                raise ValueError("Missing ')' in query")
+            self._position += 1
+            return result
+        if not self._peek("term"):
+            found = self._tokens[self._position][2] if self._position < len(self._tokens) else "end"
+            raise ValueError(f"Expected a term in query, found {found!r}")
+        _, field, phrase = self._tokens[self._position]
+        self._position += 1
+        return self._index.resolve(field, phrase)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Entry point for `resume_parser index`."""
+    # Imported here: batch pulls in the process-pool machinery.
+    from resume_parser.batch import collect_files  # pylint: disable=import-outside-toplevel
+
+    parser = argparse.ArgumentParser(
+        prog="resume_parser index", description="Build and query a resume search index"
+    )
+    parser.add_argument("index", help="Index file (created if missing)")
+    parser.add_argument(
+        "--add", action="append", metavar="DIR_OR_GLOB", default=[],
+        help="Index new or changed resumes (repeatable)"
+    )
+    parser.add_argument(
+        "--prune", action="store_true",
+        help="With --add, drop indexed resumes that are no longer there"
+    )
+    parser.add_argument("--query", help='Boolean query, e.g. "Kubernetes AND (Go OR Rust)"')
+    parser.add_argument("--cache-dir", help="Directory for the extracted-text cache")
+    args = parser.parse_args(argv)
+
+    with ResumeIndex(args.index) as index:
+        if args.add:
+            paths = [path for target in args.add for path in collect_files(target)]
+            cache = TextCache(args.cache_dir) if args.cache_dir else None
+            try:
+                counts = index.sync(paths, prune=args.prune, cache=cache)
+            finally:
+                if cache is not None:
+                    cache.close()
+            print(", ".join(f"{count} {name}" for name, count in counts.items()))
+        if args.query:
+            try:
+                matches = index.search(args.query)
+            except ValueError as exc:
+                parser.error(str(exc))
+            for path in matches:
+                print(path)
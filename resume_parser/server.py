@@ -0,0 +1,251 @@
+"""
+server.py
+
+Local HTTP parsing service backed by a pool of warm worker processes.
+
+Workers are forked when the server starts and, before taking any request,
+import the reader libraries and load the skills dataset, so a request only
+pays for parsing its own upload. The HTTP front end uses the standard
+library's threading server; parsing itself happens in the worker pool.
+
+Typical Usage:
+    resume_parser serve --port 8080 --workers 4
+
+    curl --data-binary @resume.pdf localhost:8080/profile
+    curl --data-binary @resume.docx "localhost:8080/skills"
+    curl --data-binary @resume.pdf "localhost:8080/skills/role?role=Backend%20Developer"
+
+Endpoints:
+    POST /profile             Summary, contact, education and experience.
+    POST /skills              General skills.
+    POST /skills/role?role=R  Skills for role R.
+    POST /skills/rank         Every role ranked by coverage, best fit first.
+    POST /skills/hits         Where each skill occurs (offsets, alias, section).
+    GET  /roles               Available role names.
+    GET  /health              Liveness and worker count.
+
+POST bodies are the raw resume bytes; the format is sniffed from the content
+or given as ``?format=pdf``. Responses are JSON; errors are
+``{"error": "..."}`` with status 400 (bad input), 413 (body too large), 503
+(a worker process died; the pool is replaced and the request can be retried)
+or 500.
+"""
+
+import argparse
+import json
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from resume_parser.batch import analyze_document, start_warm_pool, worker_skills_checker
+from resume_parser.utils.file_reader import ReaderOptions
+from resume_parser.utils.parsed_document import ParsedDocument
+from resume_parser.utils.skills_checker import SkillsChecker
+
+# Heavy libraries are imported by each worker at start-up, not by the server.
+# pylint: disable=import-outside-toplevel
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+DEFAULT_MAX_BODY_BYTES = 20 * 1024 * 1024
+
+# POST path -> (mode, sub_mode)
+ROUTES = {
+    "/profile": ("profile", None),
+    "/skills": ("skills", "general"),
+    "/skills/role": ("skills", "role"),
+    "/skills/rank": ("skills", "rank"),
+    "/skills/hits": ("skills", "hits"),
+}
+
+def parse_upload(  # pylint: disable=too-many-arguments
+    data: bytes,
+    mode: str,
+    sub_mode: Optional[str] = None,
+    role: Optional[str] = None,
+    file_format: Optional[str] = None,
+    options: Optional[ReaderOptions] = None,
+) -> Dict[str, Any]:
+    """
+    Parse uploaded resume bytes and run one analysis mode (runs in a worker).
+
+    Args:
+        data (bytes): The resume content.
+        mode (str): "profile" or "skills".
+        sub_mode (str, optional): Skills sub-mode ("general", "role", "rank" or "hits").
+        role (str, optional): Role name for role-specific skills.
+        file_format (str, optional): Declared format; sniffed when omitted.
+        options (ReaderOptions, optional): Reader options and budgets.
+
+    Returns:
+        dict: The document's "metadata" and the analysis "result".
+
+    Raises:
+        ValueError: If the format or role is unsupported.
+    """
+    document = ParsedDocument.from_source(data, file_format=file_format, options=options)
+    result = analyze_document(
+        document, mode, sub_mode, role, skills_checker=worker_skills_checker()
+    )
+    return {"metadata": document.metadata, "result": result}
+
+
+class ResumeServer(ThreadingHTTPServer):
+    """
+    HTTP server that hands uploads to a pool of pre-started worker processes.
+
+    Attributes:
+        pool (ProcessPoolExecutor): The warm worker pool.
+        workers (int): Number of worker processes.
+        options (ReaderOptions): Reader options (including budgets) applied
+            to every upload.
+        max_body_bytes (int): Largest accepted request body.
+    """
+
+    daemon_threads = True
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        address: Tuple[str, int],
+        workers: int = 2,
+        options: Optional[ReaderOptions] = None,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+    ) -> None:
+        super().__init__(address, ResumeRequestHandler)
+        self.workers = workers
+        self.options = options or ReaderOptions()
+        self.max_body_bytes = max_body_bytes
+        # Start (and warm) every worker now rather than on the first requests.
+        self.pool = start_warm_pool(workers)
+        self._pool_lock = threading.Lock()
+
+    def restart_pool(self, broken: ProcessPoolExecutor) -> None:
+        """
+        Replace a pool broken by a dead worker with a new warm one.
+
+        Concurrent requests that saw the same broken pool restart it once.
+
+        Args:
+            broken (ProcessPoolExecutor): The pool the failed request used.
+        """
+        with self._pool_lock:
+            if self.pool is broken:
+                broken.shutdown(wait=False, cancel_futures=True)
+                self.pool = start_warm_pool(self.workers)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.pool.shutdown(cancel_futures=True)
+
+
+class ResumeRequestHandler(BaseHTTPRequestHandler):
+    """Routes requests to `parse_upload` on the server's worker pool."""
+
+    server: ResumeServer
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Serve /health and /roles."""
+        path = urlparse(self.path).path
+        if path == "/health":
+            self._send_json(200, {"status": "ok", "workers": self.server.workers})
+        elif path == "/roles":
+            self._send_json(200, {"roles": SkillsChecker.load_roles()})
+        else:
+            self._send_json(404, {"error": f"Not found: {path}"})
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """Parse the uploaded resume for /profile, /skills and /skills/role."""
+        url = urlparse(self.path)
+        if url.path not in ROUTES:
+            self._send_json(404, {"error": f"Not found: {url.path}"})
+            return
+        mode, sub_mode = ROUTES[url.path]
+        query = parse_qs(url.query)
+        role = query.get("role", [None])[0]
+        if sub_mode == "role" and not role:
+            self._send_json(400, {"error": "Missing 'role' query parameter"})
+            return
+
+        # The body cannot be framed without a valid length: answer, then hang up.
+        header = (self.headers.get("Content-Length") or "0").strip()
+        if not (header.isascii() and header.isdigit()):
+            self.close_connection = True
+            self._send_json(400, {"error": f"Invalid Content-Length: {header!r}"})
+            return
+        length = int(header)
+        if length > self.server.max_body_bytes:
+            self.close_connection = True
+            self._send_json(413, {"error": f"Body exceeds {self.server.max_body_bytes} bytes"})
+            return
+        data = self.rfile.read(length)
+        if not data:
+            self._send_json(400, {"error": "Empty request body"})
+            return
+
+        pool = self.server.pool
+        try:
+            self._send_json(200, pool.submit(
+                parse_upload, data, mode, sub_mode, role,
+                query.get("format", [None])[0], self.server.options,
+            ).result())
+        except BrokenProcessPool:
+            # A worker died (possibly on this upload): bring up a fresh pool
+            # rather than failing every later request.
+            self.server.restart_pool(pool)
+            self._send_json(503, {"error": "A worker process died; the pool was restarted"})
+        except ValueError as exc:
+            self._send_json(400, {"error": str(exc)})
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self._send_json(500, {"error": f"{type(exc).__name__}: {exc}"})
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Entry point for `resume_parser serve`."""
+    parser = argparse.ArgumentParser(
+        prog="resume_parser serve", description="Resume parsing HTTP service"
+    )
+    parser.add_argument(
+        "--host", default=DEFAULT_HOST, help=f"Bind address (default: {DEFAULT_HOST})"
+    )
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})"
+    )
+    parser.add_argument("--workers", type=int, default=2, help="Worker processes (default: 2)")
+    parser.add_argument(
+        "--max-body-bytes", type=int, default=DEFAULT_MAX_BODY_BYTES,
+        help="Largest accepted upload, in bytes (default: 20 MiB)"
+    )
+    parser.add_argument("--max-pages", type=int, help="Read at most this many PDF pages")
+    parser.add_argument("--max-ocr-pages", type=int, help="OCR at most this many pages")
+    parser.add_argument(
+        "--stage-timeout", type=float, help="Seconds allowed for text extraction and OCR, each"
+    )
+    args = parser.parse_args(argv)
+
+    options = ReaderOptions(
+        max_pages=args.max_pages,
+        max_ocr_pages=args.max_ocr_pages,
+        max_bytes=args.max_body_bytes,
+        stage_timeout=args.stage_timeout,
+    )
+    with ResumeServer(
+        (args.host, args.port), workers=args.workers, options=options,
+        max_body_bytes=args.max_body_bytes,
+    ) as server:
+        print(f"Serving on http://{args.host}:{server.server_address[1]} "
+              f"with {args.workers} workers")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,191 @@
+"""
+batch_manifest.py
+
+Checkpoint manifest for restartable batch runs.
+
+Every file a batch run finishes is recorded with its content hash, the
+pipeline version, the run configuration (mode, role, reader settings), the
+output it was written to and the JSONL record itself. A later run with the
+same manifest skips files that are already done, re-emits stored results for
+content it has seen under another name or for another output, and only
+parses new or changed files.
+
+The manifest is a local SQLite database, committed after every file, so an
+interrupted run loses at most the files that were in flight.
+
+Typical Usage:
+    from resume_parser.batch import run_batch
+    from resume_parser.utils.batch_manifest import BatchManifest
+
+    with BatchManifest("nightly.manifest") as manifest, open("out.jsonl", "a") as out:
+        run_batch("resumes/", out, mode="skills", manifest=manifest)
+        print(manifest.stats())
+
+Classes:
+    BatchManifest:
+        SQLite-backed record of finished batch files with skip/reuse counters.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Dict, Optional
+
+from resume_parser import __version__
+from resume_parser.utils.file_reader import READER_VERSION
+from resume_parser.utils.text_cache import file_digest
+
+
+class BatchManifest:
+    """
+    On-disk record of the files a batch run has finished.
+
+    Attributes:
+        path (str): Location of the SQLite database file.
+        version (str): Pipeline version; entries written by another version
+            are treated as not done.
+        skipped (int): Files skipped because they were already done.
+        reused (int): Files whose record was copied from identical content
+            instead of being parsed again.
+    """
+
+    def __init__(self, path: str, version: Optional[str] = None) -> None:
+        """
+        Open (or create) the manifest database.
+
+        Args:
+            path (str): Manifest file; parent directories are created.
+            version (str, optional): Pipeline version. Defaults to the package
+                version combined with `file_reader.READER_VERSION`.
+        """
+        self.path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.version = version or f"{__version__}:{READER_VERSION}"
+        self.skipped = 0
+        self.reused = 0
+
+        self._conn = sqlite3.connect(self.path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " path TEXT PRIMARY KEY,"
+            " size INTEGER NOT NULL,"
+            " mtime REAL NOT NULL,"
+            " digest TEXT NOT NULL,"
+            " version TEXT NOT NULL,"
+            " config TEXT NOT NULL,"
+            " output TEXT NOT NULL,"
+            " ok INTEGER NOT NULL,"
+            " record TEXT NOT NULL,"
+            " updated REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS files_digest ON files (digest)")
+        self._conn.commit()
+
+    def __enter__(self) -> "BatchManifest":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def digest(self, file_path: str) -> str:
+        """
+        Return the content hash of a file, reusing the stored one when the
+        file's size and modification time are unchanged.
+
+        Args:
+            file_path (str): Path to the file.
+
+        Returns:
+            str: Hex-encoded SHA-256 digest.
+        """
+        stat = os.stat(file_path)
+        row = self._conn.execute(
+            "SELECT digest FROM files WHERE path = ? AND size = ? AND mtime = ?",
+            (file_path, stat.st_size, stat.st_mtime),
+        ).fetchone()
+        return row[0] if row else file_digest(file_path)
+
+    def is_done(self, file_path: str, digest: str, config: str, output: str) -> bool:
+        """
+        Check whether this exact file was already written to `output`.
+
+        Args:
+            file_path (str): Path to the file.
+            digest (str): Its current content hash.
+            config (str): Run configuration (mode, role and reader settings).
+            output (str): Output location of the current run.
+
+        Returns:
+            bool: True if the file can be skipped.
+        """
+        row = self._conn.execute(
+            "SELECT 1 FROM files WHERE path = ? AND digest = ? AND version = ?"
+            " AND config = ? AND output = ?",
+            (file_path, digest, self.version, config, output),
+        ).fetchone()
+        return row is not None
+
+    def find_result(self, digest: str, config: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a successful record for identical content and configuration.
+
+        Args:
+            digest (str): Content hash.
+            config (str): Run configuration.
+
+        Returns:
+            dict | None: The stored JSONL record, or None if there is none.
+        """
+        row = self._conn.execute(
+            "SELECT record FROM files WHERE digest = ? AND version = ? AND config = ?"
+            " AND ok = 1 ORDER BY updated DESC LIMIT 1",
+            (digest, self.version, config),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def record(  # pylint: disable=too-many-arguments
+        self,
+        file_path: str,
+        digest: str,
+        config: str,
+        output: str,
+        record: Dict[str, Any],
+    ) -> None:
+        """
+        Mark a file as done and store its record.
+
+        Args:
+            file_path (str): Path to the file.
+            digest (str): Its content hash.
+            config (str): Run configuration.
+            output (str): Where the record was written.
+            record (dict): The JSONL record.
+        """
+        stat = os.stat(file_path)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO files"
+            " (path, size, mtime, digest, version, config, output, ok, record, updated)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                file_path, stat.st_size, stat.st_mtime, digest, self.version, config,
+                output, int(bool(record.get("ok"))),
+                json.dumps(record, ensure_ascii=False, default=str), time.time(),
+            ),
+        )
+        self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report manifest counters for monitoring.
+
+        Returns:
+            dict: "skipped", "reused" and "entries".
+        """
+        entries = self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+        return {"skipped": self.skipped, "reused": self.reused, "entries": entries}
@@ -145,6 +145,52 @@ class Display:
 
         console.print(table)
 
+    def display_role_ranking(self, ranking: list):
+        """
+        Displays every role's skill coverage, best fit first.
+
+        Args:
+            ranking (list): Entries from `SkillsChecker.rank_roles`, each with
+                "role", "coverage", "found" and "missing".
+        """
+        table = Table(show_lines=True, expand=True, width=console.width)
+        table.add_column("Role", style="bold cyan", no_wrap=True)
+        table.add_column("Coverage", justify="right", no_wrap=True)
+        table.add_column("Found", style="white")
+
+        for entry in ranking:
+            found_str = ", ".join(f"[green]{s}[/green]" for s in entry["found"]) \
+                if entry["found"] else "[dim]None[/dim]"
+            total = len(entry["found"]) + len(entry["missing"])
+            table.add_row(
+                entry["role"],
+                f"{entry['coverage']:.0%} ({len(entry['found'])}/{total})",
+                found_str,
+            )
+
+        console.print(table)
+
+    def display_skill_hits(self, hits: dict):
+        """
+        Displays how often and in which sections each skill appears.
+
+        Args:
+            hits (dict): Result of `SkillsChecker.extract_skill_hits`, mapping
+                skill name to "count", "sections" and "hits".
+        """
+        table = Table(show_lines=True, expand=True, width=console.width)
+        table.add_column("Skill", style="bold cyan", no_wrap=True)
+        table.add_column("Count", justify="right", no_wrap=True)
+        table.add_column("Sections", style="white")
+
+        for name, entry in hits.items():
+            sections = ", ".join(
+                f"{section} ({count})" for section, count in entry["sections"].items()
+            )
+            table.add_row(name, str(entry["count"]), sections or "[dim]None[/dim]")
+
+        console.print(table)
+
     # ------------------------
     # Experience
     # ------------------------
@@ -4,110 +4,916 @@ file_reader.py
 Utility functions for reading resumes from various file formats 
 (.pdf, .docx, .doc, .rtf, .odt, .md, .html, .txt).
 Supports both text-based extraction and OCR fallback for scanned PDFs.
+
+Every reader accepts either a filesystem path or the document's content in
+memory (`bytes`, `memoryview` or a binary file-like object), so services can
+parse uploads without writing them to a temporary file first.
+
+Readers are looked up in a registry (`READERS`, extended via
+`register_reader`) by the format detected from the content's signature,
+falling back to the declared format (`file_format` or the file extension).
+Each entry carries a relative cost hint and an ordered list of fallback
+formats.
+
+Optional budgets in `ReaderOptions` (page and OCR caps, input size, a
+per-stage time limit) bound the work spent on a single document; a read that
+hits one returns what it has so far and records why in a `ReadReport`.
 """
 
+import io
 import os
-import pdfplumber
-from docx import Document
-import mammoth
-import pypandoc
-from pdf2image import convert_from_path
-import pytesseract
+import time
+from dataclasses import dataclass, field
+from typing import IO, TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+# Format libraries (pdfplumber, mammoth, pypandoc, pdf2image, pytesseract),
+# the built-in markup readers and worker pools are imported
+# inside the readers that use them, so importing this module - or reading a
+# .txt file - stays cheap.
+# pylint: disable=import-outside-toplevel, too-many-lines
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+    from resume_parser.utils.text_cache import TextCache
 
+# Bump whenever a change to the readers alters the extracted text, so that
+# cached results from older versions are not reused.
+READER_VERSION = "5"
 
-def read_pdf(file_path: str) -> str:
+
+@dataclass(frozen=True)
+class ReaderOptions:  # pylint: disable=too-many-instance-attributes
+    """
+    Tuning options for the file readers.
+
+    Attributes:
+        pdf_workers (int): Number of processes used to extract PDF pages.
+            1 (the default) reads pages sequentially in the current process.
+        parallel_min_pages (int): PDFs with fewer pages than this are always
+            read sequentially, since process start-up would outweigh the gain.
+        ocr_min_chars (int): Pages whose extracted text is shorter than this
+            (after stripping) are OCR'd. 0 disables OCR entirely.
+        ocr_workers (int): Number of concurrent Tesseract calls.
+        ocr_dpi (int): Resolution used when rasterizing pages for OCR.
+        use_pandoc (bool): Convert .md, .html, .htm, .rtf and .odt files with a
+            pandoc subprocess instead of the built-in readers.
+        max_pages (int | None): Read at most this many leading PDF pages.
+        max_ocr_pages (int | None): OCR at most this many pages per document;
+            further scanned pages keep whatever embedded text they have.
+        max_bytes (int | None): Inputs larger than this are not read at all.
+        stage_timeout (float | None): Wall-clock seconds allowed for each
+            stage (text extraction, then OCR); pages not reached in time are
+            dropped (text stage) or left un-OCR'd (OCR stage).
+
+    None disables the corresponding budget. Reads cut short by a budget are
+    flagged in the `ReadReport` passed to the reader and are never cached.
+    """
+
+    pdf_workers: int = 1
+    parallel_min_pages: int = 8
+    ocr_min_chars: int = 20
+    ocr_workers: int = 1
+    ocr_dpi: int = 200
+    use_pandoc: bool = False
+    max_pages: Optional[int] = None
+    max_ocr_pages: Optional[int] = None
+    max_bytes: Optional[int] = None
+    stage_timeout: Optional[float] = None
+
+    @property
+    def cache_variant(self) -> str:
+        """Identifies the options that change extracted text, for cache keys."""
+        return (
+            f"ocr_min_chars={self.ocr_min_chars};ocr_dpi={self.ocr_dpi};"
+            f"use_pandoc={int(self.use_pandoc)}"
+        )
+
+
+DEFAULT_OPTIONS = ReaderOptions()
+
+
+@dataclass
+class ReadReport:
+    """
+    Records which `ReaderOptions` budgets cut a read short.
+
+    Attributes:
+        truncated_by (list[str]): Budgets that were hit, in the order they
+            were hit: "max_bytes", "max_pages", "max_ocr_pages",
+            "timeout:text" or "timeout:ocr"; "ocr_error" when OCR of some
+            page failed and its embedded text was kept instead.
+        ocr_errors (list[str]): One message per page whose OCR failed.
     """
-    Reads a PDF file and extracts text.
 
-    Attempts text extraction via `pdfplumber`.  
-    If no text is found (e.g., scanned PDF), falls back to OCR using `pytesseract`.
+    truncated_by: List[str] = field(default_factory=list)
+    ocr_errors: List[str] = field(default_factory=list)
+
+    @property
+    def truncated(self) -> bool:
+        """Whether the extracted text is incomplete."""
+        return bool(self.truncated_by)
+
+    def truncate(self, reason: str) -> None:
+        """Record that the budget `reason` was hit."""
+        if reason not in self.truncated_by:
+            self.truncated_by.append(reason)
+
+    def ocr_failed(self, page_number: int, exc: Exception) -> None:
+        """Record that OCR of a (1-based) page failed; its embedded text is kept."""
+        self.ocr_errors.append(f"page {page_number}: {type(exc).__name__}: {exc}")
+        self.truncate("ocr_error")
+
+
+def _deadline(options: ReaderOptions) -> Optional[float]:
+    """Monotonic time at which the current stage must stop, if limited."""
+    if options.stage_timeout is None:
+        return None
+    return time.monotonic() + options.stage_timeout
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left until `deadline` (None when unlimited)."""
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+def _expired(deadline: Optional[float]) -> bool:
+    """Whether `deadline` is set and has passed."""
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def exceeds_byte_budget(source: "ReaderInput", options: ReaderOptions, report: ReadReport) -> bool:
+    """Flag and return True when `source` exceeds `options.max_bytes`."""
+    if options.max_bytes is None:
+        return False
+    size = os.path.getsize(source) if isinstance(source, str) else len(source)
+    if size <= options.max_bytes:
+        return False
+    report.truncate("max_bytes")
+    return True
+
+# A resume given by path, or by its content in memory.
+ResumeSource = Union[str, "os.PathLike[str]", bytes, bytearray, memoryview, IO[bytes]]
+# What the readers work on internally: a path or the raw bytes.
+ReaderInput = Union[str, bytes]
+
+
+def as_reader_input(source: ResumeSource) -> ReaderInput:
+    """
+    Normalize a resume source to a path string or a bytes object.
+
+    Bytes and bytes-backed memoryviews are used as-is (no copy); file-like
+    objects are read once.
 
     Args:
-        file_path: Path to the PDF file.
+        source: A path, bytes-like object or binary file-like object.
 
     Returns:
-        Extracted text as a single string.
+        The path as a string, or the document bytes.
+
+    Raises:
+        TypeError: If `source` is none of the supported types.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    if isinstance(source, bytes):
+        return source
+    if isinstance(source, memoryview):
+        backing = source.obj
+        if isinstance(backing, bytes) and source.c_contiguous and source.nbytes == len(backing):
+            return backing
+        return source.tobytes()
+    if isinstance(source, bytearray):
+        return bytes(source)
+    if hasattr(source, "read"):
+        data = source.read()
+        return data if isinstance(data, bytes) else bytes(data)
+    raise TypeError(f"Unsupported resume source: {type(source).__name__}")
+
+
+# Leading bytes inspected when sniffing a document's format.
+SNIFF_BYTES = 2048
+_OLE2_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+_ODT_MIMETYPE = b"application/vnd.oasis.opendocument.text"
+_DOCX_CONTENT_TYPE = b"wordprocessingml.document.main"
+
+
+def _head(source: ReaderInput) -> bytes:
+    """Return the first `SNIFF_BYTES` bytes of a path or bytes source."""
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            return f.read(SNIFF_BYTES)
+    return source[:SNIFF_BYTES]
+
+
+def _sniff_zip(source: ReaderInput) -> Optional[str]:
+    """Tell a DOCX from an ODT by the parts listed in a ZIP container."""
+    import zipfile
+
+    try:
+        with _binary_stream(source) as stream, zipfile.ZipFile(stream) as archive:
+            names = set(archive.namelist())
+            if "word/document.xml" in names or (
+                "[Content_Types].xml" in names
+                and _DOCX_CONTENT_TYPE in archive.read("[Content_Types].xml")
+            ):
+                return ".docx"
+            if "mimetype" in names and archive.read("mimetype").startswith(_ODT_MIMETYPE):
+                return ".odt"
+            if "content.xml" in names:
+                return ".odt"
+    except zipfile.BadZipFile:
+        pass
+    return None
+
+
+def detect_signature(source: ReaderInput) -> Optional[str]: # pylint: disable=too-many-return-statements
+    """
+    Identify a document's format from its content signature.
+
+    Recognizes the PDF header, ZIP containers (DOCX via its content-type
+    part, ODT via its mimetype), OLE2 compound files (legacy .doc), the RTF
+    prefix and HTML markup.
+
+    Args:
+        source: A path or document bytes (see `as_reader_input`).
+
+    Returns:
+        An extension such as ".pdf", or None if no signature matched
+        (plain text, Markdown or an unknown binary).
     """
-    text = ""
-    with pdfplumber.open(file_path) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text += page_text + "\n"
+    head = _head(source)
+    if b"%PDF-" in head[:1024]:
+        return ".pdf"
+    if head.startswith(b"PK\x03\x04"):
+        return _sniff_zip(source)
+    if head.startswith(_OLE2_MAGIC):
+        return ".doc"
+    text = head.lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    if text.startswith(b"{\\rtf"):
+        return ".rtf"
+    if text.startswith((b"<!doctype html", b"<html")) or b"<body" in text:
+        return ".html"
+    return None
+
+
+def sniff_format(source: ReaderInput) -> str:
+    """
+    Guess a document's format from its content.
+
+    Args:
+        source: A path or document bytes.
+
+    Returns:
+        An extension such as ".pdf"; ".txt" when nothing more specific matches.
+    """
+    return detect_signature(source) or ".txt"
+
+
+def resolve_format(source: ReaderInput, file_format: Optional[str] = None) -> str:
+    """
+    Determine the extension used to pick a reader.
+
+    The declared format (`file_format`, else the path's extension) is
+    checked against the content signature; when they disagree the content
+    wins, so a DOCX uploaded as "resume.pdf" is still read as DOCX. Bytes
+    with neither a declared format nor a signature are read as plain text;
+    a path without an extension or signature resolves to "", which no
+    reader is registered for.
+
+    Args:
+        source: A path or document bytes (see `as_reader_input`).
+        file_format: Declared format such as "pdf" or ".docx".
+
+    Returns:
+        A lower-case extension with a leading dot, or "" (see above).
+    """
+    declared = None
+    if file_format:
+        declared = file_format.lower()
+        declared = declared if declared.startswith(".") else f".{declared}"
+    elif isinstance(source, str):
+        declared = os.path.splitext(source)[1].lower()
+
+    detected = detect_signature(source)
+    if detected and READERS.get(declared) is not READERS[detected]:
+        return detected
+    return ".txt" if declared is None else declared
 
-    if not text.strip():  # OCR fallback
-        images = convert_from_path(file_path)
-        for img in images:
-            text += pytesseract.image_to_string(img) + "\n"
 
-    return text.strip()
+def _binary_stream(source: ReaderInput) -> IO[bytes]:
+    """Open a path for binary reading, or wrap bytes without copying them."""
+    if isinstance(source, str):
+        return open(source, "rb")  # pylint: disable=consider-using-with
+    return io.BytesIO(source)
+
+
+def _read_text(source: ReaderInput, encoding: str = "utf-8") -> str:
+    """Return the decoded content of a text-based source, ignoring bad bytes."""
+    if isinstance(source, str):
+        with open(source, "r", encoding=encoding, errors="ignore") as f:
+            return f.read()
+    return source.decode(encoding, errors="ignore")
+
+
+def _pdf_input(source: ReaderInput) -> Union[str, IO[bytes]]:
+    """Argument for `pdfplumber.open`: a path, or an in-memory stream."""
+    return source if isinstance(source, str) else io.BytesIO(source)
+
+
+def _extract_page_range(source: ReaderInput, start: int, stop: int) -> List[str]:
+    """Extract text for pages `start`..`stop - 1` (runs in a worker process)."""
+    import pdfplumber
+    with pdfplumber.open(_pdf_input(source), pages=list(range(start + 1, stop + 1))) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages]
+
+
+def _split_page_ranges(page_count: int, chunks: int) -> List[Tuple[int, int]]:
+    """Split `page_count` pages into at most `chunks` contiguous (start, stop) ranges."""
+    chunks = max(1, min(chunks, page_count))
+    size, extra = divmod(page_count, chunks)
+    ranges = []
+    start = 0
+    for i in range(chunks):
+        stop = start + size + (1 if i < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def extract_pdf_text_pages(
+    source: ReaderInput, options: ReaderOptions, report: ReadReport
+) -> List[str]:
+    """
+    Extract the embedded text of every page (no OCR), in parallel when worthwhile.
+
+    Honours `options.max_pages` and the text-stage timeout, flagging `report`.
+    On timeout the worker processes still extracting are terminated.
+    """
+    import pdfplumber
+
+    deadline = _deadline(options)
+    with pdfplumber.open(_pdf_input(source)) as pdf:
+        page_count = len(pdf.pages)
+        if options.max_pages is not None and page_count > options.max_pages:
+            page_count = options.max_pages
+            report.truncate("max_pages")
+        if options.pdf_workers <= 1 or page_count < options.parallel_min_pages:
+            pages = []
+            for page in pdf.pages[:page_count]:
+                if _expired(deadline):
+                    report.truncate("timeout:text")
+                    break
+                pages.append(page.extract_text() or "")
+            return pages
+
+    import concurrent.futures
+
+    ranges = _split_page_ranges(page_count, options.pdf_workers)
+    pool = concurrent.futures.ProcessPoolExecutor(max_workers=len(ranges))
+    pages, timed_out = [], False
+    try:
+        futures = [pool.submit(_extract_page_range, source, start, stop) for start, stop in ranges]
+        for future in futures:
+            pages.extend(future.result(timeout=_remaining(deadline)))
+    except concurrent.futures.TimeoutError:
+        timed_out = True
+        report.truncate("timeout:text")
+    finally:
+        if timed_out:
+            _terminate_pool(pool)
+        else:
+            pool.shutdown(cancel_futures=True)
+    return pages
+
+
+def _terminate_pool(pool: "ProcessPoolExecutor") -> None:
+    """Shut a process pool down without waiting, killing workers still running."""
+    processes = list((pool._processes or {}).values())  # pylint: disable=protected-access
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.join()
+
+
+def _ocr_page(
+    source: ReaderInput, page_number: int, dpi: int, deadline: Optional[float] = None
+) -> str:
+    """
+    Rasterize a single (1-based) page and OCR it, keeping one image in memory.
+
+    The poppler and tesseract subprocesses are killed once `deadline` (a
+    `time.monotonic()` value) passes, so a page abandoned by a stage timeout
+    does not keep running in the background.
+    """
+    from pdf2image import convert_from_bytes, convert_from_path
+    import pytesseract
+    convert = convert_from_path if isinstance(source, str) else convert_from_bytes
+    images = convert(
+        source, dpi=dpi, first_page=page_number, last_page=page_number,
+        timeout=_subprocess_timeout(deadline),
+    )
+    return "\n".join(
+        pytesseract.image_to_string(img, timeout=_subprocess_timeout(deadline) or 0)
+        for img in images
+    )
+
+
+def _subprocess_timeout(deadline: Optional[float]) -> Optional[float]:
+    """Timeout for an external tool (never 0, which some tools read as unlimited)."""
+    remaining = _remaining(deadline)
+    return None if remaining is None else max(remaining, 0.01)
+
+
+def has_usable_text(pages: List[str], options: ReaderOptions) -> bool:
+    """
+    Whether any page has enough embedded text to stand without OCR.
+
+    When none does, OCR is required and its failures are raised; otherwise
+    a failed page is recorded in the `ReadReport` and keeps its text.
+    """
+    return any(len(page.strip()) >= options.ocr_min_chars for page in pages)
+
+
+def _ocr_pages(  # pylint: disable=too-many-arguments
+    source: ReaderInput,
+    page_indexes: List[int],
+    options: ReaderOptions,
+    report: ReadReport,
+    required: bool = True,
+) -> List[str]:
+    """
+    OCR the given (0-based) pages, running up to `options.ocr_workers` at once.
+
+    Returns results for a prefix of `page_indexes`: pages not finished
+    within `options.stage_timeout` are left out. On timeout, pages not
+    started yet are cancelled and the tools of running pages are killed at
+    the same deadline (see `_ocr_page`). Unless `required`, a page whose
+    OCR fails (e.g. poppler or tesseract is missing) gets an empty result
+    and the failure is recorded in `report`.
+    """
+    deadline = _deadline(options)
+    page_numbers = [i + 1 for i in page_indexes]
+    results: List[str] = []
+    if options.ocr_workers <= 1 or len(page_numbers) == 1:
+        for page_number in page_numbers:
+            if _expired(deadline):
+                report.truncate("timeout:ocr")
+                break
+            try:
+                results.append(_ocr_page(source, page_number, options.ocr_dpi, deadline))
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                if _expired(deadline):
+                    report.truncate("timeout:ocr")
+                    break
+                if required:
+                    raise
+                report.ocr_failed(page_number, exc)
+                results.append("")
+        return results
+
+    import concurrent.futures
+
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=options.ocr_workers)
+    timed_out = False
+    try:
+        futures = [
+            pool.submit(_ocr_page, source, n, options.ocr_dpi, deadline) for n in page_numbers
+        ]
+        for page_number, future in zip(page_numbers, futures):
+            try:
+                results.append(future.result(timeout=_remaining(deadline)))
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                if isinstance(exc, concurrent.futures.TimeoutError) or _expired(deadline):
+                    timed_out = True
+                    report.truncate("timeout:ocr")
+                    break
+                if required:
+                    raise
+                report.ocr_failed(page_number, exc)
+                results.append("")
+    finally:
+        pool.shutdown(wait=not timed_out, cancel_futures=True)
+    return results
+
+
+def read_pdf_pages(
+    source: ReaderInput,
+    options: Optional[ReaderOptions] = None,
+    report: Optional[ReadReport] = None,
+) -> List[str]:
+    """
+    Reads a PDF file and extracts the text of each page.
+
+    Attempts text extraction via `pdfplumber`, splitting long documents
+    across `options.pdf_workers` processes when requested.
+    Pages with no or too little text (e.g., scanned pages) fall back to OCR
+    using `pytesseract`, one page at a time so memory stays bounded. If OCR
+    fails (e.g. poppler or tesseract is not installed) on a document that
+    has usable embedded text elsewhere, the affected pages keep their
+    embedded text and the failure is recorded in `report`; a document with
+    no usable text at all needs OCR, so the error is raised.
+
+    Args:
+        source: Path to the PDF file, or its bytes.
+        options: Reader tuning options. Defaults to sequential extraction
+            without budgets.
+        report: Receives the budgets, if any, that cut the read short.
+
+    Returns:
+        A list with one string per page, in page order. Pages without
+        extractable text are returned as empty strings.
+    """
+    options = options or DEFAULT_OPTIONS
+    report = report if report is not None else ReadReport()
+    pages = extract_pdf_text_pages(source, options, report)
+
+    # OCR fallback, only for pages without usable embedded text
+    to_ocr = select_ocr_pages(pages, options, report)
+    if to_ocr:
+        required = not has_usable_text(pages, options)
+        merge_ocr_text(pages, to_ocr, _ocr_pages(source, to_ocr, options, report, required))
+    return pages
+
+
+def probe_pdf(source: ReaderInput, options: Optional[ReaderOptions] = None) -> Tuple[int, bool]:
+    """
+    Cheaply inspect a PDF: its page count, and whether it looks scanned.
+
+    Only the first page's text is extracted; a document is taken to be a scan
+    when that page has less embedded text than `options.ocr_min_chars`.
+
+    Args:
+        source: Path to the PDF file, or its bytes.
+        options: Reader options (`ocr_min_chars`).
+
+    Returns:
+        (page_count, scanned)
+    """
+    import pdfplumber
+
+    options = options or DEFAULT_OPTIONS
+    with pdfplumber.open(_pdf_input(source)) as pdf:
+        if not pdf.pages:
+            return 0, False
+        text = pdf.pages[0].extract_text() or ""
+        return len(pdf.pages), len(text.strip()) < options.ocr_min_chars
+
+
+def select_ocr_pages(pages: List[str], options: ReaderOptions, report: ReadReport) -> List[int]:
+    """
+    Choose the (0-based) pages to OCR: those with too little embedded text,
+    up to `options.max_ocr_pages`.
+
+    Args:
+        pages: Embedded text of each page.
+        options: Reader options (`ocr_min_chars`, `max_ocr_pages`).
+        report: Flagged when the OCR quota leaves pages out.
+
+    Returns:
+        Page indexes, in page order.
+    """
+    to_ocr = [i for i, page in enumerate(pages) if len(page.strip()) < options.ocr_min_chars]
+    if options.max_ocr_pages is not None and len(to_ocr) > options.max_ocr_pages:
+        to_ocr = to_ocr[:options.max_ocr_pages]
+        report.truncate("max_ocr_pages")
+    return to_ocr
+
+
+def merge_ocr_text(pages: List[str], page_indexes: List[int], ocr_texts: List[str]) -> None:
+    """
+    Replace page text in place with OCR output where the OCR found more.
+
+    `ocr_texts` may be shorter than `page_indexes` (e.g. after a timeout);
+    pages without a result keep their embedded text.
+    """
+    for i, ocr_text in zip(page_indexes, ocr_texts):
+        if len(ocr_text.strip()) > len(pages[i].strip()):
+            pages[i] = ocr_text
 
 
-def read_docx(file_path: str) -> str:
+def read_pdf(source: ReaderInput, options: Optional[ReaderOptions] = None) -> str:
+    """
+    Reads a PDF file and extracts text.
+
+    Args:
+        source: Path to the PDF file, or its bytes.
+        options: Reader tuning options (see `read_pdf_pages`).
+
+    Returns:
+        Extracted text as a single string.
+    """
+    return join_pages(read_pdf_pages(source, options))
+
+
+def read_docx(source: ReaderInput) -> str:
     """
     Reads a .docx file and extracts text.
 
+    Streams `word/document.xml` and the header/footer parts straight out of
+    the archive, so table cells, headers, footers and text boxes are included
+    without building a full document object model.
+
     Args:
-        file_path: Path to the DOCX file.
+        source: Path to the DOCX file, or its bytes.
 
     Returns:
         Extracted text as a single string.
     """
-    doc = Document(file_path)
-    return "\n".join(para.text for para in doc.paragraphs if para.text.strip())
+    from resume_parser.utils.markup_readers import docx_to_text
+
+    with _binary_stream(source) as stream:
+        return docx_to_text(stream)
 
 
-def read_doc(file_path: str) -> str:
+def read_doc(source: ReaderInput) -> str:
     """
     Reads a legacy .doc file using `mammoth` for text extraction.
 
     Args:
-        file_path: Path to the DOC file.
+        source: Path to the DOC file, or its bytes.
 
     Returns:
         Extracted text as a single string.
     """
-    with open(file_path, "rb") as doc_file:
+    import mammoth
+
+    with _binary_stream(source) as doc_file:
         result = mammoth.extract_raw_text(doc_file)
     return result.value.strip()
 
 
-def read_with_pandoc(file_path: str) -> str:
+def read_html(source: ReaderInput) -> str:
+    """
+    Reads an HTML file and extracts its visible text.
+
+    Args:
+        source: Path to the HTML file, or its bytes.
+
+    Returns:
+        Extracted text as a single string.
+    """
+    from resume_parser.utils.markup_readers import html_to_text
+
+    return html_to_text(_read_text(source))
+
+
+def read_markdown(source: ReaderInput) -> str:
+    """
+    Reads a Markdown file and strips its markup.
+
+    Args:
+        source: Path to the Markdown file, or its bytes.
+
+    Returns:
+        Extracted text as a single string.
+    """
+    from resume_parser.utils.markup_readers import markdown_to_text
+
+    return markdown_to_text(_read_text(source))
+
+
+def read_rtf(source: ReaderInput) -> str:
+    """
+    Reads an RTF file and extracts its text.
+
+    Args:
+        source: Path to the RTF file, or its bytes.
+
+    Returns:
+        Extracted text as a single string.
+    """
+    from resume_parser.utils.markup_readers import rtf_to_text
+
+    return rtf_to_text(_read_text(source, encoding="latin-1"))
+
+
+def read_odt(source: ReaderInput, options: Optional[ReaderOptions] = None) -> str:
+    """
+    Reads an OpenDocument Text file and extracts its text.
+
+    Falls back to Pandoc if the file is not a valid ODT archive and
+    `options.use_pandoc` is set.
+
+    Args:
+        source: Path to the ODT file, or its bytes.
+        options: Reader options (`use_pandoc`).
+
+    Returns:
+        Extracted text as a single string.
+
+    Raises:
+        ValueError: If the archive is invalid and Pandoc is not enabled or
+            cannot convert it either.
+    """
+    import zipfile
+    from xml.etree import ElementTree
+    from resume_parser.utils.markup_readers import odt_to_text
+
+    options = options or DEFAULT_OPTIONS
+    try:
+        with _binary_stream(source) as stream:
+            return odt_to_text(stream)
+    except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as exc:
+        if options.use_pandoc:
+            return read_with_pandoc(source, ".odt")
+        raise ValueError(f"Could not parse the ODT document: {exc}") from exc
+
+
+def read_with_pandoc(source: ReaderInput, ext: Optional[str] = None) -> str:
     """
     Reads various file formats using Pandoc as a converter.
 
     Supported extensions: .rtf, .odt, .md, .html, .htm.
+    Used when `ReaderOptions.use_pandoc` is set; the built-in readers are
+    the default.
 
-    Falls back to plain text reading if Pandoc is unavailable or fails.
+    Falls back to plain text reading if Pandoc is unavailable or fails,
+    except for binary formats (.odt), whose bytes are never decoded as text.
 
     Args:
-        file_path: Path to the file.
+        source: Path to the file, or its bytes.
+        ext: Format of the input (e.g. ".html"); defaults to the path's extension.
 
     Returns:
         Extracted text as a single string.
+
+    Raises:
+        ValueError: If Pandoc cannot convert a binary format.
     """
+    import pypandoc
+
+    if isinstance(source, str):
+        ext = ext or os.path.splitext(source)[1].lower()
+    try:
+        if isinstance(source, str):
+            return pypandoc.convert_file(source, "plain").strip()
+        if ext in PANDOC_BINARY_FORMATS:
+            return _convert_bytes_with_pandoc(source, ext)
+        if ext in PANDOC_FORMATS:
+            return pypandoc.convert_text(
+                _read_text(source), "plain", format=PANDOC_FORMATS[ext]
+            ).strip()
+    except (OSError, RuntimeError) as exc:
+        if ext in PANDOC_BINARY_FORMATS:
+            raise ValueError(f"Pandoc could not convert the {ext} document: {exc}") from exc
+    return _read_text(source).strip()
+
+
+def _convert_bytes_with_pandoc(data: bytes, ext: str) -> str:
+    """Convert in-memory binary input via a temporary file; pandoc reads those by path only."""
+    import tempfile
+    import pypandoc
+
+    with tempfile.NamedTemporaryFile(suffix=ext, delete=False) as f:
+        f.write(data)
     try:
-        return pypandoc.convert_file(file_path, "plain").strip()
-    except (OSError, RuntimeError):
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-            return f.read().strip()
+        return pypandoc.convert_file(f.name, "plain", format=PANDOC_FORMATS[ext]).strip()
+    finally:
+        os.remove(f.name)
 
 
-def read_txt(file_path: str) -> str:
+def read_txt(source: ReaderInput) -> str:
     """
     Reads a plain text file.
 
     Args:
-        file_path: Path to the TXT file.
+        source: Path to the TXT file, or its bytes.
 
     Returns:
         File contents as a string.
     """
-    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-        return f.read().strip()
+    return _read_text(source).strip()
+
+
+PANDOC_FORMATS = {
+    ".rtf": "rtf", ".odt": "odt", ".md": "markdown", ".html": "html", ".htm": "html",
+}
+PANDOC_EXTENSIONS = set(PANDOC_FORMATS)
+# Formats pandoc only reads from a file; they must never be read as text.
+PANDOC_BINARY_FORMATS = {".odt"}
+
+
+@dataclass(frozen=True)
+class FormatReader:
+    """
+    A registered reader for one document format.
+
+    Attributes:
+        read (Callable): Returns the document's page texts, given the source,
+            the reader options and a `ReadReport` for budget truncation.
+        cost (float): Relative cost of reading one MiB of this format (plain
+            text is 1). Lets callers route cheap formats to fast workers and
+            schedule expensive ones first.
+        fallbacks (tuple[str, ...]): Formats tried, in order, if `read` raises.
+        pandoc (bool): Whether `ReaderOptions.use_pandoc` routes this format
+            through pandoc instead.
+    """
+
+    read: Callable[[ReaderInput, ReaderOptions, ReadReport], List[str]]
+    cost: float = 1.0
+    fallbacks: Tuple[str, ...] = ()
+    pandoc: bool = False
+
+
+READERS: Dict[str, FormatReader] = {}
+
+
+def register_reader(
+    extensions: Union[str, Tuple[str, ...]],
+    read: Callable[[ReaderInput, ReaderOptions, ReadReport], List[str]],
+    cost: float = 1.0,
+    fallbacks: Tuple[str, ...] = (),
+    pandoc: bool = False,
+) -> FormatReader:
+    """
+    Register (or replace) the reader used for one or more extensions.
+
+    Extensions registered together share one entry, so they are treated as
+    the same format when checked against a sniffed signature.
+
+    Args:
+        extensions: Extension or extensions with a leading dot, e.g. ".htm".
+        read: Callable returning page texts for `(source, options, report)`.
+        cost: Relative cost hint (see `FormatReader.cost`).
+        fallbacks: Formats to try, in order, if `read` fails.
+        pandoc: Whether `use_pandoc` applies to this format.
+
+    Returns:
+        The registered FormatReader.
+    """
+    reader = FormatReader(read=read, cost=cost, fallbacks=fallbacks, pandoc=pandoc)
+    for ext in (extensions,) if isinstance(extensions, str) else extensions:
+        READERS[ext.lower()] = reader
+    return reader
+
+
+def _single_page(read_text: Callable[[ReaderInput], str]) -> Callable[..., List[str]]:
+    """Adapt a text reader to the registry's page-list signature."""
+    return lambda source, options, report: [read_text(source)]
+
+
+register_reader(".pdf", read_pdf_pages, cost=8.0)
+register_reader(".docx", _single_page(read_docx), cost=2.0, fallbacks=(".doc",))
+register_reader(".doc", _single_page(read_doc), cost=4.0)
+register_reader(
+    ".odt", lambda source, options, report: [read_odt(source, options)], cost=2.0, pandoc=True
+)
+register_reader(".rtf", _single_page(read_rtf), cost=1.5, pandoc=True)
+register_reader((".html", ".htm"), _single_page(read_html), cost=1.0, pandoc=True)
+register_reader(".md", _single_page(read_markdown), cost=1.0, pandoc=True)
+register_reader(".txt", _single_page(read_txt), cost=1.0)
+
+
+def get_reader(ext: str) -> FormatReader:
+    """
+    Look up the registered reader for an extension.
+
+    Args:
+        ext: Extension with a leading dot.
+
+    Returns:
+        The FormatReader for `ext`.
+
+    Raises:
+        ValueError: If no reader is registered for `ext`.
+    """
+    try:
+        return READERS[ext]
+    except KeyError:
+        raise ValueError(f"Unsupported file type: {ext or '(no extension)'}") from None
+
+
+def _read_format(
+    source: ReaderInput, ext: str, options: ReaderOptions, report: ReadReport
+) -> List[str]:
+    """Read `source` as `ext`, trying the format's fallbacks if it fails."""
+    reader = get_reader(ext)
+    if exceeds_byte_budget(source, options, report):
+        return []
+    if reader.pandoc and options.use_pandoc:
+        try:
+            return [read_with_pandoc(source, ext)]
+        except ValueError:
+            pass  # A binary format pandoc could not convert: use the built-in reader.
+    try:
+        return reader.read(source, options, report)
+    except Exception:  # pylint: disable=broad-exception-caught
+        for fallback in reader.fallbacks:
+            try:
+                return get_reader(fallback).read(source, options, report)
+            except Exception:  # pylint: disable=broad-exception-caught
+                continue
+        raise
 
 
-def read_resume(file_path: str) -> str:
+def read_resume(
+    source: ResumeSource,
+    cache: Optional["TextCache"] = None,
+    options: Optional[ReaderOptions] = None,
+    file_format: Optional[str] = None,
+    report: Optional[ReadReport] = None,
+) -> str:
     """
     Reads a resume file of various supported formats and returns its text content.
 
@@ -121,8 +927,20 @@ def read_resume(file_path: str) -> str:
         - .html / .htm
         - .txt
 
+    The reader is chosen from the registry (`READERS`) by the document's
+    content signature, falling back to the declared format. Markup formats
+    (.rtf, .odt, .md, .html, .htm) are read in-process unless
+    `options.use_pandoc` is set.
+
     Args:
-        file_path: Path to the resume file.
+        source: Path to the resume file, or its content as bytes, a
+            memoryview or a binary file-like object.
+        cache: Optional text cache; when given, previously extracted text for
+            identical file contents is reused instead of re-reading the file.
+        options: Reader tuning options (e.g. parallel PDF extraction).
+        file_format: Declared format of the document (e.g. "pdf"). Defaults
+            to the path's extension; overridden by a conflicting signature.
+        report: Receives the budgets, if any, that cut the read short.
 
     Returns:
         Extracted text as a single string.
@@ -130,15 +948,166 @@ def read_resume(file_path: str) -> str:
     Raises:
         ValueError: If the file extension is unsupported.
     """
-    ext = os.path.splitext(file_path)[1].lower()
-    if ext == ".pdf":
-        return read_pdf(file_path)
-    if ext == ".docx":
-        return read_docx(file_path)
-    if ext == ".doc":
-        return read_doc(file_path)
-    if ext in [".rtf", ".odt", ".md", ".html", ".htm"]:
-        return read_with_pandoc(file_path)
-    if ext == ".txt":
-        return read_txt(file_path)
-    raise ValueError(f"Unsupported file type: {ext}")
+    return join_pages(read_resume_pages(
+        source, cache=cache, options=options, file_format=file_format, report=report
+    ))
+
+
+def read_resume_pages(
+    source: ResumeSource,
+    cache: Optional["TextCache"] = None,
+    options: Optional[ReaderOptions] = None,
+    file_format: Optional[str] = None,
+    report: Optional[ReadReport] = None,
+) -> List[str]:
+    """
+    Reads a resume file and returns its text split into pages.
+
+    PDFs yield one entry per physical page; every other format is returned
+    as a single logical page.
+
+    Args:
+        source: Path to the resume file, or its content in memory.
+        cache: Optional text cache consulted before reading the file.
+        options: Reader tuning options (e.g. parallel PDF extraction).
+        file_format: Declared format of the document (see `read_resume`).
+        report: Receives the budgets, if any, that cut the read short.
+
+    Returns:
+        A list of page texts, in document order.
+
+    Raises:
+        ValueError: If the file extension is unsupported.
+    """
+    source = as_reader_input(source)
+    ext = resolve_format(source, file_format)
+    options = options or DEFAULT_OPTIONS
+    report = report if report is not None else ReadReport()
+    if cache is None:
+        return _read_format(source, ext, options, report)
+
+    # Only complete reads are cached; a hit costs nothing, so it is served
+    # in full apart from the page cap.
+    key = cache.key_for(source, f"{ext};{options.cache_variant}")
+    pages = cache.get(key)
+    if pages is None:
+        pages = _read_format(source, ext, options, report)
+        if not report.truncated:
+            cache.put(key, pages)
+    elif options.max_pages is not None and len(pages) > options.max_pages:
+        pages = pages[:options.max_pages]
+        report.truncate("max_pages")
+    return pages
+
+
+def iter_pdf_pages(
+    source: ReaderInput,
+    options: Optional[ReaderOptions] = None,
+    report: Optional[ReadReport] = None,
+) -> Iterator[str]:
+    """
+    Lazily yields the text of each PDF page, OCR-ing scanned pages on demand.
+
+    Pages are only parsed (and OCR'd) when requested, so a consumer that stops
+    early never pays for the remaining pages.
+
+    Args:
+        source: Path to the PDF file, or its bytes.
+        options: Reader tuning options (OCR threshold, DPI and budgets are
+            honoured; pages are always read sequentially, and the stage
+            timeout counts from the first page).
+        report: Receives the budgets, if any, that cut the read short.
+
+    Yields:
+        The text of each page, in page order. A page whose OCR fails keeps
+        its embedded text and the failure is recorded in `report`; the
+        first such error is raised at the end if no page had usable text.
+    """
+    import pdfplumber
+
+    options = options or DEFAULT_OPTIONS
+    report = report if report is not None else ReadReport()
+    if exceeds_byte_budget(source, options, report):
+        return
+    deadline = _deadline(options)
+    ocr_pages = 0
+    usable = False
+    ocr_error: Optional[Exception] = None
+    with pdfplumber.open(_pdf_input(source)) as pdf:
+        for page_number, page in enumerate(pdf.pages, 1):
+            if options.max_pages is not None and page_number > options.max_pages:
+                report.truncate("max_pages")
+                return
+            if _expired(deadline):
+                report.truncate("timeout:text")
+                return
+            text = page.extract_text() or ""
+            if len(text.strip()) < options.ocr_min_chars:
+                if options.max_ocr_pages is not None and ocr_pages >= options.max_ocr_pages:
+                    report.truncate("max_ocr_pages")
+                    yield text
+                    continue
+                ocr_pages += 1
+                try:
+                    ocr_text = _ocr_page(source, page_number, options.ocr_dpi, deadline)
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    if _expired(deadline):
+                        report.truncate("timeout:ocr")
+                    else:
+                        report.ocr_failed(page_number, exc)
+                        ocr_error = ocr_error or exc
+                    ocr_text = ""
+                if len(ocr_text.strip()) > len(text.strip()):
+                    text = ocr_text
+            usable = usable or len(text.strip()) >= options.ocr_min_chars
+            yield text
+    if ocr_error is not None and not usable:
+        raise ocr_error
+
+
+def iter_resume_pages(
+    source: ResumeSource,
+    options: Optional[ReaderOptions] = None,
+    file_format: Optional[str] = None,
+    report: Optional[ReadReport] = None,
+) -> Iterator[str]:
+    """
+    Lazily yields the text of a resume, page by page.
+
+    PDFs are read one page at a time; every other format is yielded as a
+    single logical chunk.
+
+    Args:
+        source: Path to the resume file, or its content in memory.
+        options: Reader tuning options.
+        file_format: Format of the document (see `read_resume`).
+        report: Receives the budgets, if any, that cut the read short.
+
+    Yields:
+        Page texts, in document order.
+
+    Raises:
+        ValueError: If the file extension is unsupported.
+    """
+    source = as_reader_input(source)
+    ext = resolve_format(source, file_format)
+    report = report if report is not None else ReadReport()
+    if get_reader(ext).read is read_pdf_pages:
+        yield from iter_pdf_pages(source, options, report)
+    else:
+        yield from _read_format(source, ext, options or DEFAULT_OPTIONS, report)
+
+
+def join_pages(pages: List[str]) -> str:
+    """
+    Joins per-page text into a single document string.
+
+    Empty pages are skipped so the result matches a sequential read.
+
+    Args:
+        pages: Page texts in document order.
+
+    Returns:
+        The combined text, stripped of leading/trailing whitespace.
+    """
+    return "\n".join(page for page in pages if page).strip()
@@ -0,0 +1,252 @@
+"""
+fuzzy_matcher.py
+
+Typo-tolerant skill matching on top of the exact `SkillMatcher`.
+
+Exact matching misses misspellings ("Kubernets", "Postgress") and tokens
+split by PDF extraction or spacing ("Pyth on", "Tensor Flow"). The fuzzy
+matcher runs the exact scan first, then looks at the words it did not cover:
+each run of one to `max_words` adjacent words is joined without separators
+and looked up in a character trigram index over every name and alias. Only
+vocabulary entries that share the first letter and enough trigrams, and have
+a similar length, are verified with a bounded edit distance. The trigram
+index is partitioned by first letter, so a lookup only counts a small share
+of the vocabulary. Lookups are memoized per distinct window, so repeated
+words cost one dictionary hit.
+
+Entries shorter than `min_length` characters or with a one-letter part
+("Objective-C") are never matched fuzzily, and neither are words shorter
+than `min_length` ("panda" is not taken for "Pandas"). Up to one edit is
+allowed below ten characters and two from ten on (a swap of adjacent
+letters counts as one edit).
+
+Measured with `benchmarks/fuzzy_matcher_benchmark.py` (300 synthetic
+resumes, 15 skills each, 30% damaged), a scan costs about 2.5-3x the exact
+scan whether the vocabulary has 400 or 20,000 aliases. It recovers 92-96% of
+the damaged names, and about one resume in 100 gets a skill that was never
+planted.
+
+Typical Usage:
+    from resume_parser.utils.fuzzy_matcher import FuzzySkillMatcher
+    from resume_parser.utils.skills_index import get_skills_index
+
+    matcher = FuzzySkillMatcher(get_skills_index().matcher)
+    matcher.match("Deployed on Kubernets with Postgress")
+    # {("Cloud & DevOps", "Kubernetes"), ("Databases", "PostgreSQL"), ...}
+
+    SkillsChecker(fuzzy=True).extract_general_skills("resume.pdf")
+
+Classes:
+    FuzzySkillMatcher:
+        Exact scan plus trigram-index lookups for near misses.
+"""
+
+import re
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from resume_parser.utils.skill_matcher import SkillKey, SkillMatcher, fold_case
+
+_WORD_RE = re.compile(r"[^\W_]+")
+# Separators that may sit inside a broken or spaced-out skill name.
+_JOINABLE_GAPS = {" ", "\t", "-", "."}
+_CACHE_LIMIT = 65536
+
+
+def _compact(text: str) -> str:
+    """Keep only letters and digits: "Node.js" -> "nodejs"."""
+    return "".join(_WORD_RE.findall(text))
+
+
+def _trigrams(key: str) -> Set[str]:
+    """Padded character trigrams of a compact key."""
+    padded = f"^{key}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _max_edits(length: int) -> int:
+    """Edits tolerated for a key of this length."""
+    return 1 if length < 10 else 2
+
+
+def _distance(left: str, right: str, limit: int) -> int:
+    """
+    Edit distance with adjacent transpositions, or ``limit + 1`` once it is
+    certain to exceed `limit`.
+    """
+    if abs(len(left) - len(right)) > limit:
+        return limit + 1
+    previous2: List[int] = []
+    previous = list(range(len(right) + 1))
+    for i, char in enumerate(left, 1):
+        current = [i] + [0] * len(right)
+        for j, other in enumerate(right, 1):
+            cost = 0 if char == other else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (i > 1 and j > 1 and char == right[j - 2] and left[i - 2] == other):
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return min(previous[-1], limit + 1)
+
+
+class FuzzySkillMatcher:  # pylint: disable=too-many-instance-attributes
+    """
+    Skill matcher that also accepts near misses of names and aliases.
+
+    It exposes the same `patterns`, `owners`, `scan` and `match` as
+    `SkillMatcher`, so `SkillsChecker` can use either.
+
+    Attributes:
+        exact (SkillMatcher): The exact automaton, run first.
+        patterns (list[str]): Same as `exact.patterns`.
+        owners (list[list[tuple[str, str]]]): Same as `exact.owners`.
+        max_words (int): Most adjacent words joined into one candidate.
+        min_length (int): Shortest compact name, alias or word run matched fuzzily.
+    """
+
+    def __init__(self, exact: SkillMatcher, max_words: int = 2, min_length: int = 6) -> None:
+        """
+        Build the trigram index over the vocabulary of `exact`.
+
+        Args:
+            exact (SkillMatcher): Compiled exact matcher.
+            max_words (int): Most adjacent words joined into one candidate
+                ("Tensor Flow" needs 2).
+            min_length (int): Shortest compact name or alias (letters and
+                digits only), and shortest run of words, eligible for fuzzy
+                matching.
+        """
+        self.exact = exact
+        self.patterns = exact.patterns
+        self.owners = exact.owners
+        self.max_words = max_words
+        self.min_length = min_length
+
+        # Compact key -> pattern ids, and (first letter, trigram) -> keys
+        # starting with that letter and containing that trigram, so a lookup
+        # only counts candidates that can pass the first-letter rule.
+        # Names with a one-character part ("Objective-C") are left out: a
+        # single edit would drop that part and match the bare word.
+        self._keys: Dict[str, List[int]] = {}
+        for pattern_id, pattern in enumerate(self.patterns):
+            key = _compact(pattern)
+            parts = _WORD_RE.findall(pattern)
+            if len(key) >= min_length and min(map(len, parts)) > 1:
+                self._keys.setdefault(key, []).append(pattern_id)
+        self._grams: Dict[Tuple[str, str], List[str]] = {}
+        for key in self._keys:
+            for gram in _trigrams(key):
+                self._grams.setdefault((key[0], gram), []).append(key)
+        self._lengths = (min(map(len, self._keys), default=0), max(map(len, self._keys), default=0))
+        self._cache: Dict[str, Optional[str]] = {}
+
+    def __getstate__(self) -> Dict[str, object]:
+        state = dict(self.__dict__)
+        state["_cache"] = {}
+        return state
+
+    def lookup(self, word: str) -> Optional[str]:
+        """
+        Return the vocabulary key closest to a compact word, if any is close enough.
+
+        Args:
+            word (str): Lowercased letters and digits.
+
+        Returns:
+            str | None: The best key (fewest edits, then shortest), or None.
+        """
+        if word in self._cache:
+            return self._cache[word]
+        best = None
+        shortest, longest = self._lengths
+        limit = _max_edits(len(word))
+        if len(word) >= self.min_length and shortest - limit <= len(word) <= longest + limit:
+            grams = _trigrams(word)
+            shared: Dict[str, int] = {}
+            for gram in grams:
+                for key in self._grams.get((word[0], gram), ()):
+                    shared[key] = shared.get(key, 0) + 1
+            best_distance = limit + 1
+            # One edit (or swap) changes at most four of the word's trigrams.
+            least = len(grams) - 4 * limit
+            for key, count in shared.items():
+                if count < least:
+                    continue
+                allowed = min(limit, _max_edits(len(key)))
+                if abs(len(key) - len(word)) > allowed or count < len(grams) - 4 * allowed:
+                    continue
+                distance = _distance(word, key, allowed)
+                if distance <= allowed and (distance, len(key)) < (best_distance, len(best or key)):
+                    best, best_distance = key, distance
+        if len(self._cache) >= _CACHE_LIMIT:
+            self._cache.clear()
+        self._cache[word] = best
+        return best
+
+    def scan(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        Find exact and near-miss occurrences in `text`.
+
+        Args:
+            text (str): Lowercased text, as for `SkillMatcher.scan`.
+
+        Yields:
+            tuple[int, int, int]: (start, end, pattern id), in order of `end`.
+            A near miss is reported under the first pattern with the matched
+            key and never overlaps an exact match.
+        """
+        exact = list(self.exact.scan(text))
+        covered = bytearray(len(text))
+        for start, end, _ in exact:
+            covered[start:end] = b"\x01" * (end - start)
+        words = [m.span() for m in _WORD_RE.finditer(text)]
+        fuzzy: List[Tuple[int, int, int]] = []
+        position = 0
+        while position < len(words):
+            found = self._match_at(text, words, position, covered)
+            if found is None:
+                position += 1
+                continue
+            count, pattern_id = found
+            fuzzy.append((words[position][0], words[position + count - 1][1], pattern_id))
+            position += count
+        yield from sorted(exact + fuzzy, key=lambda hit: (hit[1], hit[0]))
+
+    def _match_at(
+        self, text: str, words: List[Tuple[int, int]], position: int, covered: bytearray
+    ) -> Optional[Tuple[int, int]]:
+        """Longest run of words starting at `position` that is a near miss."""
+        best = None
+        joined = ""
+        for count in range(1, self.max_words + 1):
+            index = position + count - 1
+            if index >= len(words):
+                break
+            start, end = words[index]
+            if count > 1 and text[words[index - 1][1]:start] not in _JOINABLE_GAPS:
+                break
+            if any(covered[start:end]):
+                break
+            joined += text[start:end]
+            if len(joined) < self.min_length:
+                continue
+            key = self.lookup(joined)
+            if key is not None:
+                best = (count, self._keys[key][0])
+        return best
+
+    def match(self, text: str) -> Set[SkillKey]:
+        """
+        Return every skill mentioned in `text`, allowing near misses.
+
+        Args:
+            text (str): Resume text (any case).
+
+        Returns:
+            set[tuple[str, str]]: (category, skill name) pairs that were found.
+        """
+        found: Set[SkillKey] = set()
+        for _, _, pattern_id in self.scan(fold_case(text)):
+            found.update(self.owners[pattern_id])
+        return found
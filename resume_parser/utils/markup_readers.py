@@ -0,0 +1,528 @@
+"""
+markup_readers.py
+
+In-process text extraction for markup-based resume formats, built on the
+standard library only: HTML (`html.parser`), Markdown (a lightweight
+stripper), RTF (a control-word tokenizer), and ODT and DOCX (zipfile plus
+streaming XML parsing).
+
+These avoid spawning a pandoc subprocess per file. Their output follows the
+conventions the extractors rely on: one paragraph per line, list items
+prefixed with "• " and table cells separated by " | ".
+
+Functions:
+    html_to_text(html: str) -> str
+    markdown_to_text(markdown: str) -> str
+    rtf_to_text(rtf: str) -> str
+    odt_to_text(file) -> str
+    docx_to_text(file) -> str
+"""
+
+import re
+import zipfile
+from html.parser import HTMLParser
+from typing import IO, List, Optional, Union
+from xml.etree import ElementTree
+
+BULLET = "• "
+CELL_SEPARATOR = " | "
+
+
+def _tidy_lines(text: str) -> str:
+    """Strip each line and collapse runs of blank lines into one."""
+    lines = [ln.strip() for ln in text.splitlines()]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+# --------------------------
+# HTML
+# --------------------------
+_HTML_BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3",
+    "h4", "h5", "h6", "header", "hr", "main", "nav", "ol", "p", "pre",
+    "section", "table", "tbody", "thead", "tfoot", "tr", "ul",
+}
+_HTML_SKIP_TAGS = {"head", "script", "style", "template", "noscript", "svg"}
+
+
+class _HTMLTextParser(HTMLParser):
+    """Collects the visible text of an HTML document, one block per line."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skip_depth = 0
+        self._pre_depth = 0
+        self._cells_in_row = 0
+
+    def _newline(self) -> None:
+        if self.parts and not self.parts[-1].endswith("\n"):
+            self.parts.append("\n")
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _HTML_SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag == "br":
+            self.parts.append("\n")
+        elif tag == "li":
+            self._newline()
+            self.parts.append(BULLET)
+        elif tag in ("td", "th"):
+            if self._cells_in_row:
+                self.parts.append(CELL_SEPARATOR)
+            self._cells_in_row += 1
+        elif tag in _HTML_BLOCK_TAGS:
+            self._newline()
+            if tag == "tr":
+                self._cells_in_row = 0
+            elif tag == "pre":
+                self._pre_depth += 1
+
+    def handle_startendtag(self, tag, attrs):
+        if tag == "br":
+            self.parts.append("\n")
+        elif tag == "hr":
+            self._newline()
+
+    def handle_endtag(self, tag):
+        if tag in _HTML_SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in _HTML_BLOCK_TAGS or tag == "li":
+            self._newline()
+            if tag == "pre":
+                self._pre_depth = max(0, self._pre_depth - 1)
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        if not self._pre_depth:
+            data = re.sub(r"\s+", " ", data)
+            if self.parts and self.parts[-1].endswith(("\n", " ")):
+                data = data.lstrip()
+        if data:
+            self.parts.append(data)
+
+
+def html_to_text(html: str) -> str:
+    """
+    Extract visible text from an HTML document.
+
+    Args:
+        html (str): HTML source.
+
+    Returns:
+        str: Plain text with one block element per line.
+    """
+    parser = _HTMLTextParser()
+    parser.feed(html)
+    parser.close()
+    return _tidy_lines("".join(parser.parts))
+
+
+# --------------------------
+# Markdown
+# --------------------------
+_MD_FENCE = re.compile(r"^\s*(```|~~~)")
+_MD_RULE = re.compile(r"^\s*([-*_])(\s*\1){2,}\s*$")
+_MD_SETEXT = re.compile(r"^\s*(=+|-+)\s*$")
+_MD_TABLE_DIVIDER = re.compile(r"^\s*\|?\s*:?-{3,}:?\s*(\|\s*:?-{3,}:?\s*)*\|?\s*$")
+_MD_HEADING = re.compile(r"^\s{0,3}#{1,6}\s+(.*?)\s*#*\s*$")
+_MD_BULLET = re.compile(r"^(\s*)[-*+]\s+")
+_MD_QUOTE = re.compile(r"^\s*(>\s?)+")
+_MD_IMAGE = re.compile(r"!\[([^\]]*)\]\([^)]*\)")
+_MD_LINK = re.compile(r"\[([^\]]+)\]\(\s*<?([^)\s>]+)>?(?:\s+\"[^\"]*\")?\s*\)")
+_MD_AUTOLINK = re.compile(r"<((?:https?://|mailto:)[^>]+)>")
+_MD_CODE = re.compile(r"`+([^`]*)`+")
+_MD_EMPHASIS = re.compile(r"(\*{1,3})(?=\S)(.+?)(?<=\S)\1")
+_MD_UNDERSCORE_EMPHASIS = re.compile(r"(?<!\w)(_{1,3})(?=\S)(.+?)(?<=\S)\1(?!\w)")
+_MD_STRIKE = re.compile(r"~~(.+?)~~")
+_HTML_TAG = re.compile(r"</?[A-Za-z][^>]*>")
+
+
+def _markdown_link(match: "re.Match[str]") -> str:
+    label, url = match.group(1), match.group(2)
+    if url.startswith("mailto:"):
+        url = url[len("mailto:"):]
+    return label if label == url else f"{label} ({url})"
+
+
+def _markdown_inline(line: str) -> str:
+    line = _MD_IMAGE.sub(r"\1", line)
+    line = _MD_LINK.sub(_markdown_link, line)
+    line = _MD_AUTOLINK.sub(r"\1", line)
+    line = _MD_CODE.sub(r"\1", line)
+    line = _MD_STRIKE.sub(r"\1", line)
+    line = _MD_EMPHASIS.sub(r"\2", line)
+    line = _MD_UNDERSCORE_EMPHASIS.sub(r"\2", line)
+    line = _HTML_TAG.sub("", line)
+    return re.sub(r"\\([\\`*_{}\[\]()#+\-.!|])", r"\1", line)
+
+
+def markdown_to_text(markdown: str) -> str:
+    """
+    Strip Markdown syntax, keeping the readable text.
+
+    Headings, emphasis, code and quote markers are removed, links become
+    "label (url)", bullets become "• " and table pipes are kept as cell
+    separators.
+
+    Args:
+        markdown (str): Markdown source.
+
+    Returns:
+        str: Plain text.
+    """
+    out: List[str] = []
+    in_fence = False
+    for line in markdown.replace("\r\n", "\n").replace("\r", "\n").split("\n"):
+        if _MD_FENCE.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            out.append(line)
+            continue
+        if _MD_TABLE_DIVIDER.match(line) and "|" in line:
+            continue
+        if _MD_RULE.match(line) or (_MD_SETEXT.match(line) and out and out[-1].strip()):
+            out.append("")
+            continue
+
+        heading = _MD_HEADING.match(line)
+        if heading:
+            line = heading.group(1)
+        line = _MD_QUOTE.sub("", line)
+        line = _MD_BULLET.sub(lambda m: m.group(1) + BULLET, line)
+        if line.strip().startswith("|"):
+            cells = [c.strip() for c in line.strip().strip("|").split("|")]
+            line = CELL_SEPARATOR.join(cells)
+        out.append(_markdown_inline(line))
+    return _tidy_lines("\n".join(out))
+
+
+# --------------------------
+# RTF
+# --------------------------
+_RTF_TOKEN = re.compile(
+    r"\\([a-zA-Z]{1,32})(-?\d{1,10})? ?"   # control word with optional parameter
+    r"|\\'([0-9a-fA-F]{2})"                # hex-escaped byte
+    r"|\\([^a-zA-Z])"                      # control symbol
+    r"|([{}])"                             # group delimiters
+    r"|[\r\n]+"                            # raw newlines (ignored in RTF)
+    r"|([^\\{}\r\n]+)",                    # plain text run
+)
+_RTF_DESTINATIONS = {
+    "aftncn", "aftnsep", "aftnsepc", "annotation", "atnauthor", "atndate",
+    "atnicn", "atnid", "atnparent", "atnref", "atntime", "atrfend",
+    "atrfstart", "author", "background", "bkmkend", "bkmkstart", "buptim",
+    "category", "colortbl", "comment", "company", "creatim", "datafield",
+    "datastore", "do", "doccomm", "docvar", "dptxbxtext", "falt",
+    "fchars", "ffdeftext", "ffentrymcr", "ffexitmcr", "ffformat", "ffhelptext",
+    "ffl", "ffname", "ffstattext", "field_inst", "filetbl", "fldinst",
+    "fldtype", "fname", "fontemb", "fontfile", "fonttbl", "footnote",
+    "formfield", "ftncn", "ftnsep", "ftnsepc", "g", "generator", "gridtbl",
+    "hlinkbase", "info", "keycode", "keywords", "latentstyles", "lchars",
+    "levelnumbers", "leveltext", "lfolevel", "linkval", "list",
+    "listlevel", "listname", "listoverride", "listoverridetable",
+    "listpicture", "liststylename", "listtable", "listtext", "lsdlockedexcept",
+    "macc", "manager", "mhtmltag", "nesttableprops", "nonshppict",
+    "objalias", "objclass", "objdata", "object", "objname", "objsect",
+    "objtime", "oldcprops", "oldpprops", "oldsprops", "oldtprops",
+    "operator", "panose", "password", "passwordhash", "pgp", "pgptbl",
+    "picprop", "pict", "pn", "pnseclvl", "pntext", "pntxta", "pntxtb",
+    "printim", "private", "propname", "protend", "protstart", "protusertbl",
+    "pxe", "result", "revtbl", "revtim", "rsidtbl", "rxe",
+    "shppict", "shprslt", "sn", "sp", "staticval",
+    "stylesheet", "subject", "sv", "svb", "tc", "template", "themedata",
+    "title", "txe", "ud", "upr", "userprops", "wgrffmtfilter",
+    "windowcaption", "writereservation", "writereservhash", "xe", "xform",
+    "xmlattrname", "xmlattrvalue", "xmlclose", "xmlname", "xmlnstbl",
+    "xmlopen",
+}
+_RTF_SPECIAL = {
+    "par": "\n", "sect": "\n\n", "page": "\n\n", "line": "\n", "row": "\n",
+    "tab": "\t", "cell": CELL_SEPARATOR, "emdash": "\u2014", "endash": "\u2013",
+    "emspace": " ", "enspace": " ", "qmspace": " ", "bullet": "\u2022",
+    "lquote": "\u2018", "rquote": "\u2019", "ldblquote": "\u201c",
+    "rdblquote": "\u201d",
+}
+
+
+def rtf_to_text(rtf: str, encoding: str = "cp1252") -> str: # pylint: disable=too-many-locals, too-many-statements, too-many-branches
+    """
+    Extract plain text from an RTF document with a control-word tokenizer.
+
+    Formatting groups (font/colour tables, pictures, metadata and other
+    ignorable destinations) are skipped; paragraph and line controls become
+    newlines and Unicode escapes are decoded.
+
+    Args:
+        rtf (str): RTF source, decoded as Latin-1 so bytes survive unchanged.
+        encoding (str): Code page for `\\'hh` escapes. Overridden by an
+            `\\ansicpg` control word in the document.
+
+    Returns:
+        str: Plain text.
+    """
+    stack: List[tuple] = []
+    ignorable = False
+    uc_skip = 1          # characters to skip after a \uN escape (\ucN)
+    pending_skip = 0
+    out: List[str] = []
+    hex_bytes = bytearray()
+
+    def flush_hex() -> None:
+        if hex_bytes:
+            if not ignorable:
+                out.append(hex_bytes.decode(encoding, errors="replace"))
+            hex_bytes.clear()
+
+    for match in _RTF_TOKEN.finditer(rtf):
+        word, param, hex_code, symbol, brace, text = match.groups()
+        if hex_code is not None:
+            if pending_skip:
+                pending_skip -= 1
+            else:
+                hex_bytes.append(int(hex_code, 16))
+            continue
+        flush_hex()
+
+        if brace == "{":
+            stack.append((ignorable, uc_skip))
+        elif brace == "}":
+            if stack:
+                ignorable, uc_skip = stack.pop()
+        elif symbol is not None:
+            if symbol == "*":
+                ignorable = True
+            elif not ignorable and symbol in "\\{}":
+                out.append(symbol)
+            elif not ignorable and symbol == "~":
+                out.append("\u00a0")
+            elif not ignorable and symbol in "\r\n":
+                out.append("\n")
+            elif not ignorable and symbol in "-_":
+                out.append("-" if symbol == "_" else "")
+        elif word is not None:
+            pending_skip = 0
+            if word in _RTF_DESTINATIONS:
+                ignorable = True
+            elif word == "ansicpg" and param:
+                encoding = f"cp{param}"
+            elif word == "uc" and param is not None:
+                uc_skip = int(param)
+            elif ignorable:
+                continue
+            elif word in _RTF_SPECIAL:
+                out.append(_RTF_SPECIAL[word])
+            elif word == "u" and param is not None:
+                code = int(param)
+                out.append(chr(code + 0x10000 if code < 0 else code))
+                pending_skip = uc_skip
+        elif text is not None:
+            if pending_skip:
+                skipped = min(pending_skip, len(text))
+                text = text[skipped:]
+                pending_skip -= skipped
+            if not ignorable:
+                out.append(text)
+    flush_hex()
+    return _tidy_lines("".join(out))
+
+
+# --------------------------
+# ODT
+# --------------------------
+_ODF_TEXT_NS = "urn:oasis:names:tc:opendocument:xmlns:text:1.0"
+_ODF_TABLE_NS = "urn:oasis:names:tc:opendocument:xmlns:table:1.0"
+_ODF_PARAGRAPHS = {f"{{{_ODF_TEXT_NS}}}p", f"{{{_ODF_TEXT_NS}}}h"}
+_ODF_LIST_ITEM = f"{{{_ODF_TEXT_NS}}}list-item"
+_ODF_TABLE_ROW = f"{{{_ODF_TABLE_NS}}}table-row"
+_ODF_TABLE_CELL = f"{{{_ODF_TABLE_NS}}}table-cell"
+
+
+def _odf_inline_text(elem: ElementTree.Element) -> str:
+    """Flatten the inline content of an ODF paragraph element."""
+    parts = [elem.text or ""]
+    for child in elem:
+        tag = child.tag
+        if tag == f"{{{_ODF_TEXT_NS}}}s":
+            parts.append(" " * int(child.get(f"{{{_ODF_TEXT_NS}}}c", "1")))
+        elif tag == f"{{{_ODF_TEXT_NS}}}tab":
+            parts.append("\t")
+        elif tag == f"{{{_ODF_TEXT_NS}}}line-break":
+            parts.append("\n")
+        elif tag not in (f"{{{_ODF_TEXT_NS}}}note", f"{{{_ODF_TEXT_NS}}}annotation"):
+            parts.append(_odf_inline_text(child))
+        parts.append(child.tail or "")
+    return "".join(parts)
+
+
+def odt_to_text(file: Union[str, IO[bytes]]) -> str: # pylint: disable=too-many-branches
+    """
+    Extract text from an OpenDocument Text file by streaming `content.xml`.
+
+    Paragraphs and headings are emitted in document order; list items are
+    prefixed with "• " and cells of a table row are joined with " | ".
+
+    Args:
+        file: Path to the .odt file, or a binary file-like object.
+
+    Returns:
+        str: Plain text.
+    """
+    lines: List[str] = []
+    row_cells: Optional[List[str]] = None
+    cell_parts: List[str] = []
+    depth_in_cell = 0
+    list_item_pending = False
+
+    with zipfile.ZipFile(file) as archive, archive.open("content.xml") as content:
+        for event, elem in ElementTree.iterparse(content, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                if tag == _ODF_TABLE_ROW:
+                    row_cells = []
+                elif tag == _ODF_TABLE_CELL:
+                    depth_in_cell += 1
+                    cell_parts = []
+                elif tag == _ODF_LIST_ITEM:
+                    list_item_pending = True
+                continue
+
+            if tag in _ODF_PARAGRAPHS:
+                text = _odf_inline_text(elem).strip()
+                if depth_in_cell:
+                    if text:
+                        cell_parts.append(text)
+                elif text:
+                    lines.append((BULLET if list_item_pending else "") + text)
+                    list_item_pending = False
+                elem.clear()
+            elif tag == _ODF_TABLE_CELL:
+                depth_in_cell -= 1
+                if row_cells is not None:
+                    row_cells.append(" ".join(cell_parts))
+            elif tag == _ODF_TABLE_ROW:
+                if row_cells and any(row_cells):
+                    lines.append(CELL_SEPARATOR.join(c for c in row_cells if c))
+                row_cells = None
+                elem.clear()
+            elif tag == _ODF_LIST_ITEM:
+                list_item_pending = False
+    return _tidy_lines("\n".join(lines))
+
+
+# --------------------------
+# DOCX
+# --------------------------
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_MC_NS = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+_W_P = f"{{{_W_NS}}}p"
+_W_T = f"{{{_W_NS}}}t"
+_W_TAB = f"{{{_W_NS}}}tab"
+_W_BREAKS = {f"{{{_W_NS}}}br", f"{{{_W_NS}}}cr"}
+_W_NO_BREAK_HYPHEN = f"{{{_W_NS}}}noBreakHyphen"
+_W_NUM_PR = f"{{{_W_NS}}}numPr"
+_W_TR = f"{{{_W_NS}}}tr"
+_W_TC = f"{{{_W_NS}}}tc"
+_W_TBL = f"{{{_W_NS}}}tbl"
+_MC_FALLBACK = f"{{{_MC_NS}}}Fallback"
+_DOCX_HEADER_PART = re.compile(r"^word/header\d*\.xml$")
+_DOCX_FOOTER_PART = re.compile(r"^word/footer\d*\.xml$")
+
+
+def _docx_part_lines(stream: IO[bytes]) -> List[str]: # pylint: disable=too-many-branches
+    """
+    Stream one WordprocessingML part and return its text lines in document order.
+
+    Paragraphs nested in text boxes are emitted as their own lines; the
+    VML fallback copy of each text box (inside `mc:Fallback`) is skipped.
+    """
+    lines: List[str] = []
+    paragraphs: List[List[str]] = []     # open paragraphs (text boxes nest)
+    rows: List[List[str]] = []           # open table rows (tables nest)
+    cells: List[List[str]] = []          # open table cells
+    fallback_depth = 0
+
+    def emit(text: str) -> None:
+        if not text:
+            return
+        if cells:
+            cells[-1].append(text)
+        else:
+            lines.append(text)
+
+    for event, elem in ElementTree.iterparse(stream, events=("start", "end")):
+        tag = elem.tag
+        if tag == _MC_FALLBACK:
+            fallback_depth += 1 if event == "start" else -1
+            continue
+        if fallback_depth:
+            if event == "end" and tag in (_W_P, _W_TBL):
+                elem.clear()
+            continue
+
+        if event == "start":
+            if tag == _W_P:
+                paragraphs.append([])
+            elif tag == _W_TR:
+                rows.append([])
+            elif tag == _W_TC:
+                cells.append([])
+            continue
+
+        if tag == _W_T and paragraphs:
+            paragraphs[-1].append(elem.text or "")
+        elif tag == _W_TAB and paragraphs:
+            paragraphs[-1].append("\t")
+        elif tag in _W_BREAKS and paragraphs:
+            paragraphs[-1].append("\n")
+        elif tag == _W_NO_BREAK_HYPHEN and paragraphs:
+            paragraphs[-1].append("-")
+        elif tag == _W_P:
+            text = "".join(paragraphs.pop()).strip()
+            if text and elem.find(f"{{{_W_NS}}}pPr/{_W_NUM_PR}") is not None:
+                text = BULLET + text
+            emit(text)
+            elem.clear()
+        elif tag == _W_TC:
+            text = " ".join(cells.pop())
+            if rows:
+                rows[-1].append(text)
+        elif tag == _W_TR:
+            emit(CELL_SEPARATOR.join(c for c in rows.pop() if c))
+        elif tag == _W_TBL:
+            elem.clear()
+    return lines
+
+
+def docx_to_text(file: Union[str, IO[bytes]]) -> str:
+    """
+    Extract text from a .docx file by streaming its XML parts.
+
+    Headers come first, then the document body (paragraphs, tables and text
+    boxes in document order), then footers. Identical header or footer parts
+    (e.g. first-page and default variants) are only included once.
+
+    Args:
+        file: Path to the .docx file, or a binary file-like object.
+
+    Returns:
+        str: Plain text, one paragraph or table row per line.
+    """
+    with zipfile.ZipFile(file) as archive:
+        names = sorted(archive.namelist())
+        parts = (
+            [n for n in names if _DOCX_HEADER_PART.match(n)]
+            + ["word/document.xml"]
+            + [n for n in names if _DOCX_FOOTER_PART.match(n)]
+        )
+
+        blocks: List[str] = []
+        for name in parts:
+            with archive.open(name) as stream:
+                block = "\n".join(_docx_part_lines(stream))
+            if block and block not in blocks:
+                blocks.append(block)
+    return "\n".join(blocks).strip()
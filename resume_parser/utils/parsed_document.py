@@ -0,0 +1,200 @@
+"""
+parsed_document.py
+
+Defines the ParsedDocument model: the result of reading a resume once so that
+every extractor can share the same text instead of re-reading (and re-OCRing)
+the source file.
+
+Typical Usage:
+    from resume_parser.utils.parsed_document import ParsedDocument
+
+    document = ParsedDocument.from_file("resume.pdf")
+    summary = SummaryExtractor().extract(document)
+    contact = ContactExtractor().extract(document)
+
+    # Uploaded content can be parsed without touching the filesystem:
+    document = ParsedDocument.from_source(request_body, file_format="pdf")
+
+Functions:
+    load_document(source) -> ParsedDocument:
+        Returns `source` unchanged if it is already parsed, otherwise reads it.
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+from resume_parser.utils.file_reader import (
+    ReadReport,
+    ReaderOptions,
+    ResumeSource,
+    as_reader_input,
+    join_pages,
+    read_resume_pages,
+    resolve_format,
+)
+from resume_parser.utils.text_normalizer import normalize_whitespace
+
+if TYPE_CHECKING:
+    from resume_parser.utils.text_cache import TextCache
+
+
+@dataclass(frozen=True)
+class ParsedDocument:
+    """
+    Text content of a resume, extracted once and shared between extractors.
+
+    Attributes:
+        raw_text (str): Text as returned by the file reader.
+        normalized_text (str): `raw_text` after whitespace normalization.
+        pages (list[str]): Per-page text (a single entry for non-paginated formats).
+        metadata (dict): Information about the source, e.g. "source", "extension"
+            and "page_count". Documents read from a file also record
+            "truncated" and, when a reader budget was hit, "truncated_by".
+    """
+
+    raw_text: str
+    normalized_text: str
+    pages: List[str] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_pages(cls, pages: List[str], **metadata: Any) -> "ParsedDocument":
+        """
+        Build a document from already-extracted page text.
+
+        Args:
+            pages (list[str]): Page texts in document order.
+            **metadata: Extra metadata to attach to the document.
+
+        Returns:
+            ParsedDocument: The assembled document.
+        """
+        raw_text = join_pages(pages)
+        metadata.setdefault("page_count", len(pages))
+        return cls(
+            raw_text=raw_text,
+            normalized_text=normalize_whitespace(raw_text),
+            pages=list(pages),
+            metadata=metadata,
+        )
+
+    @classmethod
+    def from_text(cls, text: str, **metadata: Any) -> "ParsedDocument":
+        """
+        Build a single-page document from plain text.
+
+        Args:
+            text (str): The resume text.
+            **metadata: Extra metadata to attach to the document.
+
+        Returns:
+            ParsedDocument: The assembled document.
+        """
+        return cls.from_pages([text or ""], **metadata)
+
+    @classmethod
+    def from_file(
+        cls,
+        file_path: str,
+        cache: Optional["TextCache"] = None,
+        options: Optional[ReaderOptions] = None,
+    ) -> "ParsedDocument":
+        """
+        Read a resume file once and build a document from it.
+
+        Args:
+            file_path (str): Path to the resume file.
+            cache (TextCache, optional): Text cache consulted before reading.
+            options (ReaderOptions, optional): Reader tuning options.
+
+        Returns:
+            ParsedDocument: The parsed document.
+
+        Raises:
+            ValueError: If the file extension is unsupported.
+        """
+        return cls.from_source(os.fspath(file_path), cache=cache, options=options)
+
+    @classmethod
+    def from_source(
+        cls,
+        source: ResumeSource,
+        file_format: Optional[str] = None,
+        cache: Optional["TextCache"] = None,
+        options: Optional[ReaderOptions] = None,
+    ) -> "ParsedDocument":
+        """
+        Read a resume given by path or by its in-memory content.
+
+        Args:
+            source: A path, bytes, memoryview or binary file-like object.
+            file_format (str, optional): Document format such as "pdf"; by
+                default taken from the path or sniffed from the content.
+            cache (TextCache, optional): Text cache consulted before reading.
+            options (ReaderOptions, optional): Reader tuning options.
+
+        Returns:
+            ParsedDocument: The parsed document. In-memory sources are
+            recorded with source "<memory>"; `metadata["truncated"]` is True
+            when a budget in `options` cut the read short.
+
+        Raises:
+            ValueError: If the format is unsupported.
+        """
+        source = as_reader_input(source)
+        extension = resolve_format(source, file_format)
+        report = ReadReport()
+        pages = read_resume_pages(
+            source, cache=cache, options=options, file_format=extension, report=report
+        )
+        return cls.from_pages(
+            pages,
+            source=source if isinstance(source, str) else "<memory>",
+            extension=extension,
+            **truncation_metadata(report),
+        )
+
+
+def truncation_metadata(report: ReadReport) -> Dict[str, Any]:
+    """
+    Metadata entries describing whether a read was cut short by a budget.
+
+    Args:
+        report (ReadReport): Report filled in by the reader.
+
+    Returns:
+        dict: {"truncated": bool}, plus "truncated_by" when truncated and
+        "ocr_errors" when OCR of some pages failed.
+    """
+    if not report.truncated:
+        return {"truncated": False}
+    metadata: Dict[str, Any] = {"truncated": True, "truncated_by": list(report.truncated_by)}
+    if report.ocr_errors:
+        metadata["ocr_errors"] = list(report.ocr_errors)
+    return metadata
+
+
+def load_document(
+    source: Union[ResumeSource, ParsedDocument],
+    cache: Optional["TextCache"] = None,
+    options: Optional[ReaderOptions] = None,
+    file_format: Optional[str] = None,
+) -> ParsedDocument:
+    """
+    Return a ParsedDocument for `source`, reading the file only if needed.
+
+    Args:
+        source: A path, in-memory resume content or an existing ParsedDocument.
+        cache (TextCache, optional): Text cache consulted before reading.
+        options (ReaderOptions, optional): Reader tuning options.
+        file_format (str, optional): Format of in-memory content.
+
+    Returns:
+        ParsedDocument: The parsed document.
+    """
+    if isinstance(source, ParsedDocument):
+        return source
+    return ParsedDocument.from_source(
+        source, file_format=file_format, cache=cache, options=options
+    )
@@ -2,11 +2,13 @@
 section_finder.py
 
 Utility for extracting specific sections from text (e.g., resumes, reports)
-based on start and end header keywords.
+based on start and end header keywords, and for telling which section a
+character offset falls in.
 """
 
 import re
-from typing import List
+from bisect import bisect_right
+from typing import Dict, List, Tuple
 
 
 def find_section(text: str, start_keywords: List[str], end_keywords: List[str]) -> str:
@@ -61,3 +63,49 @@ def find_section(text: str, start_keywords: List[str], end_keywords: List[str])
         end_idx = len(text)
 
     return text[start_idx:end_idx].strip()
+
+
+def find_section_headers(text: str, headers: Dict[str, List[str]]) -> List[Tuple[int, str]]:
+    """
+    Locates every own-line section header in `text` in a single pass.
+
+    Args:
+        text: The full text to search.
+        headers: Section name -> header keywords; a line matching keywords of
+            several sections is attributed to the first one listed.
+
+    Returns:
+        (offset, section) pairs in text order, where offset is the start of
+        the header line.
+
+    Example:
+        >>> text = "Summary\\nHi\\nSkills\\nGo"
+        >>> find_section_headers(text, {"summary": ["summary"], "skills": ["skills"]})
+        [(0, 'summary'), (11, 'skills')]
+    """
+    groups = "|".join(
+        f"(?P<s{i}>{'|'.join(keywords)})" for i, keywords in enumerate(headers.values())
+    )
+    names = list(headers)
+    pattern = re.compile(r"(?mi)^[^\S\n]*(?:" + groups + r")[^\S\n]*[:\-–—]?[^\S\n]*$")
+    # Keywords may contain unnamed groups, so `lastgroup` cannot be relied on.
+    return [
+        (m.start(), next(name for i, name in enumerate(names) if m.group(f"s{i}") is not None))
+        for m in pattern.finditer(text)
+    ]
+
+
+def section_at(headers: List[Tuple[int, str]], offset: int, default: str = "other") -> str:
+    """
+    Returns the section containing `offset`, given `find_section_headers` output.
+
+    Args:
+        headers: (offset, section) pairs in text order.
+        offset: Character offset into the same text.
+        default: Section reported before the first header.
+
+    Returns:
+        The section name.
+    """
+    position = bisect_right(headers, (offset, "\uffff")) - 1
+    return headers[position][1] if position >= 0 else default
@@ -0,0 +1,191 @@
+"""
+skill_matcher.py
+
+Single-pass matcher for the whole skills vocabulary.
+
+Every skill name and alias in the dataset is compiled once into an
+Aho-Corasick automaton (a trie with failure links), so a resume is scanned
+exactly once no matter how many skills the dataset holds, instead of running
+one regular expression per alias.
+
+Matches respect word boundaries the way a reader would expect for technical
+tokens: an alias that starts or ends with a letter or digit must not touch
+another letter or digit on that side, while an alias edge that is already
+punctuation (".NET", "C++", "C#") needs no boundary. "+" and "#" directly
+after a match extend it only when the longer token is itself in the
+vocabulary, so "C" does not match inside "C++" or "C#" while "HTML+CSS" and
+"React+Redux" still yield both skills.
+
+Typical Usage:
+    from resume_parser.utils.skill_matcher import SkillMatcher
+    from resume_parser.utils.skills_list_loader import load_skills
+
+    matcher = SkillMatcher(load_skills())
+    found = matcher.match("Built services in C++ and C# on .NET")
+    # {("Programming Languages", "C++"), ("Programming Languages", "C#"), ...}
+
+Classes:
+    SkillMatcher:
+        Aho-Corasick automaton over skill names and aliases.
+
+Functions:
+    fold_case(text) -> str:
+        Lowercases text while keeping character offsets.
+"""
+
+from collections import deque
+from typing import Any, Dict, Iterator, List, Set, Tuple
+
+# (category, skill name)
+SkillKey = Tuple[str, str]
+
+# Characters that may continue a token when they directly follow it ("C++", "C#").
+TOKEN_SUFFIXES = "+#"
+
+
+def _is_word(char: str) -> bool:
+    """Whether `char` is a word character in the sense of regex ``\\w``."""
+    return char.isalnum() or char == "_"
+
+
+def fold_case(text: str) -> str:
+    """
+    Lowercase `text` without changing its length, so that scan offsets are
+    also offsets into the original text.
+
+    The few characters whose lowercase form is longer (e.g. "İ") are kept
+    as they are.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(char if len(char.lower()) != 1 else char.lower() for char in text)
+
+
+class SkillMatcher:  # pylint: disable=too-many-instance-attributes
+    """
+    Aho-Corasick automaton over every skill name and alias in a dataset.
+
+    Attributes:
+        patterns (list[str]): Lowercased names and aliases, indexed by
+            pattern id.
+        owners (list[list[tuple[str, str]]]): For each pattern id, the
+            (category, skill name) pairs it identifies.
+    """
+
+    def __init__(self, skills_data: Dict[str, Any]) -> None:
+        """
+        Compile the automaton for the "ALL_TECHNICAL_SKILLS" of a dataset.
+
+        Args:
+            skills_data (dict): Skills dataset as returned by `load_skills`.
+        """
+        self.patterns: List[str] = []
+        self.owners: List[List[SkillKey]] = []
+        ids: Dict[str, int] = {}
+        for category, skills in skills_data.get("ALL_TECHNICAL_SKILLS", {}).items():
+            for skill in skills:
+                for name in [skill["name"], *skill.get("aliases", [])]:
+                    pattern = name.lower().strip()
+                    if not pattern:
+                        continue
+                    if pattern not in ids:
+                        ids[pattern] = len(self.patterns)
+                        self.patterns.append(pattern)
+                        self.owners.append([])
+                    key = (category, skill["name"])
+                    if key not in self.owners[ids[pattern]]:
+                        self.owners[ids[pattern]].append(key)
+
+        # Whether each pattern needs a word boundary on its left / right edge.
+        self._left = [_is_word(p[0]) for p in self.patterns]
+        self._right = [_is_word(p[-1]) for p in self.patterns]
+        self._ids = ids
+        self._build()
+
+    def _build(self) -> None:
+        """Build the trie, then the failure links and merged outputs breadth-first."""
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[int]] = [[]]
+        for pattern_id, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                if char not in goto[state]:
+                    goto.append({})
+                    out.append([])
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            out[state].append(pattern_id)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in goto[state].items():
+                queue.append(child)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[child] = goto[fallback].get(char, 0)
+                out[child] = out[child] + out[fail[child]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def scan(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        Find every alias occurrence in one pass over `text`.
+
+        Args:
+            text (str): Lowercased text (offsets refer to this string); use
+                `fold_case` so they also hold for the original text.
+
+        Yields:
+            tuple[int, int, int]: (start, end, pattern id) for each match that
+            respects word boundaries, in order of `end`.
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        size = len(text)
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in out[state]:
+                start = index + 1 - len(self.patterns[pattern_id])
+                if self._left[pattern_id] and start > 0 and _is_word(text[start - 1]):
+                    continue
+                if self._right[pattern_id] and index + 1 < size:
+                    following = text[index + 1]
+                    if _is_word(following) or self._extends(text, start, index + 1):
+                        continue
+                yield start, index + 1, pattern_id
+
+    def _extends(self, text: str, start: int, end: int) -> bool:
+        """
+        Whether the "+"/"#" run after `text[start:end]` makes a longer token
+        that is itself in the vocabulary ("c" in "c++"); otherwise the run is
+        a separator ("html+css").
+        """
+        stop = end
+        while stop < len(text) and text[stop] in TOKEN_SUFFIXES:
+            stop += 1
+            if text[start:stop] in self._ids:
+                return True
+        return False
+
+    def match(self, text: str) -> Set[SkillKey]:
+        """
+        Return every skill mentioned in `text`.
+
+        Args:
+            text (str): Resume text (any case).
+
+        Returns:
+            set[tuple[str, str]]: (category, skill name) pairs that were found.
+        """
+        found: Set[SkillKey] = set()
+        for _, _, pattern_id in self.scan(fold_case(text)):
+            found.update(self.owners[pattern_id])
+        return found
@@ -5,25 +5,35 @@ This module defines the SkillsChecker class, responsible for extracting and
 matching technical skills from resume text against a predefined dataset.
 
 Functionality:
-    - Loads a comprehensive skills dataset from JSON via `load_skills`.
+    - Uses the shared, precompiled skills index (see `get_skills_index`), so
+      constructing a checker does not re-read or recompile the dataset.
     - Retrieves role definitions and their associated skill categories.
     - Extracts all technical skills present in a resume.
     - Extracts role-specific technical skills from a resume.
-    - Matches skills (including aliases) in a case-insensitive manner.
+    - Matches skills (including aliases) in a case-insensitive manner, with a
+      single pass over the resume (see `SkillMatcher`), optionally tolerating
+      typos and split words (see `FuzzySkillMatcher`).
 
 Classes:
     SkillsChecker:
         Provides methods for:
-            - extract_general_skills(file_path): Extracts all skills across categories.
-            - extract_role_skills(file_path, role): Extracts skills for a specific role.
+            - extract_general_skills(source): Extracts all skills across categories.
+            - extract_role_skills(source, role): Extracts skills for a specific role.
+            - extract_all_roles(source): Extracts skills for every role at once.
+            - rank_roles(source): Ranks every role by how much of it the resume covers.
+            - extract_skill_hits(source): Where each skill occurs, with offsets,
+              counts, matched alias and section.
             - load_roles(): Returns a list of available roles.
 """
 
-import re
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
-from resume_parser.utils.skills_list_loader import load_skills, load_roles
-from resume_parser.utils.file_reader import read_resume
+from resume_parser.config.patterns import SECTION_HEADERS
+from resume_parser.utils.file_reader import ResumeSource
+from resume_parser.utils.section_finder import find_section_headers, section_at
+from resume_parser.utils.skill_matcher import SkillKey, fold_case
+from resume_parser.utils.skills_index import get_skills_index
+from resume_parser.utils.parsed_document import ParsedDocument, load_document
 
 
 class SkillsChecker:  # pylint: disable=too-few-public-methods
@@ -31,14 +41,25 @@ class SkillsChecker:  # pylint: disable=too-few-public-methods
     A utility class for extracting and matching skills from resume text
     against a predefined skills dataset.
 
-    The skills dataset is loaded from JSON using `load_skills` and includes:
+    The skills dataset comes from the shared `SkillsIndex` and includes:
       - "ALL_TECHNICAL_SKILLS": category -> skill definitions
       - "ROLES": role -> list of categories
     """
 
-    def __init__(self) -> None:
-        """Initialize the SkillsChecker by loading the complete skills dataset."""
-        self.skills_data = load_skills()
+    def __init__(self, skills_path: Optional[str] = None, fuzzy: bool = False) -> None:
+        """
+        Initialize the SkillsChecker from the shared skills index.
+
+        Args:
+            skills_path (str, optional): Skills dataset JSON; defaults to the
+                bundled dataset.
+            fuzzy (bool): Also accept near misses such as "Kubernets" or
+                "Pyth on" (slower; see `FuzzySkillMatcher`).
+        """
+        index = get_skills_index(skills_path)
+        self.skills_data = index.data
+        self.matcher = index.fuzzy_matcher if fuzzy else index.matcher
+        self._skill_categories = index.skill_categories
 
     @staticmethod
     def load_roles() -> List[str]:
@@ -48,50 +69,157 @@ class SkillsChecker:  # pylint: disable=too-few-public-methods
         Returns:
             list[str]: Role names.
         """
-        return load_roles()
+        return list(get_skills_index().roles)
 
-    def extract_general_skills(self, file_path: str) -> Dict[str, Dict[str, List[str]]]:
+    def extract_general_skills(
+        self, source: Union[ResumeSource, ParsedDocument], file_format: Optional[str] = None
+    ) -> Dict[str, Dict[str, List[str]]]:
         """
         Extract all technical skills (across all categories) from a resume.
+
+        `source` may be a file path, in-memory content (with an optional
+        `file_format`) or an already parsed document.
         """
-        resume_text = read_resume(file_path)
-        resume_lower = resume_text.lower()
+        hits = self.matcher.match(load_document(source, file_format=file_format).raw_text)
         extracted: Dict[str, Dict[str, List[str]]] = {}
 
         for category, skills in self.skills_data.get("ALL_TECHNICAL_SKILLS", {}).items():
-            found, missing = self._match_skills(skills, resume_lower)
+            found, missing = self._match_skills(category, skills, hits)
             extracted[category] = {"found": found, "missing": missing}
 
         return extracted
 
-    def extract_role_skills(self, file_path: str, role: str) -> Dict[str, Dict[str, List[str]]]:
+    def extract_role_skills(
+        self,
+        source: Union[ResumeSource, ParsedDocument],
+        role: str,
+        file_format: Optional[str] = None,
+    ) -> Dict[str, Dict[str, List[str]]]:
         """
         Extract technical skills relevant to a specific role from a resume.
+
+        `source` may be a file path, in-memory content (with an optional
+        `file_format`) or an already parsed document.
         """
-        resume_text = read_resume(file_path)
-        resume_lower = resume_text.lower()
+        hits = self.matcher.match(load_document(source, file_format=file_format).raw_text)
         role_categories = self.skills_data.get("ROLES", {}).get(role, [])
         extracted: Dict[str, Dict[str, List[str]]] = {}
 
         for category in role_categories:
             skills = self.skills_data.get("ALL_TECHNICAL_SKILLS", {}).get(category, [])
-            found, missing = self._match_skills(skills, resume_lower)
+            found, missing = self._match_skills(category, skills, hits)
             extracted[category] = {"found": found, "missing": missing}
 
         return extracted
 
+    def extract_all_roles(
+        self, source: Union[ResumeSource, ParsedDocument], file_format: Optional[str] = None
+    ) -> Dict[str, Dict[str, Dict[str, List[str]]]]:
+        """
+        Extract the role-specific skills for every role in one pass.
+
+        The resume is read and matched once, each category is split once, and
+        the result is projected onto every role, so this costs the same as
+        `extract_general_skills`.
+
+        Returns:
+            dict: Role -> the same structure `extract_role_skills` returns.
+        """
+        by_category = self.extract_general_skills(source, file_format=file_format)
+        empty: Dict[str, List[str]] = {"found": [], "missing": []}
+        return {
+            role: {category: by_category.get(category, empty) for category in categories}
+            for role, categories in self.skills_data.get("ROLES", {}).items()
+        }
+
+    def rank_roles(
+        self, source: Union[ResumeSource, ParsedDocument], file_format: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank every role by the share of its skills found in a resume.
+
+        Returns:
+            list[dict]: One entry per role with "role", "coverage" (found /
+            total skills, 0-1), "found" and "missing" (skill names across the
+            role's categories), best fit first; ties keep dataset order.
+        """
+        ranking = []
+        for role, categories in self.extract_all_roles(source, file_format).items():
+            found = [s for result in categories.values() for s in result["found"]]
+            missing = [s for result in categories.values() for s in result["missing"]]
+            # A skill listed in two of the role's categories counts once.
+            found = list(dict.fromkeys(found))
+            missing = [s for s in dict.fromkeys(missing) if s not in found]
+            total = len(found) + len(missing)
+            ranking.append({
+                "role": role,
+                "coverage": round(len(found) / total, 4) if total else 0.0,
+                "found": found,
+                "missing": missing,
+            })
+        ranking.sort(key=lambda entry: (entry["coverage"], len(entry["found"])), reverse=True)
+        return ranking
+
+    def extract_skill_hits(
+        self, source: Union[ResumeSource, ParsedDocument], file_format: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Report where each skill occurs in a resume, from a single scan.
+
+        Offsets index into the document's `raw_text`. Sections (summary,
+        experience, education, skills; "other" elsewhere) follow the
+        own-line headers in `SECTION_HEADERS`. When two aliases of one skill
+        overlap ("React" inside "React.js") only the longer counts.
+
+        Returns:
+            dict: Skill name -> {"categories": [...], "count": int,
+            "sections": {section: count}, "hits": [{"start", "end", "text",
+            "alias", "section"}, ...]}, skills in order of first occurrence.
+        """
+        text = load_document(source, file_format=file_format).raw_text
+        headers = find_section_headers(text, SECTION_HEADERS)
+        report: Dict[str, Dict[str, Any]] = {}
+        for start, end, pattern_id in self.matcher.scan(fold_case(text)):
+            for name in dict.fromkeys(name for _, name in self.matcher.owners[pattern_id]):
+                entry = report.setdefault(name, {
+                    "categories": list(self._skill_categories.get(name, [])),
+                    "count": 0,
+                    "sections": {},
+                    "hits": [],
+                })
+                hits = entry["hits"]
+                # Matches arrive in order of `end`, so an overlap is always
+                # with the previous hit of the same skill.
+                if hits and start < hits[-1]["end"]:
+                    if end - start > hits[-1]["end"] - hits[-1]["start"]:
+                        entry["sections"][hits.pop()["section"]] -= 1
+                        entry["count"] -= 1
+                    else:
+                        continue
+                section = section_at(headers, start)
+                hits.append({
+                    "start": start,
+                    "end": end,
+                    "text": text[start:end],
+                    "alias": self.matcher.patterns[pattern_id],
+                    "section": section,
+                })
+                entry["count"] += 1
+                entry["sections"][section] = entry["sections"].get(section, 0) + 1
+        for entry in report.values():
+            entry["sections"] = {k: v for k, v in entry["sections"].items() if v}
+        return report
+
     @staticmethod
-    def _match_skills(skills: List[Dict[str, Any]],
-                      resume_lower: str) -> Tuple[List[str], List[str]]:
+    def _match_skills(category: str, skills: List[Dict[str, Any]],
+                      hits: Set[SkillKey]) -> Tuple[List[str], List[str]]:
         """
-        Match a list of skills against lowercase resume text.
+        Split a category's skills into found and missing, in dataset order.
         """
         found: List[str] = []
         missing: List[str] = []
         for skill in skills:
-            skill_names = ([skill["name"].lower()]
-                           + [alias.lower() for alias in skill.get("aliases", [])])
-            if any(re.search(rf"\b{re.escape(name)}\b", resume_lower) for name in skill_names):
+            if (category, skill["name"]) in hits:
                 found.append(skill["name"])
             else:
                 missing.append(skill["name"])
@@ -0,0 +1,184 @@
+"""
+skills_index.py
+
+Process-wide, precompiled index of the skills dataset.
+
+Parsing `skills_master.json` and compiling its `SkillMatcher` is the same
+work for every `SkillsChecker`, so it is done once per dataset file and
+shared. The index is rebuilt only when the file changes: its size and
+modification time are checked on every lookup (a single ``stat``), and the
+content hash decides whether a touched file really changed.
+
+With ``persist=True`` the compiled index is also written next to the JSON
+(``skills_master.json.index.pickle``) and loaded from there by later
+processes while the JSON's content hash still matches. The artifact is a
+pickle, so it is only ever read from the dataset's own directory.
+
+Typical Usage:
+    from resume_parser.utils.skills_index import get_skills_index
+
+    index = get_skills_index()
+    index.matcher.match(text)
+    index.category_roles["Programming Languages"]
+
+Classes:
+    SkillsIndex:
+        The dataset plus its derived lookups and compiled matcher.
+
+Functions:
+    get_skills_index(file_path, persist) -> SkillsIndex:
+        Returns the memoized index for a dataset file.
+    clear_skills_index_cache() -> None:
+        Drops every memoized index.
+"""
+
+import json
+import os
+import pickle
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from resume_parser.utils.fuzzy_matcher import FuzzySkillMatcher
+from resume_parser.utils.skill_matcher import SkillKey, SkillMatcher
+from resume_parser.utils.skills_list_loader import default_skills_path
+from resume_parser.utils.text_cache import file_digest
+
+# Bump when the layout of SkillsIndex or SkillMatcher changes, so old
+# artifacts are ignored.
+INDEX_FORMAT = "3"
+ARTIFACT_SUFFIX = ".index.pickle"
+
+
+class SkillsIndex:  # pylint: disable=too-few-public-methods, too-many-instance-attributes
+    """
+    Read-only view of a skills dataset, compiled for matching.
+
+    Attributes:
+        data (dict): The dataset as loaded from JSON; shared, do not mutate.
+        digest (str): SHA-256 of the dataset file.
+        roles (list[str]): Role names, in dataset order.
+        role_categories (dict[str, list[str]]): Role -> its skill categories.
+        categories (dict[str, list[str]]): Category -> skill names, in
+            dataset order.
+        skill_categories (dict[str, list[str]]): Skill name -> categories
+            listing it.
+        category_roles (dict[str, list[str]]): Category -> roles using it.
+        aliases (dict[str, list[tuple[str, str]]]): Lowercased name or alias
+            -> the (category, skill name) pairs it identifies.
+        matcher (SkillMatcher): Automaton over every name and alias.
+        fuzzy_matcher (FuzzySkillMatcher): `matcher` plus near-miss lookups;
+            built on first use.
+    """
+
+    def __init__(self, data: Dict[str, Any], digest: str) -> None:
+        """
+        Derive the lookups and compile the matcher for a dataset.
+
+        Args:
+            data (dict): Skills dataset as returned by `load_skills`.
+            digest (str): Content hash of the file it came from.
+        """
+        self.data = data
+        self.digest = digest
+        self.role_categories: Dict[str, List[str]] = dict(data.get("ROLES", {}))
+        self.roles = list(self.role_categories)
+
+        self.categories: Dict[str, List[str]] = {}
+        self.skill_categories: Dict[str, List[str]] = {}
+        for category, skills in data.get("ALL_TECHNICAL_SKILLS", {}).items():
+            self.categories[category] = [skill["name"] for skill in skills]
+            for skill in skills:
+                self.skill_categories.setdefault(skill["name"], []).append(category)
+
+        self.category_roles: Dict[str, List[str]] = {}
+        for role, role_categories in self.role_categories.items():
+            for category in role_categories:
+                self.category_roles.setdefault(category, []).append(role)
+
+        self.matcher = SkillMatcher(data)
+        self.aliases: Dict[str, List[SkillKey]] = dict(
+            zip(self.matcher.patterns, self.matcher.owners)
+        )
+        self._fuzzy: Optional[FuzzySkillMatcher] = None
+
+    @property
+    def fuzzy_matcher(self) -> FuzzySkillMatcher:
+        """Typo-tolerant matcher over the same vocabulary, built on first use."""
+        if self._fuzzy is None:
+            self._fuzzy = FuzzySkillMatcher(self.matcher)
+        return self._fuzzy
+
+
+# Absolute dataset path -> ((size, mtime_ns), index)
+_INDEXES: Dict[str, Tuple[Tuple[int, int], SkillsIndex]] = {}
+_LOCK = threading.Lock()
+
+
+def _load_artifact(path: str, digest: str) -> Optional[SkillsIndex]:
+    """Return the persisted index if it was built from this exact content."""
+    try:
+        with open(path, "rb") as f:
+            payload = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    if not isinstance(payload, dict) or payload.get("format") != INDEX_FORMAT:
+        return None
+    index = payload.get("index")
+    return index if isinstance(index, SkillsIndex) and index.digest == digest else None
+
+
+def _save_artifact(path: str, index: SkillsIndex) -> None:
+    """Persist the index atomically; a read-only install directory is not an error."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"format": INDEX_FORMAT, "index": index}, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def get_skills_index(file_path: Optional[str] = None, persist: bool = False) -> SkillsIndex:
+    """
+    Return the compiled index for a skills dataset, building it at most once
+    per file version.
+
+    Args:
+        file_path (str, optional): Dataset JSON; defaults to the bundled
+            `data/skills_master.json`.
+        persist (bool): Also load/save the compiled index as an artifact
+            next to the JSON.
+
+    Returns:
+        SkillsIndex: Shared index; treat it as read-only.
+    """
+    path = os.path.abspath(file_path or default_skills_path())
+    stat = os.stat(path)
+    signature = (stat.st_size, stat.st_mtime_ns)
+    with _LOCK:
+        cached = _INDEXES.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        with open(path, "rb") as f:
+            content = f.read()
+        digest = file_digest(content)
+        if cached is not None and cached[1].digest == digest:
+            index = cached[1]  # touched but unchanged
+        else:
+            index = _load_artifact(path + ARTIFACT_SUFFIX, digest) if persist else None
+            if index is None:
+                index = SkillsIndex(json.loads(content), digest)
+                if persist:
+                    _save_artifact(path + ARTIFACT_SUFFIX, index)
+        _INDEXES[path] = (signature, index)
+        return index
+
+
+def clear_skills_index_cache() -> None:
+    """Drop every memoized index (the next lookup rebuilds or reloads it)."""
+    with _LOCK:
+        _INDEXES.clear()
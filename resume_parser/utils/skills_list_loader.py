@@ -16,6 +16,9 @@ Typical Usage:
     roles = load_roles()
 
 Functions:
+    default_skills_path() -> str:
+        Returns the path of the bundled `data/skills_master.json`.
+
     load_skills(file_path: str | None) -> dict:
         Loads the full skills dataset from the specified JSON file or from the
         default path if none is provided.
@@ -27,6 +30,17 @@ Functions:
 import json
 import os
 
+def default_skills_path():
+    """
+    Return the absolute path of the bundled skills dataset.
+
+    Returns:
+        str: Path to `data/skills_master.json` relative to the project root.
+    """
+    base_dir = os.path.dirname(os.path.dirname(__file__))  # up from utils/
+    return os.path.abspath(os.path.join(base_dir, "data", "skills_master.json"))
+
+
 def load_skills(file_path=None):
     """
     Load the full skills dataset from a JSON file.
@@ -47,10 +61,7 @@ def load_skills(file_path=None):
     """
 
     if file_path is None:
-        base_dir = os.path.dirname(os.path.dirname(__file__))  # up from utils/
-        file_path = os.path.join(base_dir, "data", "skills_master.json")
-
-        file_path = os.path.abspath(file_path)
+        file_path = default_skills_path()
     with open(file_path, "r", encoding="utf-8") as f:
         return json.load(f)
 
@@ -0,0 +1,223 @@
+"""
+text_cache.py
+
+Persistent, content-addressed cache for extracted resume text.
+
+Reading a resume (and especially OCR-ing a scanned PDF) is deterministic for a
+given file and reader version, so the extracted per-page text is stored in a
+local SQLite database keyed by the SHA-256 of the file bytes plus the pipeline
+version. The cache has a configurable size cap; when it is exceeded the least
+recently used entries are evicted.
+
+Typical Usage:
+    from resume_parser.utils.text_cache import TextCache
+    from resume_parser.utils.file_reader import read_resume
+
+    with TextCache("~/.cache/resume_parser") as cache:
+        text = read_resume("resume.pdf", cache=cache)
+        print(cache.stats())
+
+Classes:
+    TextCache:
+        SQLite-backed page-text cache with LRU eviction and hit/miss/eviction
+        counters.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, List, Optional, Union
+
+from resume_parser import __version__
+from resume_parser.utils.file_reader import READER_VERSION
+
+DEFAULT_CACHE_DIR = os.path.join("~", ".cache", "resume_parser")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+CACHE_FILENAME = "text_cache.sqlite3"
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(file_path: Union[str, bytes]) -> str:
+    """
+    Compute the SHA-256 hex digest of a file's contents.
+
+    Args:
+        file_path (str | bytes): Path to the file, or the contents themselves.
+
+    Returns:
+        str: Hex-encoded SHA-256 digest.
+    """
+    if isinstance(file_path, bytes):
+        return hashlib.sha256(file_path).hexdigest()
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TextCache:
+    """
+    On-disk cache of extracted page text, keyed by file content and pipeline version.
+
+    Attributes:
+        path (str): Location of the SQLite database file.
+        max_bytes (int): Size cap for stored text; older entries are evicted
+            once the total exceeds this value.
+        version (str): Pipeline version mixed into every key, so that reader
+            changes never serve stale text.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that required a fresh read.
+        evictions (int): Number of entries removed to respect `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        version: Optional[str] = None,
+    ) -> None:
+        """
+        Open (or create) the cache database.
+
+        Args:
+            cache_dir (str, optional): Directory holding the database.
+                Defaults to `~/.cache/resume_parser`.
+            max_bytes (int): Maximum total size of cached text, in bytes.
+            version (str, optional): Pipeline version. Defaults to the package
+                version combined with `file_reader.READER_VERSION`.
+        """
+        cache_dir = os.path.expanduser(cache_dir or DEFAULT_CACHE_DIR)
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, CACHE_FILENAME)
+        self.max_bytes = max_bytes
+        self.version = version or f"{__version__}:{READER_VERSION}"
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._conn = sqlite3.connect(self.path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " pages TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)"
+        )
+        self._conn.commit()
+
+    def __enter__(self) -> "TextCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def key_for(self, file_path: Union[str, bytes], variant: str = "") -> str:
+        """
+        Build the cache key for a file: content hash plus pipeline version.
+
+        Args:
+            file_path (str | bytes): Path to the resume file, or its bytes.
+            variant (str): Optional description of reader settings that
+                change the extracted text (e.g. OCR resolution).
+
+        Returns:
+            str: The cache key.
+        """
+        key = f"{file_digest(file_path)}:{self.version}"
+        return f"{key}:{variant}" if variant else key
+
+    def get(self, key: str) -> Optional[List[str]]:
+        """
+        Look up cached pages and mark the entry as recently used.
+
+        Args:
+            key (str): Cache key from `key_for`.
+
+        Returns:
+            list[str] | None: The cached pages, or None on a miss.
+        """
+        row = self._conn.execute(
+            "SELECT pages FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._conn.execute(
+            "UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key)
+        )
+        self._conn.commit()
+        return json.loads(row[0])
+
+    def put(self, key: str, pages: List[str]) -> None:
+        """
+        Store pages under `key`, evicting least recently used entries if needed.
+
+        Args:
+            key (str): Cache key from `key_for`.
+            pages (list[str]): Page texts to store.
+        """
+        payload = json.dumps(pages, ensure_ascii=False)
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        self._conn.execute(
+            "INSERT OR REPLACE INTO entries (key, pages, size, last_access)"
+            " VALUES (?, ?, ?, ?)",
+            (key, payload, size, time.time()),
+        )
+        self._evict()
+        self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report cache counters for monitoring.
+
+        Returns:
+            dict: "hits", "misses", "evictions", "entries" and "size_bytes".
+        """
+        entries, size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": entries,
+            "size_bytes": size,
+        }
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        self._conn.execute("DELETE FROM entries")
+        self._conn.commit()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the size cap is respected."""
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute(
+            "SELECT key, size FROM entries ORDER BY last_access ASC"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            self.evictions += 1
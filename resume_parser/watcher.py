@@ -0,0 +1,277 @@
+"""
+watcher.py
+
+Watch-folder mode: polls an inbox directory and parses resumes as they land.
+
+Workers are started (and warmed up) once, so each new resume only pays for
+its own parsing. A file is picked up once its size and modification time are
+unchanged between two polls, so half-copied exports are left alone until the
+copy finishes. Each result is written atomically as ``<name>.json`` (the
+batch JSONL record for that file) next to the resume or under an output
+directory that mirrors the inbox layout. A resume is parsed again only when
+it changes after its result was written, so the watcher can be stopped and
+restarted at any time.
+
+If a worker process dies, the pool is replaced and the files it was running
+are retried one at a time; only a file that kills its worker again gets an
+error record.
+
+Typical Usage:
+    resume_parser watch ~/Shared/Inbox --output-dir ~/Shared/Parsed --mode skills
+
+Classes:
+    FolderWatcher:
+        Polls a directory and dispatches stable new files to a warm pool.
+"""
+
+import argparse
+import json
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from resume_parser.batch import failure_record, process_file, start_warm_pool
+from resume_parser.utils.file_reader import READERS, ReaderOptions
+
+# Heavy libraries are imported by each worker at start-up, not by the watcher.
+# pylint: disable=import-outside-toplevel
+
+DEFAULT_INTERVAL = 2.0
+
+# Editors and sync clients leave these behind while a file is being written.
+IGNORED_PREFIXES = (".", "~$")
+
+
+class FolderWatcher:  # pylint: disable=too-many-instance-attributes
+    """
+    Polls an inbox for new or changed resumes and parses them on a warm pool.
+
+    Attributes:
+        inbox (str): Directory being watched (recursively).
+        output_dir (str): Where ``<name>.json`` results are written; the inbox
+            itself by default.
+        interval (float): Seconds between polls.
+        workers (int): Number of worker processes.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        inbox: str,
+        output_dir: Optional[str] = None,
+        mode: str = "profile",
+        sub_mode: Optional[str] = None,
+        role: Optional[str] = None,
+        options: Optional[ReaderOptions] = None,
+        workers: int = 1,
+        interval: float = DEFAULT_INTERVAL,
+        cache_dir: Optional[str] = None,
+    ) -> None:
+        """
+        Start the worker pool and warm every worker up.
+
+        Args:
+            inbox (str): Directory to watch.
+            output_dir (str, optional): Result directory; defaults to `inbox`.
+            mode (str): "profile" or "skills".
+            sub_mode (str, optional): Skills sub-mode ("general", "role", "rank" or "hits").
+            role (str, optional): Role name for role-specific skills.
+            options (ReaderOptions, optional): Reader options and budgets.
+            workers (int): Number of worker processes.
+            interval (float): Seconds between polls.
+            cache_dir (str, optional): Shared text cache directory.
+        """
+        self.inbox = os.path.abspath(os.path.expanduser(inbox))
+        self.output_dir = os.path.abspath(os.path.expanduser(output_dir or inbox))
+        self.interval = interval
+        self.workers = workers
+        self._job = (mode, sub_mode, role, options)
+        self._cache_dir = cache_dir
+        # path -> (size, mtime_ns) seen on the previous poll
+        self._seen: Dict[str, Tuple[int, int]] = {}
+        # path -> (future, signature of the version being parsed, pool it runs on)
+        self._pending: Dict[str, Tuple[Future, Tuple[int, int], ProcessPoolExecutor]] = {}
+        # path -> signature of the version whose result was written by this process
+        self._done: Dict[str, Tuple[int, int]] = {}
+        # Files that were running when a worker died; each is retried alone.
+        self._suspects: Set[str] = set()
+        self._stop = threading.Event()
+        self.pool = start_warm_pool(workers, cache_dir)
+
+    def __enter__(self) -> "FolderWatcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the worker pool, abandoning files that have not started."""
+        self.pool.shutdown(cancel_futures=True)
+
+    def result_path(self, file_path: str) -> str:
+        """Return where the result for `file_path` is written."""
+        return os.path.join(self.output_dir, os.path.relpath(file_path, self.inbox)) + ".json"
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """Return (size, mtime_ns) for every resume in the inbox."""
+        found = {}
+        for root, dirs, files in os.walk(self.inbox):
+            dirs[:] = [d for d in dirs if not d.startswith(IGNORED_PREFIXES)]
+            for name in files:
+                if name.startswith(IGNORED_PREFIXES):
+                    continue
+                if os.path.splitext(name)[1].lower() not in READERS:
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue  # removed between listing and stat
+                found[path] = (stat.st_size, stat.st_mtime_ns)
+        return found
+
+    def _is_current(self, file_path: str, signature: Tuple[int, int]) -> bool:
+        """Whether the result for this version of the file already exists."""
+        if file_path in self._done:
+            return self._done[file_path] == signature
+        # Results from before a restart: trust any result newer than the file.
+        try:
+            return os.stat(self.result_path(file_path)).st_mtime_ns >= signature[1]
+        except OSError:
+            return False
+
+    def _write_result(self, record: Dict[str, Any]) -> None:
+        """Write a record next to its resume, atomically."""
+        path = self.result_path(record["file"])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False, default=str, indent=2)
+        os.replace(tmp_path, path)
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """
+        Scan the inbox once: dispatch files that have settled and collect
+        the results that are ready.
+
+        Returns:
+            list[dict]: Records written during this poll.
+        """
+        found = self._scan()
+        # Forget files that left the inbox, so these maps stay bounded.
+        for path in [path for path in self._done if path not in found]:
+            del self._done[path]
+        self._suspects &= found.keys()
+
+        # A suspect runs alone, so that if it kills its worker again it is
+        # known to be the culprit.
+        isolated = any(path in self._suspects for path in self._pending)
+        for path, signature in found.items():
+            if isolated:
+                break
+            if path in self._pending or self._seen.get(path) != signature:
+                continue  # in progress, or new/still changing since the last poll
+            if self._is_current(path, signature):
+                continue
+            if path in self._suspects:
+                if self._pending:
+                    continue  # wait for the pool to drain
+                isolated = True
+            self._pending[path] = (self._submit(path), signature, self.pool)
+            self._done.pop(path, None)
+        self._seen = found
+
+        written = []
+        for path, (future, signature, pool) in list(self._pending.items()):
+            if not future.done():
+                continue
+            del self._pending[path]
+            try:
+                record = future.result()
+            except BrokenProcessPool as exc:
+                self._restart_pool(pool)
+                if path not in self._suspects:
+                    self._suspects.add(path)  # retried alone on a later poll
+                    continue
+                record = failure_record(path, exc)
+            self._suspects.discard(path)
+            self._write_result(record)
+            self._done[path] = signature
+            written.append(record)
+        return written
+
+    def _submit(self, path: str) -> Future:
+        """Queue a file on the pool, replacing the pool if a worker has died."""
+        try:
+            return self.pool.submit(process_file, path, *self._job)
+        except BrokenProcessPool:
+            self._restart_pool(self.pool)
+            return self.pool.submit(process_file, path, *self._job)
+
+    def _restart_pool(self, broken: ProcessPoolExecutor) -> None:
+        """Replace `broken` with a new warm pool, unless that already happened."""
+        if self.pool is broken:
+            broken.shutdown(wait=False, cancel_futures=True)
+            self.pool = start_warm_pool(self.workers, self._cache_dir)
+
+    def run(self) -> None:
+        """Poll until `stop` is called."""
+        while True:
+            for record in self.poll():
+                status = "ok" if record["ok"] else record["error"]
+                print(f"{record['file']}: {status}", flush=True)
+            if self._stop.wait(self.interval):
+                return
+
+    def stop(self) -> None:
+        """Ask `run` to return after the current poll."""
+        self._stop.set()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Entry point for `resume_parser watch`."""
+    parser = argparse.ArgumentParser(
+        prog="resume_parser watch", description="Parse resumes as they land in a folder"
+    )
+    parser.add_argument("inbox", help="Directory to watch")
+    parser.add_argument(
+        "--output-dir", help="Where <name>.json results go (default: next to each resume)"
+    )
+    parser.add_argument("--mode", choices=["profile", "skills"], default="profile")
+    parser.add_argument(
+        "--sub-mode", choices=["general", "role", "rank", "hits"], help="Skills sub-mode"
+    )
+    parser.add_argument("--role", help="Role name for --sub-mode role")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (default: 1)")
+    parser.add_argument(
+        "--interval", type=float, default=DEFAULT_INTERVAL,
+        help=f"Seconds between polls (default: {DEFAULT_INTERVAL:g})"
+    )
+    parser.add_argument("--cache-dir", help="Directory for a persistent text cache")
+    parser.add_argument("--max-pages", type=int, help="Read at most this many PDF pages")
+    parser.add_argument("--max-ocr-pages", type=int, help="OCR at most this many pages")
+    parser.add_argument("--max-bytes", type=int, help="Skip files larger than this many bytes")
+    parser.add_argument(
+        "--stage-timeout", type=float, help="Seconds allowed for text extraction and OCR, each"
+    )
+    args = parser.parse_args(argv)
+    if args.sub_mode == "role" and not args.role:
+        parser.error("--sub-mode role requires --role")
+
+    options = ReaderOptions(
+        max_pages=args.max_pages,
+        max_ocr_pages=args.max_ocr_pages,
+        max_bytes=args.max_bytes,
+        stage_timeout=args.stage_timeout,
+    )
+    with FolderWatcher(
+        args.inbox, args.output_dir, mode=args.mode, sub_mode=args.sub_mode, role=args.role,
+        options=options, workers=args.workers, interval=args.interval,
+        cache_dir=args.cache_dir,
+    ) as watcher:
+        print(f"Watching {watcher.inbox} with {args.workers} workers")
+        try:
+            watcher.run()
+        except KeyboardInterrupt:
+            pass
@@ -27,7 +27,9 @@ setup(
     url="https://github.com/saraprettyman/resume_parser",
     packages=find_packages(),
     install_requires=install_requires,
+    extras_require={"scoring": ["numpy>=1.21"]},
     python_requires=">=3.9",
     include_package_data=True,
+    entry_points={"console_scripts": ["resume_parser = resume_parser.cli:main"]},
     license="GNU",
 )
@@ -5,11 +5,13 @@ This fixture automatically parameterizes tests with all resume files in
 `tests/data/fake_resumes`. Each test run gets one file path.
 """
 
+import ctypes
 from pathlib import Path
 import pytest
 
 # Pick the extension(s) you actually want
 EXTENSIONS = ("*.pdf", "*.txt")
+FAKE_PDF = Path(__file__).parent / "data" / "fake_resumes" / "fake_resume.pdf"
 
 @pytest.fixture(
     params=[
@@ -23,3 +25,73 @@ def fake_resume_path(request):
     Yields one fake resume path for each test run.
     """
     return request.param
+
+
+@pytest.fixture(name="long_pdf_path")
+def fixture_long_pdf_path(tmp_path):
+    """
+    Builds a 10-page PDF by repeating the fake resume page.
+    """
+    pdfium = pytest.importorskip("pypdfium2")
+    src = pdfium.PdfDocument(str(FAKE_PDF))
+    dest = pdfium.PdfDocument.new()
+    for _ in range(10):
+        dest.import_pages(src)
+    out = tmp_path / "long_resume.pdf"
+    dest.save(str(out))
+    return str(out)
+
+
+@pytest.fixture(name="mixed_pdf_path")
+def fixture_mixed_pdf_path(tmp_path):
+    """
+    Builds a PDF of the fake resume page followed by a blank (scanned-looking) page.
+    """
+    pdfium = pytest.importorskip("pypdfium2")
+    dest = pdfium.PdfDocument.new()
+    dest.import_pages(pdfium.PdfDocument(str(FAKE_PDF)))
+    dest.new_page(612, 792)
+    out = tmp_path / "mixed_resume.pdf"
+    dest.save(str(out))
+    return str(out)
+
+
+@pytest.fixture(name="scan_pdf_path")
+def fixture_scan_pdf_path(tmp_path):
+    """
+    Builds a 4-page PDF of blank (scanned-looking) pages.
+    """
+    pdfium = pytest.importorskip("pypdfium2")
+    scan = pdfium.PdfDocument.new()
+    for _ in range(4):
+        scan.new_page(612, 792)
+    out = tmp_path / "scan.pdf"
+    scan.save(str(out))
+    return str(out)
+
+
+@pytest.fixture(name="make_text_pdf")
+def fixture_make_text_pdf(tmp_path):
+    """
+    Returns a function that writes a PDF with the given lines of text on each
+    page and returns its path.
+    """
+    pdfium = pytest.importorskip("pypdfium2")
+    raw = pytest.importorskip("pypdfium2.raw")
+
+    def make(name, pages):
+        pdf = pdfium.PdfDocument.new()
+        for lines in pages:
+            page = pdf.new_page(612, 792)
+            for number, line in enumerate(lines):
+                obj = raw.FPDFPageObj_NewTextObj(pdf.raw, b"Helvetica", 12)
+                text = ctypes.create_string_buffer((line + "\0").encode("utf-16-le"))
+                raw.FPDFText_SetText(obj, ctypes.cast(text, ctypes.POINTER(raw.FPDF_WCHAR)))
+                raw.FPDFPageObj_Transform(obj, 1, 0, 0, 1, 72, 720 - 16 * number)
+                raw.FPDFPage_InsertObject(page.raw, obj)
+            raw.FPDFPage_GenerateContent(page.raw)
+        out = tmp_path / name
+        pdf.save(str(out))
+        return str(out)
+
+    return make
@@ -0,0 +1,176 @@
+"""Tests for the asyncio API, ensuring bounded concurrency and subprocess OCR."""
+
+import asyncio
+import stat
+import zipfile
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from resume_parser import async_parser
+from resume_parser.async_parser import parse_many, parse_resume
+from resume_parser.batch import analyze_document
+from resume_parser.utils import file_reader
+from resume_parser.utils.file_reader import ReaderOptions
+from resume_parser.utils.parsed_document import ParsedDocument
+
+FAKE_PDF = Path(__file__).parent / "data" / "fake_resumes" / "fake_resume.pdf"
+
+
+def make_scan(tmp_path: Any, page_count: int) -> str:
+    """Builds a PDF of blank (text-less) pages, as a scanner would produce."""
+    pdfium = pytest.importorskip("pypdfium2")
+    scan = pdfium.PdfDocument.new()
+    for _ in range(page_count):
+        scan.new_page(612, 792)
+    path = tmp_path / "scan.pdf"
+    scan.save(str(path))
+    return str(path)
+
+
+def test_parse_resume_matches_sync_reader():
+    """
+    Validates that the async API returns the same document and analysis as
+    the synchronous one, for paths and in-memory content.
+    """
+    expected = ParsedDocument.from_file(str(FAKE_PDF))
+
+    document = asyncio.run(parse_resume(str(FAKE_PDF)))
+    assert document.raw_text == expected.raw_text
+    assert document.metadata["truncated"] is False
+
+    record = asyncio.run(parse_resume(FAKE_PDF.read_bytes(), mode="profile"))
+    assert record["metadata"]["source"] == "<memory>"
+    assert record["result"] == analyze_document(expected, "profile")
+
+
+def test_pdf_workers_are_not_nested(long_pdf_path: str, monkeypatch: Any):
+    """
+    Validates that page extraction in the executor never starts its own
+    process pool, whatever `pdf_workers` says.
+    """
+    seen = []
+
+    def extract(source, options, report):
+        seen.append(options.pdf_workers)
+        return file_reader.extract_pdf_text_pages(source, options, report)
+
+    monkeypatch.setattr(async_parser, "extract_pdf_text_pages", extract)
+    options = ReaderOptions(pdf_workers=4, parallel_min_pages=2)
+    documents = asyncio.run(parse_many([long_pdf_path] * 2, limit=2, options=options))
+    assert seen == [1, 1]
+    assert documents[0].raw_text == ParsedDocument.from_file(long_pdf_path).raw_text
+
+
+def test_parse_many_keeps_order_and_captures_errors():
+    """
+    Validates that results follow input order and a bad input doesn't fail the batch.
+    """
+    results = asyncio.run(parse_many(
+        [str(FAKE_PDF), b"Hermione Granger\nPython", b"\x00junk"],
+        limit=2,
+    ))
+    assert "Hermione Granger" in results[0].raw_text
+    assert results[1].raw_text == "Hermione Granger\nPython"
+    assert results[2].metadata["extension"] == ".txt"
+
+    [error] = asyncio.run(parse_many([b"text"], file_format="xyz"))
+    assert isinstance(error, ValueError)
+
+
+def test_pandoc_failure_falls_back_to_raw_text(monkeypatch: Any):
+    """
+    Validates that a missing pandoc binary degrades to the raw markup text.
+    """
+    monkeypatch.setattr(async_parser, "PANDOC_CMD", "/nonexistent/pandoc")
+    document = asyncio.run(parse_resume(
+        b"# Hermione Granger", file_format="md", options=ReaderOptions(use_pandoc=True)
+    ))
+    assert document.raw_text == "# Hermione Granger"
+
+
+def test_odt_with_pandoc_uses_built_in_reader(tmp_path: Any, monkeypatch: Any):
+    """
+    Validates that in-memory ODT skips pandoc, and that an ODT path pandoc
+    cannot convert is read by the built-in reader rather than as raw bytes.
+    """
+    odt_path = tmp_path / "resume.odt"
+    with zipfile.ZipFile(odt_path, "w") as archive:
+        archive.writestr("mimetype", "application/vnd.oasis.opendocument.text")
+        archive.writestr("content.xml", (
+            '<office:document-content '
+            'xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0" '
+            'xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0">'
+            "<office:body><office:text><text:p>Hermione Granger</text:p></office:text>"
+            "</office:body></office:document-content>"
+        ))
+    monkeypatch.setattr(async_parser, "PANDOC_CMD", "/nonexistent/pandoc")
+    options = ReaderOptions(use_pandoc=True)
+
+    with mock.patch.object(file_reader, "read_with_pandoc") as pandoc:
+        document = asyncio.run(parse_resume(
+            odt_path.read_bytes(), file_format="odt", options=options
+        ))
+        pandoc.assert_not_called()
+    assert document.raw_text == "Hermione Granger"
+
+    document = asyncio.run(parse_resume(str(odt_path), options=options))
+    assert document.raw_text == "Hermione Granger"
+
+
+def test_ocr_runs_as_bounded_subprocesses(tmp_path: Any, monkeypatch: Any):
+    """
+    Validates that scanned pages are OCR'd by Tesseract subprocesses, with no
+    more than `ocr_limit` running at once across documents.
+    """
+    fake_tesseract = tmp_path / "tesseract"
+    fake_tesseract.write_text("#!/bin/sh\ncat > /dev/null\nsleep 0.1\necho Scanned text\n")
+    fake_tesseract.chmod(fake_tesseract.stat().st_mode | stat.S_IEXEC)
+    pytesseract = pytest.importorskip("pytesseract")
+    monkeypatch.setattr(pytesseract.pytesseract, "tesseract_cmd", str(fake_tesseract))
+    monkeypatch.setattr(async_parser, "_rasterize_page", lambda *args: b"fake png")
+
+    running, peak = 0, 0
+    original_run_tool = async_parser._run_tool  # pylint: disable=protected-access
+
+    async def tracking_run_tool(*args: Any, **kwargs: Any) -> str:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            return await original_run_tool(*args, **kwargs)
+        finally:
+            running -= 1
+
+    monkeypatch.setattr(async_parser, "_run_tool", tracking_run_tool)
+    scan = make_scan(tmp_path, 3)
+    documents = asyncio.run(parse_many([scan, scan], limit=2, ocr_limit=2))
+
+    assert [doc.pages for doc in documents] == [["Scanned text\n"] * 3] * 2
+    assert peak == 2
+
+    document = asyncio.run(parse_resume(
+        scan, options=ReaderOptions(ocr_workers=1, stage_timeout=0.15)
+    ))
+    assert document.metadata["truncated_by"] == ["timeout:ocr"]
+    assert 0 < sum(bool(page) for page in document.pages) < 3
+
+
+def test_missing_ocr_tools_keep_embedded_text(
+    tmp_path: Any, mixed_pdf_path: str, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Validates that a failed OCR of one page keeps the document's embedded
+    text and is reported, as in the synchronous reader.
+    """
+    pytest.importorskip("pdf2image")
+    monkeypatch.setenv("PATH", str(tmp_path))
+
+    document = asyncio.run(parse_resume(mixed_pdf_path))
+    assert "Hermione Granger" in document.pages[0] and document.pages[1] == ""
+    assert document.metadata["truncated_by"] == ["ocr_error"]
+
+    with pytest.raises(Exception):
+        asyncio.run(parse_resume(make_scan(tmp_path, 1)))
@@ -0,0 +1,266 @@
+"""Tests for batch mode, ensuring per-file JSONL records and error capture."""
+
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from resume_parser import batch
+from resume_parser.batch import (
+    analyze_document,
+    collect_files,
+    estimate_cost,
+    merge_outputs,
+    parse_shard,
+    run_batch,
+)
+from resume_parser.utils.batch_manifest import BatchManifest
+from resume_parser.utils.file_reader import ReaderOptions
+
+FAKE_PDF = Path(__file__).parent / "data" / "fake_resumes" / "fake_resume.pdf"
+
+
+def make_batch_dir(tmp_path: Any) -> Any:
+    """Builds a directory with two good resumes, one corrupt one and a non-resume."""
+    batch_dir = tmp_path / "resumes"
+    (batch_dir / "nested").mkdir(parents=True)
+    shutil.copy(FAKE_PDF, batch_dir / "a.pdf")
+    shutil.copy(FAKE_PDF, batch_dir / "nested" / "b.pdf")
+    (batch_dir / "broken.docx").write_bytes(b"not a zip archive")
+    (batch_dir / "notes.csv").write_text("ignored", encoding="utf-8")
+    return batch_dir
+
+
+def crash_on_marker(document, *args, **kwargs):
+    """analyze_document that kills its worker process for a marked resume."""
+    if "CRASH" in document.raw_text:
+        os._exit(1)
+    return analyze_document(document, *args, **kwargs)
+
+
+def test_collect_files(tmp_path: Any):
+    """
+    Validates that directories are searched recursively and globs are honoured.
+    """
+    batch_dir = make_batch_dir(tmp_path)
+    assert [p.split("resumes")[1] for p in collect_files(str(batch_dir))] == [
+        "/a.pdf", "/broken.docx", "/nested/b.pdf",
+    ]
+    assert len(collect_files(str(batch_dir / "**" / "*.pdf"))) == 2
+
+
+def test_run_batch_captures_errors(tmp_path: Any):
+    """
+    Validates that every file yields one JSON record and failures don't abort the run.
+    """
+    batch_dir = make_batch_dir(tmp_path)
+    for workers in (1, 2):
+        out = io.StringIO()
+        assert run_batch(str(batch_dir), out, mode="profile", workers=workers) == (2, 1)
+
+        records = {rec["file"]: rec for rec in map(json.loads, out.getvalue().splitlines())}
+        assert len(records) == 3
+        good = records[str(batch_dir / "a.pdf")]
+        assert good["ok"] and good["metadata"]["extension"] == ".pdf"
+        assert good["result"]["contact"]["email"]
+        broken = records[str(batch_dir / "broken.docx")]
+        assert not broken["ok"] and "BadZipFile" in broken["error"]
+
+
+def test_identical_files_are_parsed_once(tmp_path: Any):
+    """
+    Validates that a copy of a resume under another name reuses the parsed result.
+    """
+    batch_dir = make_batch_dir(tmp_path)
+    out = io.StringIO()
+    assert run_batch(str(batch_dir / "**" / "*.pdf"), out, mode="skills") == (2, 0)
+
+    first, copy = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert "duplicate_of" not in first
+    assert copy["duplicate_of"] == first["file"]
+    assert copy["metadata"]["source"] == copy["file"]
+    assert copy["result"] == first["result"]
+    assert copy["cost"]["actual"] == 0.0
+
+
+def test_manifest_resumes_and_only_processes_changes(tmp_path: Any):
+    """
+    Validates that a run with a manifest skips finished files, re-emits stored
+    results for new copies and parses only new or changed content.
+    """
+    batch_dir = make_batch_dir(tmp_path)
+    output = tmp_path / "results.jsonl"
+    manifest_path = str(tmp_path / "state" / "batch.manifest")
+
+    def run(target: str):
+        with BatchManifest(manifest_path) as manifest, open(output, "a", encoding="utf-8") as out:
+            counts = run_batch(target, out, mode="skills", manifest=manifest)
+            return counts, manifest.stats()
+
+    # "Interrupted" run that only got through a.pdf.
+    assert run(str(batch_dir / "a.pdf"))[0] == (1, 0)
+    counts, stats = run(str(batch_dir))
+    assert counts == (1, 1) and stats["skipped"] == 1 and stats["reused"] == 1
+
+    # Nothing changed: nothing is written.
+    counts, stats = run(str(batch_dir))
+    assert counts == (0, 0) and stats["skipped"] == 3
+
+    # A changed file is parsed again; a new copy reuses the stored result.
+    (batch_dir / "broken.docx").write_bytes(b"still not a zip archive")
+    shutil.copy(FAKE_PDF, batch_dir / "c.pdf")
+    counts, stats = run(str(batch_dir))
+    assert counts == (1, 1) and stats["skipped"] == 2 and stats["reused"] == 1
+
+    records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert [Path(rec["file"]).name for rec in records] == [
+        "a.pdf", "b.pdf", "broken.docx", "c.pdf", "broken.docx",
+    ]
+
+
+def test_shards_partition_corpus_and_merge(tmp_path: Any):
+    """
+    Validates that shards are disjoint, cover the corpus and merge back cleanly.
+    """
+    batch_dir = tmp_path / "resumes"
+    batch_dir.mkdir()
+    for i in range(8):
+        (batch_dir / f"r{i}.txt").write_text(f"Resume {i}\nPython", encoding="utf-8")
+    shutil.copy(batch_dir / "r0.txt", batch_dir / "r0_copy.txt")
+
+    for shard_by in ("content", "path"):
+        shard_files = []
+        for index in (1, 2, 3):
+            out = tmp_path / f"{shard_by}-{index}.jsonl"
+            with open(out, "w", encoding="utf-8") as f:
+                run_batch(str(batch_dir), f, mode="skills", shard=(index, 3), shard_by=shard_by)
+            shard_files.append(str(out))
+
+        merged = io.StringIO()
+        summary = merge_outputs(shard_files, merged, expected=str(batch_dir))
+        assert summary["records"] == 9
+        assert not summary["invalid"] and not summary["conflicts"] and not summary["missing"]
+        files = [json.loads(line)["file"] for line in merged.getvalue().splitlines()]
+        assert files == collect_files(str(batch_dir))
+
+    # Content sharding keeps identical files together, so the copy is not parsed again.
+    content_records = [
+        json.loads(line)
+        for index in (1, 2, 3)
+        for line in (tmp_path / f"content-{index}.jsonl").read_text(encoding="utf-8").splitlines()
+    ]
+    assert sum("duplicate_of" in rec for rec in content_records) == 1
+
+    # Overlapping shards, garbage lines and gaps are reported.
+    (tmp_path / "bad.jsonl").write_text("not json\n", encoding="utf-8")
+    shutil.copy(tmp_path / "content-1.jsonl", tmp_path / "again.jsonl")
+    summary = merge_outputs(
+        [str(tmp_path / name) for name in ("content-1.jsonl", "again.jsonl", "bad.jsonl")],
+        io.StringIO(), expected=str(batch_dir),
+    )
+    assert summary["invalid"] == [f"{tmp_path / 'bad.jsonl'}:1"]
+    assert summary["conflicts"] and summary["missing"]
+
+    with pytest.raises(ValueError):
+        parse_shard("4/3")
+    with pytest.raises(ValueError):
+        parse_shard("two/3")
+
+
+def test_cli_batch_writes_jsonl(tmp_path: Any):
+    """
+    Runs the CLI in batch skills mode and checks the JSONL output file.
+    """
+    batch_dir = make_batch_dir(tmp_path)
+    output = tmp_path / "results.jsonl"
+    result = subprocess.run(
+        [sys.executable, "-m", "resume_parser.cli", "--batch", str(batch_dir / "*.pdf"),
+         "--mode", "skills", "--sub-mode", "general", "--output", str(output)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        timeout=30,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr.decode()
+    assert "Processed 1 resumes (0 failed)" in result.stderr.decode()
+    [record] = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert record["ok"] and "skills" in record["result"]
+
+
+def test_estimate_cost_ranks_documents(tmp_path: Any, long_pdf_path: str):
+    """
+    Validates that scans cost more than long PDFs, which cost more than short ones.
+    """
+    pdfium = pytest.importorskip("pypdfium2")
+    scan = pdfium.PdfDocument.new()
+    scan.new_page(612, 792)
+    scan.new_page(612, 792)
+    scan_path = tmp_path / "scan.pdf"
+    scan.save(str(scan_path))
+    text_path = tmp_path / "resume.txt"
+    text_path.write_text("Hermione Granger", encoding="utf-8")
+
+    paths = (str(scan_path), long_pdf_path, str(FAKE_PDF), str(text_path))
+    costs = [estimate_cost(path) for path in paths]
+    assert costs == sorted(costs, reverse=True)
+    assert estimate_cost(long_pdf_path, ReaderOptions(max_pages=1)) == pytest.approx(
+        estimate_cost(str(FAKE_PDF)), rel=0.5
+    )
+    assert estimate_cost(str(scan_path), ReaderOptions(max_ocr_pages=0)) < costs[1]
+    assert estimate_cost(str(tmp_path / "missing.pdf")) == 0.0
+
+
+def test_records_report_estimated_and_actual_cost(tmp_path: Any):
+    """
+    Validates that each record carries the estimate and the measured time.
+    """
+    batch_dir = make_batch_dir(tmp_path)
+    for schedule in ("cost", "fifo"):
+        out = io.StringIO()
+        run_batch(str(batch_dir), out, mode="skills", workers=2, schedule=schedule)
+        for record in map(json.loads, out.getvalue().splitlines()):
+            assert record["cost"]["estimated"] >= 0
+            assert record["cost"]["actual"] > 0 or "duplicate_of" in record
+    with pytest.raises(ValueError):
+        run_batch(str(batch_dir), io.StringIO(), schedule="random")
+
+
+def test_single_worker_skips_cost_estimates(tmp_path: Any, monkeypatch: Any):
+    """
+    Validates that a sequential run does not probe files for scheduling.
+    """
+    def fail(*args):
+        raise AssertionError(f"estimate_cost called for {args[0]}")
+
+    monkeypatch.setattr(batch, "estimate_cost", fail)
+    out = io.StringIO()
+    run_batch(str(make_batch_dir(tmp_path)), out, mode="skills", workers=1)
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    parsed = [record for record in records if "duplicate_of" not in record]
+    assert parsed and all(record["cost"]["estimated"] is None for record in parsed)
+
+
+def test_dead_worker_fails_only_its_file(tmp_path: Any, monkeypatch: Any):
+    """
+    Validates that a worker process dying mid-file fails that file alone,
+    and every other file still gets its record.
+    """
+    batch_dir = tmp_path / "resumes"
+    batch_dir.mkdir()
+    for name in ("a", "b", "c", "d"):
+        (batch_dir / f"{name}.txt").write_text(f"Resume {name}: Python", encoding="utf-8")
+    (batch_dir / "crash.txt").write_text("CRASH", encoding="utf-8")
+    monkeypatch.setattr(batch, "analyze_document", crash_on_marker)
+
+    out = io.StringIO()
+    assert run_batch(str(batch_dir), out, mode="skills", workers=2) == (4, 1)
+    records = {Path(r["file"]).name: r for r in map(json.loads, out.getvalue().splitlines())}
+    assert len(records) == 5
+    assert records["crash.txt"]["error"].startswith("BrokenProcessPool")
+    assert all(records[f"{name}.txt"]["ok"] for name in ("a", "b", "c", "d"))
@@ -29,3 +29,22 @@ def test_cli_runs_profile_check(fake_resume_path: Any):
     assert "Professional Summary" in output_text
     assert "Education" in output_text
     assert "Work Experience" in output_text
+
+
+def test_cli_runs_skill_hits(fake_resume_path: Any):
+    """
+    Runs cli.py with `--sub-mode hits` and checks the occurrences table.
+    """
+    result = subprocess.run(
+        [sys.executable, "-m", "resume_parser.cli", "--mode", "skills",
+         "--sub-mode", "hits", "--file", str(fake_resume_path)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        timeout=10,
+        check=False,
+    )
+
+    assert result.returncode == 0, f"CLI exited with error: {result.stderr.decode()}"
+    output_text = result.stdout.decode()
+    assert "Skill Occurrences" in output_text
+    assert "Python" in output_text
@@ -1,7 +1,10 @@
 """Tests for the ContactExtractor, ensuring basic contact fields are parsed correctly."""
 
 from typing import Any
+from unittest import mock
 from resume_parser.extractors.contact_extractor import ContactExtractor
+from resume_parser.utils import file_reader
+from resume_parser.utils.parsed_document import ParsedDocument
 
 
 def test_contact_extraction(fake_resume_path: Any):
@@ -21,3 +24,40 @@ def test_contact_extraction(fake_resume_path: Any):
     assert results["name"], "Name should not be empty"
     assert "@" in results["email"], "Email must contain @"
     assert results["phone"], "Phone number should not be empty"
+
+
+CONTACT_LINES = ["Hermione Granger", "hermione@hogwarts.com", "705.555.0121"]
+
+
+def test_contact_extraction_stops_after_first_page(make_text_pdf: Any):
+    """
+    Validates that ContactExtractor reads only the first page of a long PDF
+    when every field, URLs included, is found there.
+    """
+    pdf_path = make_text_pdf("long.pdf", [
+        CONTACT_LINES + [
+            "linkedin.com/in/hermione", "github.com/hermione", "https://hermione.dev",
+        ],
+        *[["Experience"]] * 9,
+    ])
+    # The later pages are too short to skip OCR, so reading any of them
+    # would show up as an OCR call.
+    with mock.patch.object(file_reader, "_ocr_page", return_value="") as ocr:
+        results = ContactExtractor().extract(pdf_path)
+
+    ocr.assert_not_called()
+    assert results["name"] == "Hermione Granger"
+    assert results["linkedin"] == "linkedin.com/in/hermione"
+
+
+def test_urls_on_later_pages_are_found(make_text_pdf: Any):
+    """
+    Validates that a LinkedIn link only on page two is found from a path,
+    just as from a parsed document.
+    """
+    pdf_path = make_text_pdf("two_pages.pdf", [
+        CONTACT_LINES, ["https://www.linkedin.com/in/hermione-granger"],
+    ])
+    results = ContactExtractor().extract(pdf_path)
+    assert results["linkedin"] == "https://www.linkedin.com/in/hermione-granger"
+    assert results == ContactExtractor().extract(ParsedDocument.from_file(pdf_path))
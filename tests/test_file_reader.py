@@ -0,0 +1,299 @@
+"""Tests for file_reader, ensuring page-level PDF extraction behaves consistently."""
+
+import gc
+import os
+import time
+import warnings
+import zipfile
+from pathlib import Path
+from typing import Any
+
+import pdfplumber
+import pytest
+
+from resume_parser.utils import file_reader
+from resume_parser.utils.file_reader import (
+    ReaderOptions, ReadReport, iter_resume_pages, read_pdf_pages, read_resume, read_resume_pages
+)
+from resume_parser.utils.parsed_document import ParsedDocument
+from resume_parser.utils.text_cache import TextCache
+
+FAKE_PDF = Path(__file__).parent / "data" / "fake_resumes" / "fake_resume.pdf"
+
+
+def test_parallel_pdf_matches_sequential(long_pdf_path: str):
+    """
+    Validates that page-parallel extraction returns the same pages, in order,
+    as a sequential read.
+    """
+    sequential = read_pdf_pages(long_pdf_path)
+    parallel = read_pdf_pages(
+        long_pdf_path, ReaderOptions(pdf_workers=3, parallel_min_pages=2)
+    )
+
+    assert len(sequential) == 10
+    assert parallel == sequential
+    assert read_resume(long_pdf_path).count("Hermione Granger") == 10
+
+
+def test_ocr_only_runs_on_pages_without_text(mixed_pdf_path: str, monkeypatch: Any):
+    """
+    Validates that OCR is applied per page, only where embedded text is missing.
+    """
+    ocr_calls = []
+
+    def fake_ocr_page(file_path: str, page_number: int, dpi: int, _deadline=None) -> str:
+        ocr_calls.append((file_path, page_number, dpi))
+        return "Certificate of Completion"
+
+    monkeypatch.setattr(file_reader, "_ocr_page", fake_ocr_page)
+    pages = read_pdf_pages(mixed_pdf_path, ReaderOptions(ocr_workers=2, ocr_dpi=150))
+
+    assert ocr_calls == [(mixed_pdf_path, 2, 150)]
+    assert "Hermione Granger" in pages[0]
+    assert pages[1] == "Certificate of Completion"
+
+
+def test_missing_ocr_tools_keep_embedded_text(
+    tmp_path: Any, mixed_pdf_path: str, monkeypatch: Any
+):
+    """
+    Validates that a text PDF with a blank page still reads when poppler and
+    tesseract are missing, while a pure scan reports the missing tools.
+    """
+    pdfium = pytest.importorskip("pypdfium2")
+    pytest.importorskip("pdf2image")
+    scan = pdfium.PdfDocument.new()
+    scan.new_page(612, 792)
+    scan_path = tmp_path / "scan.pdf"
+    scan.save(str(scan_path))
+
+    # No external binaries can be found on an empty PATH.
+    monkeypatch.setenv("PATH", str(tmp_path))
+
+    for workers in (1, 2):
+        report = ReadReport()
+        pages = read_pdf_pages(mixed_pdf_path, ReaderOptions(ocr_workers=workers), report)
+        assert "Hermione Granger" in pages[0] and pages[1] == ""
+        assert report.truncated_by == ["ocr_error"]
+        assert report.ocr_errors[0].startswith("page 2: ")
+
+    document = ParsedDocument.from_file(mixed_pdf_path)
+    assert "Hermione Granger" in document.raw_text
+    assert document.metadata["truncated_by"] == ["ocr_error"]
+    assert len(document.metadata["ocr_errors"]) == 1
+    assert "Hermione Granger" in "".join(iter_resume_pages(mixed_pdf_path))
+
+    with pytest.raises(Exception, match="(?i)poppler|pdfinfo"):
+        read_pdf_pages(str(scan_path))
+    with pytest.raises(Exception, match="(?i)poppler|pdfinfo"):
+        list(iter_resume_pages(str(scan_path)))
+
+
+def test_iter_resume_pages_is_lazy(long_pdf_path: str, monkeypatch: Any):
+    """
+    Validates that pages are only parsed as the iterator is consumed.
+    """
+    parsed = []
+    original = pdfplumber.page.Page.extract_text
+
+    def counting_extract_text(page, *args, **kwargs):
+        parsed.append(page.page_number)
+        return original(page, *args, **kwargs)
+
+    monkeypatch.setattr(pdfplumber.page.Page, "extract_text", counting_extract_text)
+    pages = iter_resume_pages(long_pdf_path)
+    first = next(pages)
+    pages.close()
+
+    assert "Hermione Granger" in first
+    assert parsed == [1]
+
+
+def test_misnamed_files_are_read_by_content(tmp_path: Any):
+    """
+    Validates that the content signature, not the extension, picks the reader.
+    """
+    rtf_as_doc = tmp_path / "resume.doc"
+    rtf_as_doc.write_text(r"{\rtf1\ansi Hermione Granger\par Python}", encoding="latin-1")
+    assert read_resume(str(rtf_as_doc)) == "Hermione Granger\nPython"
+
+    pdf_as_docx = tmp_path / "resume.docx"
+    pdf_as_docx.write_bytes(FAKE_PDF.read_bytes())
+    assert read_resume(str(pdf_as_docx)) == read_resume(str(FAKE_PDF))
+    assert read_resume(FAKE_PDF.read_bytes(), file_format="txt") == read_resume(str(FAKE_PDF))
+
+    assert file_reader.resolve_format(b"<html><body>CV</body></html>", "htm") == ".htm"
+    with pytest.raises(ValueError):
+        read_resume(b"plain text", file_format="xyz")
+
+
+def test_extensionless_paths_need_a_signature(tmp_path: Any):
+    """
+    Validates that an extensionless path is read by its signature, and is
+    unsupported (not guessed to be text) when it has none; bytes without a
+    declared format are still read as text.
+    """
+    pdf_file = tmp_path / "resume"
+    pdf_file.write_bytes(FAKE_PDF.read_bytes())
+    assert read_resume(str(pdf_file)) == read_resume(str(FAKE_PDF))
+
+    unknown = tmp_path / "notes"
+    unknown.write_bytes(b"\x00\x01 opaque")
+    with pytest.raises(ValueError, match="Unsupported"):
+        read_resume(str(unknown))
+    assert read_resume(b"Hermione Granger") == "Hermione Granger"
+
+
+def test_sniffing_zip_paths_closes_the_file(tmp_path: Any):
+    """
+    Validates that detecting a DOCX/ODT from a path does not leak its file handle.
+    """
+    docx_path = tmp_path / "resume.docx"
+    with zipfile.ZipFile(docx_path, "w") as archive:
+        archive.writestr("word/document.xml", "<w:document/>")
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        assert file_reader.detect_signature(str(docx_path)) == ".docx"
+        gc.collect()
+    assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
+
+def test_registry_fallbacks_are_tried_in_order(monkeypatch: Any):
+    """
+    Validates that a failing reader falls back to its registered alternatives.
+    """
+    def broken(source: Any, options: Any, report: Any) -> list:
+        raise KeyError("word/document.xml")
+
+    attempts = []
+    monkeypatch.setitem(file_reader.READERS, ".docx", file_reader.FormatReader(
+        read=broken, fallbacks=(".md", ".txt"),
+    ))
+    monkeypatch.setitem(file_reader.READERS, ".md", file_reader.FormatReader(
+        read=lambda *args: attempts.append(".md") or broken(*args),
+    ))
+    assert read_resume(b"Hermione Granger", file_format="docx") == "Hermione Granger"
+    assert attempts == [".md"]
+
+    monkeypatch.setitem(file_reader.READERS, ".docx", file_reader.FormatReader(read=broken))
+    with pytest.raises(KeyError):
+        read_resume(b"Hermione Granger", file_format="docx")
+    assert file_reader.get_reader(".pdf").cost > file_reader.get_reader(".txt").cost
+
+
+def test_page_and_byte_budgets_truncate(long_pdf_path: str, tmp_path: Any):
+    """
+    Validates that page and size caps return partial results flagged as truncated.
+    """
+    for options in (
+        ReaderOptions(max_pages=3),
+        ReaderOptions(max_pages=3, pdf_workers=2, parallel_min_pages=2),
+    ):
+        report = ReadReport()
+        pages = read_resume_pages(long_pdf_path, options=options, report=report)
+        assert len(pages) == 3
+        assert report.truncated_by == ["max_pages"]
+
+    lazy_report = ReadReport()
+    lazy = list(iter_resume_pages(long_pdf_path, ReaderOptions(max_pages=2), report=lazy_report))
+    assert len(lazy) == 2 and lazy_report.truncated
+
+    with TextCache(str(tmp_path)) as cache:
+        capped = ParsedDocument.from_source(
+            long_pdf_path, cache=cache, options=ReaderOptions(max_pages=3)
+        )
+        assert cache.stats()["entries"] == 0, "Truncated reads must not be cached"
+    assert capped.metadata["truncated"] and capped.metadata["truncated_by"] == ["max_pages"]
+
+    document = ParsedDocument.from_source(
+        b"x" * 100, file_format="txt", options=ReaderOptions(max_bytes=10)
+    )
+    assert document.raw_text == ""
+    assert document.metadata["truncated_by"] == ["max_bytes"]
+    assert not ParsedDocument.from_source(b"x" * 10, file_format="txt").metadata["truncated"]
+
+
+def test_ocr_quota_and_stage_timeout(scan_pdf_path: str, monkeypatch: Any):
+    """
+    Validates that OCR stops at the page quota or the stage deadline.
+    """
+    def slow_ocr_page(_source: str, page_number: int, _dpi: int, _deadline=None) -> str:
+        time.sleep(0.2)
+        return f"Scanned page {page_number}"
+
+    monkeypatch.setattr(file_reader, "_ocr_page", slow_ocr_page)
+
+    report = ReadReport()
+    pages = read_pdf_pages(scan_pdf_path, ReaderOptions(max_ocr_pages=2), report)
+    assert pages == ["Scanned page 1", "Scanned page 2", "", ""]
+    assert report.truncated_by == ["max_ocr_pages"]
+
+    for workers in (1, 2):
+        report = ReadReport()
+        pages = read_pdf_pages(
+            scan_pdf_path, ReaderOptions(ocr_workers=workers, stage_timeout=0.3), report
+        )
+        assert 0 < sum(bool(page) for page in pages) < 4
+        assert report.truncated_by == ["timeout:ocr"]
+
+
+def _slow_page_range(_source: str, start: int, stop: int) -> list:
+    """Stand-in for `_extract_page_range` that leaves a marker if it ever finishes."""
+    time.sleep(1)
+    Path(os.environ["SLOW_PAGE_RANGE_MARKER"]).touch()
+    return [""] * (stop - start)
+
+
+def test_stage_timeout_kills_running_text_workers(
+    tmp_path: Any, long_pdf_path: str, monkeypatch: Any
+):
+    """
+    Validates that a text-stage timeout terminates the worker processes of
+    page chunks still running instead of leaving them to finish.
+    """
+    marker = tmp_path / "finished"
+    monkeypatch.setenv("SLOW_PAGE_RANGE_MARKER", str(marker))
+    monkeypatch.setattr(file_reader, "_extract_page_range", _slow_page_range)
+
+    report = ReadReport()
+    start = time.monotonic()
+    pages = file_reader.extract_pdf_text_pages(
+        long_pdf_path, ReaderOptions(pdf_workers=2, parallel_min_pages=2, stage_timeout=0.2),
+        report,
+    )
+    assert time.monotonic() - start < 0.9
+    assert not pages and report.truncated_by == ["timeout:text"]
+    time.sleep(1.2)
+    assert not marker.exists()
+
+
+def test_stage_timeout_kills_running_ocr(
+    tmp_path: Any, scan_pdf_path: str, monkeypatch: Any
+):
+    """
+    Validates that a stage timeout kills the Tesseract processes of pages
+    still running instead of leaving them to finish in the background.
+    """
+    image = pytest.importorskip("PIL.Image")
+    pdf2image = pytest.importorskip("pdf2image")
+    marker = tmp_path / "finished"
+    fake_tesseract = tmp_path / "tesseract"
+    fake_tesseract.write_text(f"#!/bin/sh\nsleep 1\ntouch {marker}\n")
+    fake_tesseract.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setattr(
+        pdf2image, "convert_from_path", lambda *args, **kwargs: [image.new("L", (8, 8))]
+    )
+
+    for workers in (1, 2):
+        report = ReadReport()
+        start = time.monotonic()
+        pages = read_pdf_pages(
+            scan_pdf_path, ReaderOptions(ocr_workers=workers, stage_timeout=0.2), report
+        )
+        assert time.monotonic() - start < 0.9
+        assert not any(pages) and report.truncated_by == ["timeout:ocr"]
+    time.sleep(1.2)
+    assert not marker.exists()
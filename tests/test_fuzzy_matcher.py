@@ -0,0 +1,67 @@
+"""Tests for FuzzySkillMatcher, ensuring near misses are found without false alarms."""
+
+from pathlib import Path
+
+from resume_parser.utils.fuzzy_matcher import FuzzySkillMatcher
+from resume_parser.utils.parsed_document import ParsedDocument
+from resume_parser.utils.skill_matcher import fold_case
+from resume_parser.utils.skills_checker import SkillsChecker
+from resume_parser.utils.skills_index import get_skills_index
+
+FAKE_PDF = Path(__file__).parent / "data" / "fake_resumes" / "fake_resume.pdf"
+
+
+def names(found):
+    """Skill names from a set of (category, name) pairs."""
+    return {name for _, name in found}
+
+
+def test_typos_and_split_words_are_recovered():
+    """
+    Validates that misspelled and broken skill names are matched fuzzily and
+    that exact matches are unchanged.
+    """
+    index = get_skills_index()
+    matcher = FuzzySkillMatcher(index.matcher)
+    text = "Ran Kubernets and Postgress; trained Tensor Flow models in Pyth on with Djnago"
+
+    assert not names(index.matcher.match(text)) & {"Kubernetes", "PostgreSQL", "Python"}
+    assert {"Kubernetes", "PostgreSQL", "TensorFlow", "Python", "Django"} <= names(
+        matcher.match(text)
+    )
+    assert matcher.match("Python and AWS") == index.matcher.match("Python and AWS")
+
+
+def test_common_words_are_not_matched():
+    """
+    Validates that ordinary words near a skill name (a skill missing a
+    one-letter part, or a word shorter than the fuzzy minimum) are not reported.
+    """
+    index = get_skills_index()
+    matcher = FuzzySkillMatcher(index.matcher)
+    text = "Objective: reach customers, locker room, spare parts, stark contrast, panda"
+    assert matcher.match(text) == index.matcher.match(text)
+    assert matcher.lookup("panda") is None and matcher.lookup("pandass") == "pandas"
+
+    document = ParsedDocument.from_file(str(FAKE_PDF))
+    assert matcher.match(document.raw_text) == index.matcher.match(document.raw_text)
+
+
+def test_fuzzy_checker_reports_offsets_of_near_misses():
+    """
+    Validates that SkillsChecker(fuzzy=True) reports where a near miss was
+    found, with the alias it was taken for.
+    """
+    text = "SKILLS\nKubernets, Pyth on\n"
+    hits = SkillsChecker(fuzzy=True).extract_skill_hits(ParsedDocument.from_text(text))
+
+    kubernetes = hits["Kubernetes"]["hits"]
+    assert [(hit["text"], hit["alias"], hit["section"]) for hit in kubernetes] == [
+        ("Kubernets", "kubernetes", "skills"),
+    ]
+    assert hits["Python"]["hits"][0]["text"] == "Pyth on"
+    assert "Kubernetes" not in SkillsChecker().extract_skill_hits(ParsedDocument.from_text(text))
+
+    # Scan results stay ordered by end offset, like the exact matcher's.
+    ends = [end for _, end, _ in get_skills_index().fuzzy_matcher.scan(fold_case(text))]
+    assert ends == sorted(ends)
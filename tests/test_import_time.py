@@ -0,0 +1,67 @@
+"""Import-time benchmark, keeping CLI startup within budget.
+
+Runs `python -X importtime` in a fresh interpreter and checks that heavy
+reader and UI libraries are not loaded just by importing the package, and
+that the cumulative import time of the CLI module stays under budget.
+"""
+
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+# Cumulative import budget for `resume_parser.cli`, in microseconds.
+# Measured at roughly 60 ms locally; the margin absorbs slower CI machines.
+IMPORT_BUDGET_US = 250_000
+
+HEAVY_MODULES = {
+    "pdfplumber", "docx", "mammoth", "pypandoc", "pdf2image",
+    "pytesseract", "rich", "pyfiglet",
+}
+
+
+def import_times(module: str) -> Dict[str, int]:
+    """
+    Imports `module` in a fresh interpreter and returns the cumulative import
+    time (in microseconds) of every module that was loaded.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        timeout=30,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.decode().splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("module", [
+    "resume_parser.cli",
+    "resume_parser.utils.file_reader",
+    "resume_parser.utils.skills_checker",
+])
+def test_heavy_modules_are_imported_lazily(module: str):
+    """
+    Validates that importing the package does not load heavy dependencies.
+    """
+    loaded = set(import_times(module))
+    assert not HEAVY_MODULES & loaded, f"{module} eagerly imports {HEAVY_MODULES & loaded}"
+
+
+def test_cli_import_within_budget():
+    """
+    Validates that importing the CLI stays within the startup budget.
+    """
+    times = import_times("resume_parser.cli")
+    assert times["resume_parser.cli"] < IMPORT_BUDGET_US, (
+        f"resume_parser.cli took {times['resume_parser.cli']} us to import "
+        f"(budget {IMPORT_BUDGET_US} us)"
+    )
@@ -0,0 +1,224 @@
+"""Tests for the built-in HTML, Markdown, RTF, ODT and DOCX readers."""
+
+import zipfile
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from resume_parser.utils import file_reader
+from resume_parser.utils.file_reader import ReaderOptions, read_resume
+from resume_parser.utils.markup_readers import (
+    docx_to_text, html_to_text, markdown_to_text, odt_to_text, rtf_to_text
+)
+
+
+def test_html_to_text():
+    """
+    Validates that HTML blocks, lists and tables become readable lines.
+    """
+    html = (
+        "<html><head><title>CV</title><style>p {color: red}</style></head><body>"
+        "<h1>Hermione   Granger</h1><p>hermione@hogwarts.com &amp; "
+        "<a href='https://github.com/hg'>GitHub</a></p>"
+        "<h2>Skills</h2><ul><li>Python</li><li>C++</li></ul>"
+        "<table><tr><td>Ministry of Magic</td><td>2014 - 2016</td></tr></table>"
+        "<script>alert('x')</script></body></html>"
+    )
+    assert html_to_text(html).splitlines() == [
+        "Hermione Granger",
+        "hermione@hogwarts.com & GitHub",
+        "Skills",
+        "• Python",
+        "• C++",
+        "Ministry of Magic | 2014 - 2016",
+    ]
+
+
+def test_markdown_to_text():
+    """
+    Validates that Markdown syntax is stripped while links and bullets survive.
+    """
+    markdown = (
+        "# Hermione Granger\n"
+        "[LinkedIn](https://linkedin.com/in/hgranger) | **Data Wizard**\n\n"
+        "## Skills\n"
+        "* `Python`, _Machine Learning_, snake_case_name\n"
+        "- C#\n"
+    )
+    assert markdown_to_text(markdown).splitlines() == [
+        "Hermione Granger",
+        "LinkedIn (https://linkedin.com/in/hgranger) | Data Wizard",
+        "",
+        "Skills",
+        "• Python, Machine Learning, snake_case_name",
+        "• C#",
+    ]
+
+
+def test_rtf_to_text():
+    """
+    Validates that RTF control words, tables and escapes are decoded.
+    """
+    rtf = (
+        r"{\rtf1\ansi\ansicpg1252{\fonttbl{\f0 Arial;}}{\colortbl;\red0\green0\blue0;}"
+        r"{\*\generator Writer;}\f0 Hermione Granger\par "
+        r"Caf\'e9 \u8212? Data\tab Wizard\line Python, SQL\par"
+        r"{\info{\title Resume}}}"
+    )
+    assert rtf_to_text(rtf).splitlines() == [
+        "Hermione Granger",
+        "Café — Data\tWizard",
+        "Python, SQL",
+    ]
+
+
+ODT_CONTENT = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<office:document-content '
+    'xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0" '
+    'xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0" '
+    'xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0">'
+    "<office:body><office:text>"
+    "<text:h>Hermione<text:s/>Granger</text:h>"
+    "<text:list><text:list-item><text:p>Python</text:p></text:list-item></text:list>"
+    "<table:table><table:table-row>"
+    "<table:table-cell><text:p>Hogwarts</text:p></table:table-cell>"
+    "<table:table-cell><text:p>2017</text:p></table:table-cell>"
+    "</table:table-row></table:table>"
+    "</office:text></office:body></office:document-content>"
+)
+ODT_LINES = ["Hermione Granger", "• Python", "Hogwarts | 2017"]
+
+
+def test_odt_to_text(tmp_path: Any):
+    """
+    Validates that ODT paragraphs, list items and table rows are streamed in order.
+    """
+    odt_path = tmp_path / "resume.odt"
+    with zipfile.ZipFile(odt_path, "w") as archive:
+        archive.writestr("mimetype", "application/vnd.oasis.opendocument.text")
+        archive.writestr("content.xml", ODT_CONTENT)
+
+    assert odt_to_text(str(odt_path)).splitlines() == ODT_LINES
+
+
+def test_in_memory_odt_with_pandoc(tmp_path: Any):
+    """
+    Validates that in-memory ODT is never decoded as text when pandoc is
+    requested: pandoc gets a temporary file, and the built-in reader is used
+    when pandoc is unavailable.
+    """
+    odt_path = tmp_path / "resume.odt"
+    with zipfile.ZipFile(odt_path, "w") as archive:
+        archive.writestr("mimetype", "application/vnd.oasis.opendocument.text")
+        archive.writestr("content.xml", ODT_CONTENT)
+    data = odt_path.read_bytes()
+    options = ReaderOptions(use_pandoc=True)
+
+    def convert_file(path, to, format=None):  # pylint: disable=redefined-builtin
+        assert path.endswith(".odt") and (to, format) == ("plain", "odt")
+        with open(path, "rb") as f:
+            assert f.read() == data
+        return "pandoc"
+
+    with mock.patch("pypandoc.convert_file", side_effect=convert_file):
+        assert read_resume(data, file_format="odt", options=options) == "pandoc"
+
+    with mock.patch("pypandoc.convert_file", side_effect=OSError("No pandoc was found")):
+        assert read_resume(data, file_format="odt", options=options).splitlines() == ODT_LINES
+        assert read_resume(str(odt_path), options=options).splitlines() == ODT_LINES
+        with pytest.raises(ValueError):
+            read_resume(data[:40], file_format="odt")
+
+
+def test_invalid_odt_uses_pandoc_only_when_requested():
+    """
+    Validates that a broken ODT archive is reported as a parse failure
+    unless pandoc is enabled, in which case pandoc gets a try.
+    """
+    with mock.patch.object(file_reader, "read_with_pandoc", return_value="pandoc") as pandoc:
+        with pytest.raises(ValueError, match="Could not parse the ODT document"):
+            file_reader.read_odt(b"not a zip archive")
+        pandoc.assert_not_called()
+        assert file_reader.read_odt(
+            b"not a zip archive", ReaderOptions(use_pandoc=True)
+        ) == "pandoc"
+
+
+def test_pandoc_is_opt_in(tmp_path: Any):
+    """
+    Validates that markup files are read in-process unless pandoc is requested.
+    """
+    md_path = tmp_path / "resume.md"
+    md_path.write_text("# Hermione Granger\n", encoding="utf-8")
+
+    with mock.patch.object(file_reader, "read_with_pandoc", return_value="pandoc") as pandoc:
+        assert read_resume(str(md_path)) == "Hermione Granger"
+        pandoc.assert_not_called()
+        assert read_resume(str(md_path), options=ReaderOptions(use_pandoc=True)) == "pandoc"
+
+
+DOCX_DOCUMENT = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"><w:body>'
+    "<w:p><w:r><w:t>Experience</w:t></w:r></w:p>"
+    "<w:p><w:pPr><w:numPr><w:ilvl w:val=\"0\"/></w:numPr></w:pPr>"
+    "<w:r><w:t>Built</w:t><w:t xml:space=\"preserve\"> models</w:t></w:r></w:p>"
+    "<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Skills</w:t></w:r></w:p></w:tc>"
+    "<w:tc><w:p><w:r><w:t>Python, SQL</w:t></w:r></w:p></w:tc></w:tr></w:tbl>"
+    "<w:p><w:r><mc:AlternateContent><mc:Choice><w:drawing><w:txbxContent>"
+    "<w:p><w:r><w:t>hermione@hogwarts.com</w:t></w:r></w:p>"
+    "</w:txbxContent></w:drawing></mc:Choice><mc:Fallback><w:pict><w:txbxContent>"
+    "<w:p><w:r><w:t>hermione@hogwarts.com</w:t></w:r></w:p>"
+    "</w:txbxContent></w:pict></mc:Fallback></mc:AlternateContent></w:r></w:p>"
+    "</w:body></w:document>"
+)
+DOCX_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<w:hdr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    "<w:p><w:r><w:t>Hermione Granger</w:t></w:r></w:p></w:hdr>"
+)
+
+
+def test_docx_to_text_includes_tables_headers_and_text_boxes(tmp_path: Any):
+    """
+    Validates that the streaming DOCX reader emits headers, table rows and
+    text boxes (once) in document order.
+    """
+    docx_path = tmp_path / "resume.docx"
+    with zipfile.ZipFile(docx_path, "w") as archive:
+        archive.writestr("word/document.xml", DOCX_DOCUMENT)
+        archive.writestr("word/header1.xml", DOCX_HEADER)
+        archive.writestr("word/header2.xml", DOCX_HEADER)
+
+    assert read_resume(str(docx_path)).splitlines() == [
+        "Hermione Granger",
+        "Experience",
+        "• Built models",
+        "Skills | Python, SQL",
+        "hermione@hogwarts.com",
+    ]
+
+
+def test_docx_to_text_covers_python_docx_paragraphs(tmp_path: Any):
+    """
+    Validates that every paragraph python-docx sees is also extracted.
+    """
+    docx = pytest.importorskip("docx")
+    document = docx.Document()
+    document.sections[0].header.paragraphs[0].text = "Hermione Granger"
+    document.add_paragraph("Objective")
+    document.add_paragraph("Data Scientist", style="List Bullet")
+    table = document.add_table(rows=1, cols=2)
+    table.cell(0, 0).text = "AWS"
+    table.cell(0, 1).text = "Machine Learning"
+    docx_path = tmp_path / "resume.docx"
+    document.save(str(docx_path))
+
+    text = docx_to_text(str(docx_path))
+    for para in docx.Document(str(docx_path)).paragraphs:
+        assert para.text in text
+    assert "Hermione Granger" in text
+    assert "AWS | Machine Learning" in text
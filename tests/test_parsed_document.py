@@ -0,0 +1,73 @@
+# pylint: disable=duplicate-code
+"""Tests for ParsedDocument, ensuring extractors can share a single file read."""
+
+import io
+from typing import Any
+from unittest import mock
+
+from resume_parser.extractors.contact_extractor import ContactExtractor
+from resume_parser.extractors.education_extractor import EducationExtractor
+from resume_parser.extractors.experience_extractor import ExperienceExtractor
+from resume_parser.extractors.summary_extractor import SummaryExtractor
+from resume_parser.utils import parsed_document
+from resume_parser.utils.file_reader import sniff_format
+from resume_parser.utils.parsed_document import ParsedDocument
+from resume_parser.utils.skills_checker import SkillsChecker
+
+
+def test_extractors_share_parsed_document(fake_resume_path: Any):
+    """
+    Validates that a ParsedDocument is read once and gives the same results
+    as passing the file path to each extractor.
+    """
+    extractors = [
+        SummaryExtractor(), ContactExtractor(),
+        EducationExtractor(), ExperienceExtractor(),
+    ]
+
+    with mock.patch.object(
+        parsed_document, "read_resume_pages", wraps=parsed_document.read_resume_pages
+    ) as reader:
+        document = ParsedDocument.from_file(str(fake_resume_path))
+        shared_results = [ex.extract(document) for ex in extractors]
+    assert reader.call_count == 1, "File should be read exactly once"
+
+    assert document.pages, "Document should contain at least one page"
+    assert document.metadata["page_count"] == len(document.pages)
+    assert document.normalized_text
+
+    path_results = [ex.extract(str(fake_resume_path)) for ex in extractors]
+    assert shared_results == path_results
+
+
+def test_in_memory_sources_match_file(fake_resume_path: Any):
+    """
+    Validates that bytes, memoryview and file-like input give the same
+    results as the file path, with or without an explicit format.
+    """
+    data = fake_resume_path.read_bytes()
+    from_path = ParsedDocument.from_file(str(fake_resume_path))
+
+    for source in (data, memoryview(data), io.BytesIO(data)):
+        document = ParsedDocument.from_source(source)
+        assert document.raw_text == from_path.raw_text
+        assert document.metadata["source"] == "<memory>"
+        assert document.metadata["extension"] == ".pdf"
+
+    assert ParsedDocument.from_source(data, file_format="pdf").pages == from_path.pages
+
+    contact = ContactExtractor()
+    assert contact.extract(data) == contact.extract(str(fake_resume_path))
+    assert contact.extract(io.BytesIO(data), file_format="pdf") == contact.extract(data)
+    assert SkillsChecker().extract_general_skills(memoryview(data)) == (
+        SkillsChecker().extract_general_skills(from_path)
+    )
+
+
+def test_sniff_format():
+    """Validates content sniffing for in-memory input without a format."""
+    assert sniff_format(b"%PDF-1.7\n...") == ".pdf"
+    assert sniff_format(b"{\\rtf1\\ansi Hello}") == ".rtf"
+    assert sniff_format(b"<!DOCTYPE html><html></html>") == ".html"
+    assert sniff_format(b"Plain resume text") == ".txt"
+    assert ParsedDocument.from_source(b"Jane Doe\nPython").raw_text == "Jane Doe\nPython"
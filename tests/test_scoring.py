@@ -0,0 +1,85 @@
+"""Tests for the corpus skill matrix, ensuring vectorized ranking matches SkillsChecker."""
+
+import io
+import json
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from resume_parser.batch import run_batch
+from resume_parser.utils.parsed_document import ParsedDocument
+from resume_parser.utils.skills_checker import SkillsChecker
+
+np = pytest.importorskip("numpy")
+
+# pylint: disable=wrong-import-position
+from resume_parser.scoring import SkillMatrix
+
+FAKE_PDF = Path(__file__).parent / "data" / "fake_resumes" / "fake_resume.pdf"
+
+TEXTS = [
+    ("backend", "Python, Django, PostgreSQL, Docker, Kubernetes, AWS, REST APIs"),
+    ("frontend", "JavaScript, TypeScript, React.js, HTML, CSS"),
+    ("empty", "Gardening and cooking"),
+]
+
+
+def test_role_scores_match_rank_roles():
+    """
+    Validates that matrix scores equal SkillsChecker coverage for every role.
+    """
+    matrix = SkillMatrix.from_texts(TEXTS)
+    checker = SkillsChecker()
+    assert matrix.matrix.dtype == np.uint8
+    assert matrix.matrix.shape == (3, len(matrix.skills))
+
+    for row, (_, text) in enumerate(TEXTS):
+        for entry in checker.rank_roles(ParsedDocument.from_text(text)):
+            score = matrix.scores(role=entry["role"])[row]
+            assert score == pytest.approx(entry["coverage"], abs=1e-4)
+
+    assert matrix.top_k(role="Backend Developer", k=2)[0][0] == "backend"
+    assert matrix.top_k(role="Frontend Developer", k=1)[0][0] == "frontend"
+    ranked = matrix.top_k(weights={"Python": 3, "JavaScript": 1}, k=5)
+    assert ranked == [("backend", 0.75), ("frontend", 0.25), ("empty", 0.0)]
+
+    with pytest.raises(ValueError):
+        matrix.top_k(role="Wizard")
+    with pytest.raises(ValueError):
+        matrix.top_k(weights={"Basket Weaving": 1})
+
+
+def test_matrix_from_batch_output_round_trips(tmp_path: Any):
+    """
+    Validates building the matrix from batch JSONL and saving/loading it.
+    """
+    batch_dir = tmp_path / "resumes"
+    batch_dir.mkdir()
+    shutil.copy(FAKE_PDF, batch_dir / "a.pdf")
+    (batch_dir / "b.txt").write_text(TEXTS[1][1], encoding="utf-8")
+    out = io.StringIO()
+    run_batch(str(batch_dir), out, mode="skills")
+    jsonl = tmp_path / "results.jsonl"
+    jsonl.write_text(out.getvalue(), encoding="utf-8")
+
+    matrix = SkillMatrix.from_batch_output(str(jsonl))
+    expected = SkillMatrix.from_files(sorted(str(p) for p in batch_dir.iterdir()))
+    assert matrix.ids == expected.ids
+    assert (matrix.matrix == expected.matrix).all()
+
+    matrix.save(str(tmp_path / "corpus.npz"))
+    loaded = SkillMatrix.load(str(tmp_path / "corpus.npz"))
+    assert loaded.ids == matrix.ids and (loaded.matrix == matrix.matrix).all()
+    assert json.loads(json.dumps(loaded.top_k(role="Backend Developer")))
+
+    # Records from other modes would silently drop skills, so they are refused.
+    for mode, sub_mode in (("skills", "role"), ("skills", "rank"), ("profile", None)):
+        out = io.StringIO()
+        run_batch(
+            str(batch_dir), out, mode=mode, sub_mode=sub_mode, role="Backend Developer"
+        )
+        jsonl.write_text(out.getvalue(), encoding="utf-8")
+        with pytest.raises(ValueError, match="--mode skills"):
+            SkillMatrix.from_batch_output(str(jsonl))
@@ -0,0 +1,92 @@
+"""Tests for the resume search index, ensuring boolean queries and incremental updates."""
+
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from resume_parser.search_index import (
+    ResumeIndex,
+    decode_postings,
+    document_terms,
+    encode_postings,
+)
+from resume_parser.utils.parsed_document import ParsedDocument
+
+FAKE_PDF = Path(__file__).parent / "data" / "fake_resumes" / "fake_resume.pdf"
+
+INTERN = (
+    "EXPERIENCE\n"
+    "Acme Corp | Software Engineering Intern Jun 2022 - Aug 2022\n"
+    "- Built operators in Golang\n"
+    "SKILLS\n"
+    "K8s, Docker\n"
+)
+RUST = "Rust and Kubernetes, PostgreSQL"
+PYTHON = "Python, Django and Kubernetes"
+
+
+def test_postings_round_trip():
+    """
+    Validates delta/varint encoding, including gaps wider than one byte.
+    """
+    ids = [1, 2, 130, 131, 20_000, 5_000_000]
+    data = encode_postings(ids)
+    assert decode_postings(data) == ids
+    assert len(data) < 4 * len(ids)
+    assert encode_postings([]) == b"" and not decode_postings(b"")
+
+
+def test_boolean_queries(tmp_path: Any):
+    """
+    Validates alias resolution, field terms, phrases and AND/OR/NOT precedence.
+    """
+    with ResumeIndex(str(tmp_path / "corpus.index")) as index:
+        for name, text in (("intern", INTERN), ("rust", RUST), ("python", PYTHON)):
+            index.add(name, document_terms(ParsedDocument.from_text(text)))
+
+        assert index.search("Kubernetes") == ["intern", "rust", "python"]
+        assert index.search("Kubernetes AND (Go OR Rust)") == ["intern", "rust"]
+        assert index.search("Kubernetes AND (Go OR Rust) AND NOT Intern") == ["rust"]
+        assert index.search("NOT Kubernetes") == []
+        assert index.search("Rust OR Python AND NOT Kubernetes") == ["rust"]
+        assert index.search('company:"acme corp" AND title:intern') == ["intern"]
+        assert index.search("Software Engineering") == ["intern"]
+        assert index.search("skill:Postgres") == ["rust"]
+
+        for bad in ("(Python", "Python AND", "Python)", "", "school:hogwarts", "skill:Wizardry"):
+            with pytest.raises(ValueError):
+                index.search(bad)
+
+
+def test_sync_is_incremental_and_persistent(tmp_path: Any):
+    """
+    Validates that sync re-reads only changed files, prunes deleted ones and
+    that the index survives reopening.
+    """
+    corpus = tmp_path / "resumes"
+    corpus.mkdir()
+    shutil.copy(FAKE_PDF, corpus / "a.pdf")
+    (corpus / "b.txt").write_text(RUST, encoding="utf-8")
+    (corpus / "c.txt").write_text(PYTHON, encoding="utf-8")
+    paths = sorted(str(p) for p in corpus.iterdir())
+    path = str(tmp_path / "corpus.index")
+
+    with ResumeIndex(path) as index:
+        assert index.sync(paths) == {"indexed": 3, "unchanged": 0, "failed": 0, "removed": 0}
+        assert index.search("institution:hogwarts AND Machine Learning") == [paths[0]]
+
+    (corpus / "b.txt").write_text(PYTHON, encoding="utf-8")
+    (corpus / "c.txt").unlink()
+    with ResumeIndex(path) as index:
+        assert len(index) == 3
+        counts = index.sync(paths[:2], prune=True)
+        assert counts == {"indexed": 1, "unchanged": 1, "failed": 0, "removed": 1}
+        assert index.search("Rust") == []
+        assert index.search("Python AND Django") == [paths[1]]
+
+    with ResumeIndex(path) as index:
+        assert index.search("Python") == paths[:2]
+        assert index.stats()["documents"] == 2
+        assert not index.postings("skill:Rust")
@@ -0,0 +1,129 @@
+"""Tests for the HTTP parsing service, ensuring each endpoint returns JSON."""
+
+import http.client
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Any, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+import pytest
+
+from resume_parser import server as server_module
+from resume_parser.batch import analyze_document
+from resume_parser.server import ResumeServer
+from resume_parser.utils.parsed_document import ParsedDocument
+
+FAKE_PDF = Path(__file__).parent / "data" / "fake_resumes" / "fake_resume.pdf"
+
+
+@pytest.fixture(name="base_url", scope="module")
+def fixture_base_url() -> Iterator[str]:
+    """
+    Starts a server with one warm worker on a free port.
+    """
+    server = ResumeServer(("127.0.0.1", 0), workers=1, max_body_bytes=1024 * 1024)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def request(url: str, data: Optional[bytes] = None) -> Tuple[int, Any]:
+    """Sends a GET (or POST when `data` is given) and decodes the JSON reply."""
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data=data), timeout=30) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as err:
+        return err.code, json.loads(err.read())
+
+
+def post_headers_only(base_url: str, content_length: str) -> int:
+    """Sends a POST with the given Content-Length header and no body; returns the status."""
+    conn = http.client.HTTPConnection(urlparse(base_url).netloc, timeout=30)
+    try:
+        conn.putrequest("POST", "/profile")
+        conn.putheader("Content-Length", content_length)
+        conn.endheaders()
+        return conn.getresponse().status
+    finally:
+        conn.close()
+
+
+def test_parsing_endpoints(base_url: str):
+    """
+    Validates that profile, general and role endpoints match the library results.
+    """
+    data = FAKE_PDF.read_bytes()
+    document = ParsedDocument.from_file(str(FAKE_PDF))
+
+    status, body = request(f"{base_url}/profile", data)
+    assert status == 200
+    assert body["metadata"]["extension"] == ".pdf"
+    assert body["result"] == json.loads(json.dumps(analyze_document(document, "profile")))
+
+    status, body = request(f"{base_url}/skills?format=pdf", data)
+    assert status == 200
+    assert body["result"]["skills"] == analyze_document(document, "skills")["skills"]
+
+    status, body = request(f"{base_url}/skills/role?role=Backend%20Developer", data)
+    assert status == 200 and body["result"]["role"] == "Backend Developer"
+
+    status, body = request(f"{base_url}/skills/rank", data)
+    assert status == 200
+    assert body["result"]["roles"] == analyze_document(document, "skills", "rank")["roles"]
+
+    status, body = request(f"{base_url}/skills/hits", data)
+    assert status == 200
+    assert body["result"]["hits"] == analyze_document(document, "skills", "hits")["hits"]
+
+
+def test_service_endpoints_and_errors(base_url: str):
+    """
+    Validates health/roles endpoints and error statuses.
+    """
+    assert request(f"{base_url}/health") == (200, {"status": "ok", "workers": 1})
+    status, body = request(f"{base_url}/roles")
+    assert status == 200 and "Backend Developer" in body["roles"]
+
+    assert request(f"{base_url}/skills?format=xyz", b"text")[0] == 400
+    assert request(f"{base_url}/skills/role?role=Wizard", b"text")[0] == 400
+    assert request(f"{base_url}/skills/role", b"text")[0] == 400
+    assert request(f"{base_url}/nothing", b"text")[0] == 404
+
+    # Oversized or malformed lengths are refused from the headers, before
+    # the body is read.
+    assert post_headers_only(base_url, str(2 * 1024 * 1024)) == 413
+    for length in ("abc", "-5", "1_0", "12.5"):
+        assert post_headers_only(base_url, length) == 400
+
+
+def test_dead_worker_is_replaced(monkeypatch: Any):
+    """
+    Validates that an upload killing its worker gets a 503 and that the
+    server keeps answering on a fresh pool.
+    """
+    def crash_on_marker(document, *args, **kwargs):
+        if "CRASH" in document.raw_text:
+            os._exit(1)
+        return analyze_document(document, *args, **kwargs)
+
+    # Patched before the server forks its workers, so they inherit it.
+    monkeypatch.setattr(server_module, "analyze_document", crash_on_marker)
+    server = ResumeServer(("127.0.0.1", 0), workers=1)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        broken = server.pool
+        assert request(f"{base_url}/skills", b"CRASH")[0] == 503
+        assert server.pool is not broken
+        status, body = request(f"{base_url}/skills", b"Python and Docker")
+        assert status == 200 and body["result"]["skills"]
+    finally:
+        server.shutdown()
+        server.server_close()
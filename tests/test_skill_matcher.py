@@ -0,0 +1,82 @@
+"""Tests for SkillMatcher, ensuring one-pass matching honours token boundaries."""
+
+from resume_parser.utils.skill_matcher import SkillMatcher, fold_case
+
+DATASET = {
+    "ALL_TECHNICAL_SKILLS": {
+        "Languages": [
+            {"name": "C", "aliases": ["ANSI C"]},
+            {"name": "C++", "aliases": ["CPP"]},
+            {"name": "C#", "aliases": ["C Sharp"]},
+            {"name": "Java"},
+            {"name": "JavaScript", "aliases": ["JS", "Node.js"]},
+            {"name": "Python"},
+            {"name": "HTML"},
+            {"name": "CSS"},
+        ],
+        "Frameworks": [
+            {"name": "Django"},
+            {"name": "React"},
+            {"name": "Redux"},
+            {"name": ".NET", "aliases": ["dotnet"]},
+            {"name": "ASP.NET"},
+            {"name": "Node", "aliases": ["Node.js"]},
+        ],
+    }
+}
+
+
+def test_symbol_tokens_and_word_boundaries():
+    """
+    Validates that C, C++, C# and .NET are told apart and that aliases only
+    match whole words.
+    """
+    matcher = SkillMatcher(DATASET)
+
+    assert matcher.match("Senior C++ engineer") == {("Languages", "C++")}
+    assert matcher.match("C#/.NET developer") == {("Languages", "C#"), ("Frameworks", ".NET")}
+    assert matcher.match("Embedded C, some ASP.NET") == {
+        ("Languages", "C"), ("Frameworks", "ASP.NET"), ("Frameworks", ".NET"),
+    }
+    assert matcher.match("JavaScript, JSON, Javanese") == {("Languages", "JavaScript")}
+    # One alias can belong to several skills.
+    assert matcher.match("Node.js") == {("Languages", "JavaScript"), ("Frameworks", "Node")}
+
+
+def test_plus_separated_lists():
+    """
+    Validates that "+" between skills separates them unless the longer token
+    ("C++") is itself a known skill.
+    """
+    matcher = SkillMatcher(DATASET)
+
+    assert {name for _, name in matcher.match("HTML+CSS, Python+Django, React+Redux")} == {
+        "HTML", "CSS", "Python", "Django", "React", "Redux",
+    }
+    assert matcher.match("C++/C#") == {("Languages", "C++"), ("Languages", "C#")}
+    assert matcher.match("C+++Java") == {("Languages", "C++"), ("Languages", "Java")}
+    assert matcher.match("C#+Java") == {("Languages", "C#"), ("Languages", "Java")}
+
+
+def test_scan_reports_offsets_of_overlapping_matches():
+    """
+    Validates that a single scan reports every occurrence, including aliases
+    nested inside longer ones.
+    """
+    matcher = SkillMatcher(DATASET)
+    text = "java and javascript; ansi c"
+    hits = [(text[start:end], matcher.patterns[pid]) for start, end, pid in matcher.scan(text)]
+    assert hits == [
+        ("java", "java"), ("javascript", "javascript"), ("ansi c", "ansi c"), ("c", "c"),
+    ]
+
+
+def test_fold_case_keeps_offsets():
+    """
+    Validates that offsets from a scan of folded text index the original text.
+    """
+    matcher = SkillMatcher(DATASET)
+    text = "İstanbul team: JAVA, C++"
+    assert fold_case(text) != text.lower()
+    hits = [text[start:end] for start, end, _ in matcher.scan(fold_case(text))]
+    assert hits == ["JAVA", "C++"]
@@ -2,6 +2,10 @@
 """Tests for SkillsChecker to ensure general skills are correctly extracted."""
 
 from typing import Any
+
+import pytest
+
+from resume_parser.utils.parsed_document import ParsedDocument
 from resume_parser.utils.skills_checker import SkillsChecker
 
 
@@ -25,3 +29,68 @@ def test_general_skills_extraction(fake_resume_path: Any):
     assert any(
         s.lower() == "machine learning" for s in found_skills
     ), "'machine learning' should be detected in found skills"
+
+
+def test_all_roles_in_one_pass(fake_resume_path: Any, monkeypatch: pytest.MonkeyPatch):
+    """
+    Validates that every role's report matches the single-role extraction
+    while the resume is matched only once, and that the ranking is sorted.
+    """
+    checker = SkillsChecker()
+    document = ParsedDocument.from_file(str(fake_resume_path))
+    expected = {role: checker.extract_role_skills(document, role) for role in checker.load_roles()}
+
+    scans = []
+    match = checker.matcher.match
+    monkeypatch.setattr(checker.matcher, "match", lambda text: scans.append(text) or match(text))
+    assert checker.extract_all_roles(document) == expected
+    assert len(scans) == 1
+
+    ranking = checker.rank_roles(document)
+    coverages = [entry["coverage"] for entry in ranking]
+    assert coverages == sorted(coverages, reverse=True)
+    assert sorted(entry["role"] for entry in ranking) == sorted(expected)
+    best = ranking[0]
+    assert 0 < best["coverage"] <= 1
+    assert set(best["found"]) == {
+        skill for result in expected[best["role"]].values() for skill in result["found"]
+    }
+
+
+def test_skill_hits_carry_offsets_aliases_and_sections(fake_resume_path: Any):
+    """
+    Validates hit offsets, counts, aliases and section attribution, and that
+    the hits agree with the general extraction.
+    """
+    checker = SkillsChecker()
+    text = (
+        "Jane Doe\n"
+        "SUMMARY\n"
+        "Python developer building React.js apps\n"
+        "EXPERIENCE\n"
+        "Acme | Engineer 2020 - Present\n"
+        "- Ran python services on K8s and Kubernetes\n"
+        "SKILLS\n"
+        "Python, React\n"
+    )
+    report = checker.extract_skill_hits(ParsedDocument.from_text(text))
+
+    python = report["Python"]
+    assert python["count"] == 3
+    assert python["sections"] == {"summary": 1, "experience": 1, "skills": 1}
+    assert python["categories"] == ["Programming Languages"]
+    for hit in python["hits"]:
+        assert text[hit["start"]:hit["end"]] == hit["text"]
+        assert hit["alias"] == "python"
+
+    # "React" inside "React.js" is one occurrence, reported by the longer alias.
+    assert [hit["text"] for hit in report["React"]["hits"]] == ["React.js", "React"]
+    assert [hit["alias"] for hit in report["Kubernetes"]["hits"]] == ["k8s", "kubernetes"]
+    assert report["Kubernetes"]["sections"] == {"experience": 2}
+
+    document = ParsedDocument.from_file(str(fake_resume_path))
+    found = {
+        skill for result in checker.extract_general_skills(document).values()
+        for skill in result["found"]
+    }
+    assert set(checker.extract_skill_hits(document)) == found
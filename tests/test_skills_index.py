@@ -0,0 +1,78 @@
+"""Tests for the shared skills index, ensuring it is built once per dataset version."""
+
+import json
+import os
+from typing import Any
+
+import pytest
+
+from resume_parser.utils import skills_index
+from resume_parser.utils.skills_checker import SkillsChecker
+from resume_parser.utils.skills_index import (
+    ARTIFACT_SUFFIX,
+    clear_skills_index_cache,
+    get_skills_index,
+)
+
+DATASET = {
+    "ALL_TECHNICAL_SKILLS": {
+        "Languages": [{"name": "Python", "aliases": ["Py"]}, {"name": "Go"}],
+        "Cloud": [{"name": "AWS"}],
+    },
+    "ROLES": {"Backend": ["Languages", "Cloud"], "Scripting": ["Languages"]},
+}
+
+
+def write_dataset(path: Any, data: Any) -> str:
+    """Writes a dataset JSON and returns its path."""
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return str(path)
+
+
+def test_index_is_shared_and_invalidated_on_change(tmp_path: Any):
+    """
+    Validates that checkers share one compiled index, that touching the file
+    keeps it, and that editing the file rebuilds it.
+    """
+    path = write_dataset(tmp_path / "skills.json", DATASET)
+    index = get_skills_index(path)
+    assert SkillsChecker(path).matcher is index.matcher
+    assert index.aliases["py"] == [("Languages", "Python")]
+    assert index.category_roles["Languages"] == ["Backend", "Scripting"]
+    assert index.skill_categories["AWS"] == ["Cloud"]
+
+    os.utime(path, ns=(0, 10**18))
+    assert get_skills_index(path) is index
+
+    edited = dict(DATASET, ROLES={"Cloud Engineer": ["Cloud"]})
+    write_dataset(tmp_path / "skills.json", edited)
+    os.utime(path, ns=(0, 2 * 10**18))
+    assert get_skills_index(path).roles == ["Cloud Engineer"]
+
+    # The bundled dataset backs the default checker and role list.
+    assert SkillsChecker.load_roles() == get_skills_index().roles
+
+
+def test_persisted_artifact_is_reused(tmp_path: Any, monkeypatch: pytest.MonkeyPatch):
+    """
+    Validates that a persisted index is loaded instead of recompiled, and
+    ignored once the dataset changes.
+    """
+    path = write_dataset(tmp_path / "skills.json", DATASET)
+    built = get_skills_index(path, persist=True)
+    assert os.path.exists(path + ARTIFACT_SUFFIX)
+
+    clear_skills_index_cache()
+
+    def no_rebuild(*_: Any) -> None:
+        raise AssertionError("index was recompiled")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(skills_index.SkillsIndex, "__init__", no_rebuild)
+        loaded = get_skills_index(path, persist=True)
+    assert loaded is not built and loaded.digest == built.digest
+    assert loaded.matcher.match("python on aws") == {("Languages", "Python"), ("Cloud", "AWS")}
+
+    write_dataset(tmp_path / "skills.json", dict(DATASET, ROLES={}))
+    os.utime(path, ns=(0, 10**18))
+    assert get_skills_index(path, persist=True).roles == []
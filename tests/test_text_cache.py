@@ -0,0 +1,43 @@
+"""Tests for TextCache, ensuring extracted text is reused and evicted correctly."""
+
+from typing import Any
+
+from resume_parser.utils.file_reader import read_resume, read_resume_pages
+from resume_parser.utils.text_cache import TextCache
+
+
+def test_cache_hit_returns_same_text(fake_resume_path: Any, tmp_path: Any):
+    """
+    Validates that a second read of the same file is served from the cache
+    and yields identical text.
+    """
+    with TextCache(str(tmp_path)) as cache:
+        first = read_resume(str(fake_resume_path), cache=cache)
+        second = read_resume(str(fake_resume_path), cache=cache)
+        stats = cache.stats()
+
+    assert first == second == read_resume(str(fake_resume_path))
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert stats["entries"] == 1
+
+    # A fresh instance sees the persisted entry
+    with TextCache(str(tmp_path)) as cache:
+        assert read_resume_pages(str(fake_resume_path), cache=cache)
+        assert cache.stats()["hits"] == 1
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Any):
+    """
+    Validates that entries are evicted oldest-access-first once the size cap is exceeded.
+    """
+    with TextCache(str(tmp_path), max_bytes=100) as cache:
+        cache.put("a", ["x" * 30])
+        cache.put("b", ["y" * 30])
+        assert cache.get("a") is not None  # "a" is now more recent than "b"
+        cache.put("c", ["z" * 30])
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats()["evictions"] == 1
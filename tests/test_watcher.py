@@ -0,0 +1,86 @@
+"""Tests for watch-folder mode, ensuring only settled files are parsed, once."""
+
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from resume_parser import batch
+from resume_parser.batch import analyze_document
+from resume_parser.watcher import FolderWatcher
+
+FAKE_PDF = Path(__file__).parent / "data" / "fake_resumes" / "fake_resume.pdf"
+
+
+def poll_until_idle(watcher: FolderWatcher, polls: int = 50) -> List[Dict[str, Any]]:
+    """Polls until nothing is in flight and returns every record written."""
+    written = watcher.poll()
+    for _ in range(polls):
+        time.sleep(0.05)
+        written += watcher.poll()
+        if not watcher._pending:  # pylint: disable=protected-access
+            break
+    return written
+
+
+def test_watcher_parses_settled_files_once(tmp_path: Any):
+    """
+    Validates that a file is parsed after it stops changing, results land in the
+    output directory, and unchanged files are not parsed again after a restart.
+    """
+    inbox = tmp_path / "inbox"
+    (inbox / "team").mkdir(parents=True)
+    out = tmp_path / "parsed"
+    partial = inbox / "team" / "resume.pdf"
+    partial.write_bytes(FAKE_PDF.read_bytes()[:100])
+    (inbox / "~$draft.docx").write_bytes(b"lock file")
+
+    with FolderWatcher(str(inbox), str(out), mode="skills") as watcher:
+        assert not watcher.poll()  # first sighting: not yet known to be stable
+        shutil.copy(FAKE_PDF, partial)  # the copy "finishes"
+        assert not watcher.poll()  # changed since the last poll
+
+        [record] = poll_until_idle(watcher)
+        assert record["ok"] and record["file"] == str(partial)
+        result = json.loads((out / "team" / "resume.pdf.json").read_text(encoding="utf-8"))
+        assert result["result"] == record["result"]
+        assert not poll_until_idle(watcher)
+
+    with FolderWatcher(str(inbox), str(out), mode="skills") as watcher:
+        assert not poll_until_idle(watcher)
+        assert not list(out.glob("*draft*"))
+
+
+def test_dead_worker_fails_only_its_file(tmp_path: Any, monkeypatch: Any):
+    """
+    Validates that a file killing its worker gets an error record, the pool is
+    replaced, other files are still parsed, and removed files are forgotten.
+    """
+    def crash_on_marker(document, *args, **kwargs):
+        if "CRASH" in document.raw_text:
+            os._exit(1)
+        return analyze_document(document, *args, **kwargs)
+
+    # Patched before the watcher forks its workers, so they inherit it.
+    monkeypatch.setattr(batch, "analyze_document", crash_on_marker)
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    for name, text in (("a", "Python"), ("b", "Docker"), ("crash", "CRASH")):
+        (inbox / f"{name}.txt").write_text(text, encoding="utf-8")
+
+    with FolderWatcher(str(inbox), mode="skills", workers=2) as watcher:
+        records: Dict[str, Dict[str, Any]] = {}
+        for _ in range(100):
+            records.update((Path(r["file"]).name, r) for r in watcher.poll())
+            if len(records) == 3:
+                break
+            time.sleep(0.05)
+        assert records["a.txt"]["ok"] and records["b.txt"]["ok"]
+        assert records["crash.txt"]["error"].startswith("BrokenProcessPool")
+
+        (inbox / "a.txt").unlink()
+        watcher.poll()
+        done = watcher._done  # pylint: disable=protected-access
+        assert set(done) == {str(inbox / "b.txt"), str(inbox / "crash.txt")}